@@ -3,44 +3,35 @@ import warnings
 import folium.map
 warnings.filterwarnings("ignore")
 
-import os
 import numpy as np
 import pandas as pd
 import matplotlib as mpl
-import geopandas as gpd
 import seaborn as sns
 import folium
-import plotly.graph_objs as go
 import plotly.io as pio
 import plotly.express as px
 import streamlit as st
 import matplotlib.colors as mcolors
 
-from shapely.geometry import Point
 from matplotlib import pyplot as plt
-from folium import GeoJson
-from folium.features import GeoJsonPopup, GeoJsonTooltip, DivIcon
+from folium.features import DivIcon
 from folium.plugins import HeatMap, HeatMapWithTime, MarkerCluster, FeatureGroupSubGroup
-from unidecode import unidecode
-from sklearn.preprocessing import StandardScaler, MinMaxScaler
+from sklearn.preprocessing import StandardScaler
 from streamlit_folium import st_folium, folium_static
 from branca.colormap import linear
 from branca import colormap
 from branca import colormap as cm
 
-# ================ PARÂMETROS ================
-
-ENV = 'PRD' # DEV / PRD
+from matr import CRIME_SIMBOLOGIA, CRIME_SIMBOLO_PADRAO, MapUtils, ChartUtils, Utils, Fontes, Painel
 
-# Paths
-BASE_PATH = '/mnt/d/PESSOAL/240319-RS-MATR/source' if (ENV == 'DEV') else '/mount/src/matr/'
-DATA_PATH = f'{BASE_PATH}/data'
+# ================ PARÂMETROS ================
 
 NRO_CLASSES = 10
 
 # Configurações de Mapa
 USE_MAP = False
 INITIAL_COORDS = [-51.1794, -29.1678] # Caxias do Sul
+INITIAL_ZOOM = 12
 BASEMAPS = [
     'Esri.WorldStreetMap',        # 0 
     'Esri.WorldTopoMap',          # 1
@@ -121,690 +112,19 @@ make_map_responsive = """
     """
 st.markdown(make_map_responsive, unsafe_allow_html=True)
 
-# ================ CLASSES DE NEGÓCIO ================
-
-class DataLoader:
-    @staticmethod
-    @st.cache_data
-    def loadCSV(folderPath, fileName, separator=','):
-        """
-        Carrega dados de um arquivo CSV em um DataFrame pandas.
-        
-        Parâmetros:
-        - folderPath (str): Caminho para a pasta onde o arquivo CSV está localizado.
-        - fileName (str): Nome do arquivo CSV.
-        
-        Retorna:
-        - DataFrame: Dados carregados do CSV.
-        """
-        filePath = os.path.join(folderPath, f'{fileName}.csv')
-
-        try:
-            if os.path.exists(filePath):
-                df = pd.read_csv(filePath, sep=separator)
-                return df
-            else:
-                raise FileNotFoundError(f"Arquivo {fileName} não encontrado na pasta {folderPath}.")
-        except Exception as e:
-            print(f"Erro ao carregar o arquivo CSV: {e}")
-            return None
-
-    @staticmethod
-    @st.cache_data
-    def loadXLSX(folderPath, fileName, sheetIndex=0):
-        """
-        Carrega dados de um arquivo XLSX em um DataFrame pandas.
-        
-        Parâmetros:
-        - folderPath (str): Caminho para a pasta onde o arquivo XLSX está localizado.
-        - fileName (str): Nome do arquivo XLSX.
-        - sheetIndex (int, opcional): Índice da planilha a ser carregada. Padrão (0).
-        
-        Retorna:
-        - DataFrame: Dados carregados do XLSX.
-        """
-        filePath = os.path.join(folderPath, f'{fileName}.xlsx')
-        
-        try:
-            if os.path.exists(filePath):
-                df = pd.read_excel(filePath)
-                return df
-            else:
-                raise FileNotFoundError(f"Arquivo {fileName} não encontrado na pasta {folderPath}.")
-        except Exception as e:
-            print(f"Erro ao carregar o arquivo XLSX: {e}")
-            return None
-
-    @staticmethod
-    @st.cache_data
-    def loadSHP(folderPath, shpName):
-        """
-        Carrega o shapefile dos limites dos bairros em um GeoDataFrame.
-        
-        Parâmetros:
-        - folderPath (str): Caminho para a pasta onde o arquivo XLSX está localizado.
-        - shpName (str): Nome do arquivo shapefile.
-        
-        Retorna:
-        - GeoDataFrame: Dados geoespaciais dos bairros.
-        """
-        filePath = os.path.join(folderPath, f'{shpName}.shp')
-        
-        try:
-            if os.path.exists(filePath):
-                gdf = gpd.read_file(filePath)
-                return gdf
-            else:
-                raise FileNotFoundError(f"Arquivo {filePath} não encontrado.")
-        except Exception as e:
-            print(f"Erro ao carregar o shapefile: {e}")
-            return None
-
-class MapUtils:
-    @staticmethod
-    def createMap(
-        initialCoords=[-46.633308,-23.55052], 
-        zoomStart=12, 
-        basemap='OpenStreetMap.Mapnik',
-        controlScale=True, 
-        zoomControl=True, 
-        scrollWheelZoom=True, 
-        dragging=True):
-        """
-        Cria um mapa folium com os dados de um GeoDataFrame.
-        
-        Parâmetros:
-        - initialCoords (list): Coordenadas iniciais [latitude, longitude] para centrar o mapa.
-        - zoomStart (int): Nível inicial de zoom do mapa.
-        - controlScale (boolean): Controla o nível de escala no mapa.
-        - zoomControl (boolean): Controles de zoom no mapa.
-        - scrollWheelZoom (boolean): Controla de rolagem no mouse.
-        - dragging (boolean): Controla de movimentação no mapa.
-        
-        Retorna:
-        - folium.Map: Mapa folium com os dados do GeoDataFrame.
-        """
-        # Criar um mapa folium centrado nas coordenadas iniciais
-        attr = (
-            '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> '
-            'contributors, &copy; <a href="https://cartodb.com/attributions">CartoDB</a>'
-        )
-        fmap = folium.Map(
-            location=initialCoords[::-1], 
-            zoom_start=zoomStart, 
-            tiles=basemap,
-            control_scale=controlScale, 
-            zoom_control=zoomControl, 
-            scrollWheelZoom=scrollWheelZoom, 
-            dragging=dragging)
-        
-        return fmap
-
-    @staticmethod
-    def addLayer(
-        geoDF, 
-        layerName=None,
-        styleConfig=None, 
-        popupField=None, 
-        tooltipField=None):
-        """
-        Adiciona uma camada de GeoDataFrame ao mapa folium com a simbologia especificada.
-        
-        Parâmetros:
-        - geoDF (GeoDataFrame): GeoDataFrame com os dados geoespaciais.
-        - layerName (str): Nome da camada.
-        - styleConfig (dict): Configuração de estilo para a camada.
-        - popupField (str): Nome da coluna para exibir em popups (opcional).
-        - tooltipField (str): Nome da coluna para exibir em tooltips (opcional).
-        
-        Retorna:
-        - folium.Map: Objeto de mapa folium com a nova camada adicionada.
-        """
-        # Configuração padrão de estilo
-        defaultStyle = {
-            'fillColor': 'blue',
-            'color': 'blue',
-            'weight': 2,
-            'fillOpacity': 0.6
-        }
-        
-        # Atualizar configuração de estilo com a fornecida pelo usuário
-        if styleConfig:
-            defaultStyle.update(styleConfig)
-        
-        # Converter GeoDataFrame para GeoJSON
-        geojson_data = geoDF.to_json()
-        
-        # Adicionar camada GeoJSON ao mapa
-        geojson_layer = GeoJson(
-            geojson_data,
-            style_function=lambda feature: defaultStyle
-        )
-        
-        # Adicionar popup se especificado
-        if popupField:
-            popup = GeoJsonPopup(fields=[popupField])
-            geojson_layer.add_child(popup)
-        
-        # Adicionar tooltip se especificado
-        if tooltipField:
-            tooltip = GeoJsonTooltip(fields=[tooltipField])
-            geojson_layer.add_child(tooltip)
-        
-        geojson_layer.layer_name = layerName
-        
-        return geojson_layer
-
-    @staticmethod
-    def removeLayer(fmap, layerName):
-        """
-        Remove uma camada do mapa folium com base no nome da camada.
-        
-        Parâmetros:
-        - fmap (folium.Map): Objeto de mapa folium.
-        - layerName (str): Nome da camada a ser removida.
-        
-        Retorna:
-        - folium.Map: Objeto de mapa folium com a camada removida.
-        """
-        layers_to_remove = [layer for layer in fmap._children if layer == layerName]
-        for layer in layers_to_remove:
-            del fmap._children[layer]
-        return fmap
-    
-    @staticmethod
-    def hasLayer(fmap, layerName):
-        """
-        Remove uma camada do mapa folium com base no nome da camada.
-        
-        Parâmetros:
-        - fmap (folium.Map): Objeto de mapa folium.
-        - layerName (str): Nome da camada a ser removida.
-        
-        Retorna:
-        - folium.Map: Objeto de mapa folium com a camada removida.
-        """
-        foundedLayers = [layer for layer in fmap._children if layer.find(layerName) >= 0]
-        return True if len(foundedLayers) > 0 else False
-    
-    @staticmethod
-    def setZoomLevel(fmap, zoomLevel):
-        """
-        Ajusta o nível de zoom do mapa folium.
-        
-        Parâmetros:
-        - fmap (folium.Map): Objeto de mapa folium.
-        - zoom_level (int): Nível de zoom desejado.
-        
-        Retorna:
-        - folium.Map: Objeto de mapa folium com o nível de zoom ajustado.
-        """
-        fmap.options['zoom'] = zoomLevel
-        return fmap
-
-    @staticmethod
-    def createSpatialJoin(referenceDF, targetDF, spatialRelation='intersects'):
-        """
-        Atribui bairros aos registros do DataFrame baseado em latitudes e longitudes.
-        
-        Parâmetros:
-        - referenceDF (DataFrame): DataFrame com as colunas 'LATITUDE' e 'LONGITUDE'.
-        - targetDF (GeoDataFrame): GeoDataFrame dos limites dos bairros.
-        
-        Retorna:
-        - DataFrame: DataFrame original com uma nova coluna 'BAIRRO' indicando o bairro de cada registro.
-        """
-        # Realizar a junção espacial
-        joinDF = gpd.sjoin(targetDF, referenceDF, how="left", predicate=spatialRelation)
-        joinDF.drop(columns=['index_right'], inplace=True)
-        joinDF.reset_index(drop=True, inplace=True)
-        return joinDF
-
-class ChartUtils:
-    @staticmethod
-    def createGauge(title, value=50, min=0, max=100, 
-                    chartColor="orange", shadownColor="yellow", theme='light'):
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=value,
-            gauge={
-                'axis': {'range': [min, max]},
-                'bar': {'color': chartColor},
-                'steps': [
-                    {'range': [min, value], 'color': shadownColor},
-                    {'range': [value, max], 'color': "lightgray"}
-                ]
-            }
-        ))
-        
-        if (theme=='dark'):
-            fig.update_layout(
-                height=300,
-                paper_bgcolor="black",
-                plot_bgcolor="black",
-                template="plotly_dark",
-                # title_font_family='Arial',
-                title_text=title,
-                title_font_size=20,
-                title_font_weight='bold',
-                title_xanchor='center',
-                title_yanchor='top',
-                title_x=0.5,
-                title_y=0.9,
-            )
-        else:
-            fig.update_layout(
-                height=300,
-                # paper_bgcolor="#FFFFFF",
-                # plot_bgcolor="#FFFFFF",
-                template="plotly_white",
-                # title_font_family='Arial',
-                title_text=title,
-                title_font_size=20,
-                title_font_weight='bold',
-                title_xanchor='center',
-                title_yanchor='top',
-                title_x=0.5,
-                title_y=0.9,
-            )
-        
-        return fig
-
-    @staticmethod
-    def getGaugeIndicatorColors(currentValue, cutoff25, cutoff75):
-        # Determinando as Cores dos Gráficos
-        colorGreen  = {"title":"Normal",  "color": "#4FBA74", "shadown": "#3FA261"}
-        colorOrange = {"title":"Atenção", "color": "#FCAB10", "shadown": "#F29E02"}
-        colorRed    = {"title":"Alerta",  "color": "#F6131E", "shadown": "#D90812"}
-
-        chartColor   = colorOrange["color"]
-        chartShadown = colorOrange["shadown"]
-        if currentValue < cutoff25:
-            chartColor   = colorGreen["color"]
-            chartShadown = colorGreen["shadown"]
-        elif currentValue > cutoff75:
-            chartColor   = colorRed["color"]
-            chartShadown = colorRed["shadown"]
-            
-        return chartColor, chartShadown
-    
-    @staticmethod
-    def createRadar(title,
-                    dataframe, 
-                    fieldClasses, 
-                    colors=px.colors.sequential.Turbo, 
-                    theme='light'):
-        if (dataframe.empty == False):
-            plotDF = pd.melt(dataframe, id_vars=fieldClasses, var_name='theta', value_name='r')
-        else:
-            plotDF = pd.DataFrame({
-                f'{fieldClasses}': ['','','','','',''],
-                'theta': ['Temperatura', 'Umidade', 'Luminosidade', 'Ruído', 'CO₂', 'ETVOC'],
-                'r': [0, 0, 0, 0, 0, 0],
-                'label': [0, 0, 0, 0, 0, 0]
-            })
-        
-        plotDF.rename(
-            columns={
-                f'{fieldClasses}': f'{fieldClasses.title()}',
-                'theta': 'Categoria',
-                'r': 'Valor'
-            },
-            inplace=True
-        )
-        
-        # fig = go.Figure()
-        # fig.add_trace(
-        #     go.Scatterpolar(
-        #         r = dataframe['r'],
-        #         theta = dataframe['theta'],
-        #         mode = 'lines'
-        #     )
-        # )
-        
-        fig = px.line_polar(
-            plotDF,
-            r='Valor',
-            theta='Categoria',
-            title=title,
-            color=f'{fieldClasses.title()}',
-            line_close=True,
-            color_discrete_sequence=colors,
-            markers=True
-        )
-        
-        fig.update_traces(line={'width': 3},fill='toself')
-        
-        if (theme=='dark'):
-            fig.update_layout(
-                height=800,
-                paper_bgcolor="black",
-                plot_bgcolor="black",
-                template="plotly_dark",
-                # title_font_family='Arial',
-                title_font_size=20,
-                title_font_weight='bold',
-                title_xanchor='center',
-                title_yanchor='top',
-                title_x=0.5,
-                title_y=0.95,
-                # showlegend=False,
-                legend_title='LEGENDA',
-                legend_orientation='h',
-            ) 
-        else:
-            fig.update_layout(
-                height=800,
-                paper_bgcolor="white",
-                plot_bgcolor="white",
-                template="plotly_white",
-                # title_font_family='Arial',
-                title_font_size=20,
-                title_font_weight='bold',
-                title_xanchor='center',
-                title_yanchor='top',
-                title_x=0.5,
-                title_y=0.95,
-                # showlegend=False,
-                # legend_title='LEGENDA',
-                legend_orientation='h',
-                
-                polar_angularaxis_color='#000',
-                polar_angularaxis_gridcolor='#FFF',
-                polar_angularaxis_gridwidth=3,
-                polar_angularaxis_griddash='solid',
-                polar_angularaxis_linecolor='#AAA',
-                polar_angularaxis_linewidth=1,
-                polar_angularaxis_tickcolor='#AAA',
-                
-                polar_radialaxis_color='#000',
-                polar_radialaxis_gridcolor='#FFF',
-                polar_radialaxis_gridwidth=3,
-                polar_radialaxis_griddash='dot',
-                polar_radialaxis_linecolor='#FFF',
-                
-                polar_bgcolor='#F0F0F0',
-            )
-        
-        return fig
-
-class Utils:
-  DAY_NAME_MAP = {
-    'Monday': 'SEG',
-    'Tuesday': 'TER',
-    'Wednesday': 'QUA',
-    'Thursday': 'QUI',
-    'Friday': 'SEX',
-    'Saturday': 'SAB',
-    'Sunday': 'DOM'
-  }
-  
-  @staticmethod
-  def checkDayPeriod(hora):
-    if 5 <= hora < 12: return 'Manhã'
-    elif 12 <= hora < 18: return 'Tarde'
-    else: return 'Noite'
-
-  @staticmethod
-  def classifyCrime(row):
-    if row['Tipo Fato'] == 'Tentado' and 'HOMICIDIO' in row['Desc Fato']:
-        return 'Tentativa de Homicídio'
-    elif row['Tipo Fato'] == 'Tentado' and 'ROUBO' in row['Desc Fato']:
-        return 'Tentativa de Roubo'
-    elif row['Tipo Fato'] == 'Consumado' and 'HOMICIDIO' in row['Desc Fato']:
-        return 'Homicídio'
-    elif row['Tipo Fato'] == 'Consumado' and 'ROUBO' in row['Desc Fato']:
-        return 'Roubo'
-    else:
-        return 'Outros'
-    
 # ================ MAIN ================
 
-# Carregar dados de Bairros
-DF_BAIRROS_PLG = DataLoader.loadSHP(DATA_PATH, 'RS_CAXIASDOSUL_BAIRROS')
-DF_BAIRROS_PLG.drop(
-    columns=['numerolei', 'link_doc_b', 'observacoe',
-             'OBJECTID', 'bairro', 'FREQUENCY', 
-             'MIN_temper', 'MAX_temper', 'MEAN_tempe', 
-             'MIN_umidad', 'MAX_umidad', 'MEAN_umida', 
-             'MIN_lumino', 'MAX_lumino', 'MEAN_lumin',
-             'MIN_ruido', 'MAX_ruido', 'MEAN_ruido', 
-             'MIN_eco2', 'MAX_eco2', 'MEAN_eco2', 
-             'MIN_etvoc', 'MAX_etvoc', 'MEAN_etvoc', 
-             'Shape_Leng', 'Shape_Area'], 
-    axis='columns', 
-    inplace=True
-)
-# DF_BAIRROS_PLG.rename(columns={'nome': 'BAIRRO'}, inplace=True)
-
-DF_BAIRROS_PTN = DataLoader.loadSHP(DATA_PATH, 'RS_CAXIASDOSUL_PTN_Bairros')
-# DF_BAIRROS_PTN.rename(columns={'nome': 'BAIRRO'}, inplace=True)
-
-# Reprojetando camada de bairros
-DF_BAIRROS_PLG = DF_BAIRROS_PLG.to_crs(crs="EPSG:4326")
-
-# Carregar dados de Setores Censitários
-DF_SETORES_GEO = DataLoader.loadSHP(DATA_PATH, 'RS_Malha_Preliminar_2022')
-DF_SETORES_GEO = DF_SETORES_GEO[DF_SETORES_GEO['NM_MUN'] == 'Caxias do Sul']
-
-# Reprojetando camada de setores censitários
-DF_SETORES_GEO = DF_SETORES_GEO.to_crs(crs="EPSG:4326")
-
-# Carregando tabelas de apoio do CENSO
-DF_CENSO_RENDA = DataLoader.loadCSV(f'{DATA_PATH}/CENSO_2010', 'DomicilioRenda_RS', ';')
-DF_CENSO_RENDA = DF_CENSO_RENDA[['Cod_setor','V002']]
-DF_CENSO_RENDA.rename(columns={'V002':'v0008'}, inplace=True)
-DF_CENSO_RENDA = DF_CENSO_RENDA[DF_CENSO_RENDA['v0008'] != 'X']
-DF_CENSO_RENDA['v0008'] = DF_CENSO_RENDA[['v0008']].astype(int)
-
-DF_CENSO_PES01 = DataLoader.loadCSV(f'{DATA_PATH}/CENSO_2010', 'Pessoa01_RS', ';')
-DF_CENSO_PES01 = DF_CENSO_PES01[['Cod_setor','V001']]
-DF_CENSO_PES01.rename(columns={'V001':'v0009'}, inplace=True)
-DF_CENSO_PES01['v0009'] = DF_CENSO_PES01[['v0009']].astype(int)
-
-# DF_CENSO_PES02 = DataLoader.loadCSV(f'{DATA_PATH}/CENSO_2010', 'Pessoa02_RS', ';')
-
-DF_SETORES_RENDA = pd.concat([DF_SETORES_GEO, DF_CENSO_RENDA], axis=1, join='inner')
-DF_SETORES_RENDA.drop(columns=['Cod_setor'], inplace=True)
-
-DF_SETORES = pd.concat([DF_SETORES_RENDA, DF_CENSO_PES01], axis=1, join='inner')
-DF_SETORES.drop(columns=['Cod_setor'], inplace=True)
-
-# Carregar dados de Monitoramento
-DF_AMV_01 = DataLoader.loadCSV(DATA_PATH, 'AMV_01', '|')
-DF_AMV_02 = DataLoader.loadCSV(DATA_PATH, 'AMV_02', '|')
-
-# Unificando dataframes de monitoramento
-DF_AMV = pd.concat([DF_AMV_01, DF_AMV_02])
-
-# Removendo campos desnecessários
-DF_AMV.drop('device', axis='columns', inplace=True)
-
-# Removendo Latitude e Longitude zero
-DF_AMV = DF_AMV[(DF_AMV['latitude'] != 0) & (DF_AMV['longitude'] != 0)]
-
-# Geoespacializando pontos de monitoramento
-geometry = [Point(xy) for xy in zip(DF_AMV['longitude'], DF_AMV['latitude'])]
-DF_AMV = gpd.GeoDataFrame(DF_AMV, geometry=geometry, crs="EPSG:4326")
-
-# Carregar dados de Segurança Pública
-# DF_SEGURANCA = DataLoader.loadXLSX(DATA_PATH, 'SEGURANCA_PUBLICA')
-
-DF_SEGURANCA = DataLoader.loadSHP(DATA_PATH, 'RS_CAXIASDOSUL_PTN_SEG_PUB')
-DF_SEGURANCA.rename(
-    columns={
-        'SP_Data_Fa': 'Data Fato',
-        'SP_Dia_Sem': 'Data Fato',
-        'SP_Dia_Sem': 'Dia Semana Fato', 
-        'SP_Hora_Fa': 'Hora Fato', 
-        'SP_Desc_Fa': 'Desc Fato', 
-        'SP_Tipo_Fa': 'Tipo Fato',
-        'SP_Flagran': 'Flagrante',
-        'SP_Enderec': 'Endereco', 
-        'SP_Nro_End': 'Nro Endereco', 
-        'SP_Tipo_Lo': 'Tipo Local', 
-        'SP_Bairro': 'Bairro',
-        'SP_Municip': 'Municipio'
-    },
-    inplace=True
-)
-DF_SEGURANCA.drop(
-    columns=['Status', 'Score', 'SP_DAY', 'SP_MONTH', 'SP_YEAR', 'SP_HOUR', 'SP_MIN', 
-             'SP_PERIOD', 'SP_WEEKDAY', 'SP_CLASS'], inplace=True)
-
-DF_SEGURANCA['Data Fato'] = pd.to_numeric(DF_SEGURANCA['Data Fato'], errors='coerce')
-DF_SEGURANCA = DF_SEGURANCA.dropna(subset=['Data Fato'])
-DF_SEGURANCA['Data Fato'] = pd.to_datetime(DF_SEGURANCA['Data Fato'], origin='1899-12-30', unit='D')
-DF_SEGURANCA = DF_SEGURANCA.to_crs(crs="EPSG:4326")
-
-DF_SEGURANCA = gpd.GeoDataFrame(DF_SEGURANCA, geometry='geometry')
-DF_SEGURANCA['LON'] = DF_SEGURANCA.geometry.x
-DF_SEGURANCA['LAT'] = DF_SEGURANCA.geometry.y
-
-# Carregar dados de Satisfação da População
-DF_SATISFACAO = DataLoader.loadXLSX(DATA_PATH, 'SATISFACAO')
-
-# Carregar dados de Agregado Setor 2022
-DF_CENSO_2022 = DataLoader.loadCSV(DATA_PATH, 'AGREGADO_SETOR_RS',';')
-DF_CENSO_2022 = DF_CENSO_2022[DF_CENSO_2022['NM_MUN'] == 'Caxias do Sul']
-
-# MONITORAMENTO AMBIENTAL ← BAIRROS
-DF_AMV_BAIRRO = MapUtils.createSpatialJoin(
-  referenceDF=DF_BAIRROS_PLG[['geometry','nome']],
-  targetDF=DF_AMV)
-DF_AMV_BAIRRO.rename(columns={'nome':'bairro'}, inplace=True)
-
-# SETOR CENSITÁRIO ← BAIRROS
-DF_SETORES_BAIRROS = MapUtils.createSpatialJoin(
-  referenceDF=DF_BAIRROS_PLG[['geometry','nome']],
-  targetDF=DF_SETORES)
-DF_SETORES_BAIRROS.rename(columns={'nome':'bairro'}, inplace=True)
-
-# Padronizando valores da coluna de Bairro
-DF_AMV_BAIRRO['bairro'] = DF_AMV_BAIRRO['bairro'].apply(lambda x: unidecode(str(x)).upper())
-
-# Removendo registros de bairro nulos
-DF_AMV_BAIRRO = DF_AMV_BAIRRO.dropna(subset=['bairro'])
-
-# Renomeando coluna de BAIRRO utilizada para busca
-DF_AMV_BAIRRO.rename(columns={'bairro': 'BAIRRO'}, inplace=True)
-
-# Eliinnado valores inválidos
-DF_AMV_BAIRRO = DF_AMV_BAIRRO[DF_AMV_BAIRRO['BAIRRO'] != 'NAN']
-
-# Determinar formato do campo data
-DF_AMV_BAIRRO['data'] = pd.to_datetime(DF_AMV_BAIRRO['data'])
-DF_AMV_BAIRRO['day_name'] = DF_AMV_BAIRRO['data'].dt.day_name()
-
-# Criar campos de período, data, hora e dia da semana
-DF_AMV_BAIRRO['F_PERIODO'] = DF_AMV_BAIRRO['data'].dt.hour.apply(Utils.checkDayPeriod)
-DF_AMV_BAIRRO['F_HORA'] = DF_AMV_BAIRRO['data'].dt.strftime('%H').astype(int)
-DF_AMV_BAIRRO['F_MINUTO'] = DF_AMV_BAIRRO['data'].dt.strftime('%M').astype(int)
-DF_AMV_BAIRRO['F_DIA'] = DF_AMV_BAIRRO['data'].dt.strftime('%d').astype(int)
-DF_AMV_BAIRRO['F_MES'] = DF_AMV_BAIRRO['data'].dt.strftime('%m').astype(int)
-DF_AMV_BAIRRO['F_ANO'] = DF_AMV_BAIRRO['data'].dt.strftime('%Y').astype(int)
-DF_AMV_BAIRRO['F_DIA_SEMANA'] = DF_AMV_BAIRRO['day_name'].map(Utils.DAY_NAME_MAP)
-
-# Apagar campos de processamento temporários
-DF_AMV_BAIRRO.drop(columns=['day_name'], inplace=True)
-
-# Padronizando valores das colunas Bairro e Município
-DF_SEGURANCA['Bairro'] = DF_SEGURANCA['Bairro'].apply(lambda x: unidecode(str(x)).upper())
-DF_SEGURANCA['Municipio'] = DF_SEGURANCA['Municipio'].apply(lambda x: unidecode(str(x)).upper())
-
-# Determinar formato do campo data
-# DF_SEGURANCA['datafato'] = pd.to_datetime(DF_SEGURANCA['Data Fato'], origin='1899-12-30', unit='D')
-DF_SEGURANCA['datafato'] = DF_SEGURANCA['Data Fato'].dt.strftime('%Y-%m-%d')
-DF_SEGURANCA['horafato'] = DF_SEGURANCA['Hora Fato'].astype(str)
-
-DF_SEGURANCA['data'] = pd.to_datetime(DF_SEGURANCA['datafato'] + ' ' + DF_SEGURANCA['horafato'])
-DF_SEGURANCA['day_name'] = DF_SEGURANCA['data'].dt.day_name()
-
-# Criar campos de período, data, e hora
-DF_SEGURANCA['F_PERIODO'] = DF_AMV_BAIRRO['data'].dt.hour.apply(Utils.checkDayPeriod)
-DF_SEGURANCA['F_HORA'] = DF_AMV_BAIRRO['data'].dt.strftime('%H').astype(int)
-DF_SEGURANCA['F_MINUTO'] = DF_SEGURANCA['data'].dt.strftime('%M').astype(int)
-DF_SEGURANCA['F_DIA'] = DF_SEGURANCA['data'].dt.strftime('%d').astype(int)
-DF_SEGURANCA['F_MES'] = DF_SEGURANCA['data'].dt.strftime('%m').astype(int)
-DF_SEGURANCA['F_ANO'] = DF_SEGURANCA['data'].dt.strftime('%Y').astype(int)
-DF_SEGURANCA['F_DIA_SEMANA'] = DF_SEGURANCA['day_name'].map(Utils.DAY_NAME_MAP)
-
-# Criar campo de classificação do crime
-DF_SEGURANCA['F_CLASSIFICACAO'] = DF_SEGURANCA.apply(Utils.classifyCrime, axis=1)
-
-# Apagar campos de processamento temporários
-DF_SEGURANCA.drop(columns=['day_name','datafato','horafato'], inplace=True)
-
-# Renomeando colunas de ligação
-DF_SEGURANCA.rename(
-  columns={
-    "Municipio": "MUNICIPIO",
-    "Bairro": "BAIRRO",
-  }, 
-  inplace=True
-)
-
-DF_SEGURANCA.reset_index(drop=True, inplace=True)
-
-# Padronizando valores das colunas Bairro
-DF_SATISFACAO['BAIRRO'] = DF_SATISFACAO['BAIRRO'].apply(lambda x: unidecode(str(x)).upper())
-
-# Renomeando colunas de análise
-DF_SATISFACAO.rename(
-  columns={
-    'Qtd respostas': 'QTD_RESP',
-    'Satisfação com o bairro': 'Sat_Bairro',
-    'Satisfação com a Saúde': 'Sat_Saúde',
-    'Prática de atividade física': 'Pratica_Atividade',
-    'Satisfação financeira': 'Sat_Financeira',
-    'Satisfação com atividade comercial': 'Sat_atv_comercial',
-    'Satisfação com qualidade do ar': 'Sat_Qual_Ar',
-    'Satisfação com ruído': 'Sat_Ruído',
-    'Satisfação com espaços de lazer': 'Sat_Lazer',
-    'Satistação com coleta de lixo': 'Sat_col_Lixo',
-    'Satisfação com distância da parada de ônibus': 'Sat_dist_bus_stop',
-    'Satisfação com qualidade das paradas de ônibus': 'Sat_qual_bus_stop',
-    'Satisfação com acesso aos locais importantes da cidade': 'Sat_Acesso',
-    'Sentimento de segurança': 'Sent_Segurança',
-    'Sentimento de confiança nas pessoas': 'Sent_Conf_Pessoas',
-    'Satisfação com tratamento de esgoto': 'Sat_Trat_Esgoto'
-  },
-  inplace=True
-)
-
-# Setores Censitários
-DF_SETORES_BAIRROS.rename(
-    columns={
-        'bairro': 'BAIRRO',
-        'v0001': 'Tot_Pessoas',
-        'v0002': 'Tot_Domicílios',
-        'v0003': 'Tot_Domicílios_pvt',
-        'v0004': 'Tot_Domicílios_col',
-        'v0005': 'Med_pess_dom_pvt_ocup',
-        'v0006': 'Perc_Dom_pvt_ocup',
-        'v0007': 'Tot_Dom_pvt_ocup',
-        'v0008': 'Renda',
-        'v0009': 'Alfabetizados',
-    }, 
-    inplace=True
-)
+# Carregar DataFrames processados (snapshot pré-compilado ou ETL completo).
+# Monitoramento é lido pelo Painel, compartilhado entre as sessões; Segurança Pública, Satisfação e
+# Setores Censitários são carregados sob demanda (ver COLS_VALUE_RADAR)
+DF_BAIRROS_PLG = Fontes.load('DF_BAIRROS_PLG')
 
 # ==================== UNIFICANDO INFORMAÇÕES ====================
 
 # ==================== DASHBOARD ====================
-DF_AMV_FILTERED = DF_AMV_BAIRRO.copy()
-DF_SEG_FILTERED = DF_SEGURANCA.copy()
-
-FILTROS = {
-  'BAIRRO': list(sorted(DF_AMV_FILTERED['BAIRRO'].unique())),
-  'PERÍODO': list(DF_AMV_FILTERED['F_PERIODO'].unique()),
-  'DIA DA SEMANA': list(DF_AMV_FILTERED['F_DIA_SEMANA'].unique()),
-  'DIA': list(DF_AMV_FILTERED['F_DIA'].unique()),
-  'MES': list(DF_AMV_FILTERED['F_MES'].unique()),
-  'ANO': list(DF_AMV_FILTERED['F_ANO'].unique()),
-  'HORA': list(DF_AMV_FILTERED['F_HORA'].unique()),
-  'MINUTO': list(DF_AMV_FILTERED['F_MINUTO'].unique()),
-}
+
+# Valores disponíveis para os filtros, levantados uma vez por versão dos dados (ver Painel.dominios)
+FILTROS = Painel.dominios()
 
 st.markdown(
     """
@@ -913,111 +233,18 @@ with datesFilterCols[1]:
             value=np.array(FILTROS['MINUTO']).max())
 
 # APLICANDO FILTRO
-if FILTRO_BAIRRO != []:
-    DF_AMV_FILTERED = DF_AMV_FILTERED[DF_AMV_FILTERED['BAIRRO'].isin(FILTRO_BAIRRO)]
-    DF_SEG_FILTERED = DF_SEG_FILTERED[DF_SEG_FILTERED['BAIRRO'].isin(FILTRO_BAIRRO)]
-if FILTRO_PERIODO != []:
-    DF_AMV_FILTERED = DF_AMV_FILTERED[DF_AMV_FILTERED['F_PERIODO'].isin(FILTRO_PERIODO)]
-    DF_SEG_FILTERED = DF_SEG_FILTERED[DF_SEG_FILTERED['F_PERIODO'].isin(FILTRO_PERIODO)]
-if FILTRO_DIA_SEMANA != []:
-    DF_AMV_FILTERED = DF_AMV_FILTERED[DF_AMV_FILTERED['F_DIA_SEMANA'].isin(FILTRO_DIA_SEMANA)]
-    DF_SEG_FILTERED = DF_SEG_FILTERED[DF_SEG_FILTERED['F_DIA_SEMANA'].isin(FILTRO_DIA_SEMANA)]
-
-DF_AMV_FILTERED = DF_AMV_FILTERED[
-    # DATA / HORA DE
-    (DF_AMV_FILTERED['F_DIA'] >= FILTRO_DIA_DE) &
-    (DF_AMV_FILTERED['F_MES'] >= FILTRO_MES_DE) &
-    (DF_AMV_FILTERED['F_ANO'] >= FILTRO_ANO_DE) &
-    (DF_AMV_FILTERED['F_HORA'] >= FILTRO_HORA_DE) &
-    (DF_AMV_FILTERED['F_MINUTO'] >= FILTRO_MINUTO_DE) &
-    # DATA / HORA ATÉ
-    (DF_AMV_FILTERED['F_DIA'] <= FILTRO_DIA_ATE) &
-    (DF_AMV_FILTERED['F_MES'] <= FILTRO_MES_ATE) &
-    (DF_AMV_FILTERED['F_ANO'] <= FILTRO_ANO_ATE) &
-    (DF_AMV_FILTERED['F_HORA'] <= FILTRO_HORA_ATE) &
-    (DF_AMV_FILTERED['F_MINUTO'] <= FILTRO_MINUTO_ATE)
-]
+# Filtros, unificação e indicadores são calculados uma vez por seleção e compartilhados entre as sessões (ver Painel)
+FILTRO_DATA_DE = Utils.timestamp(FILTRO_ANO_DE, FILTRO_MES_DE, FILTRO_DIA_DE, FILTRO_HORA_DE, FILTRO_MINUTO_DE)
+FILTRO_DATA_ATE = Utils.timestamp(FILTRO_ANO_ATE, FILTRO_MES_ATE, FILTRO_DIA_ATE, FILTRO_HORA_ATE, FILTRO_MINUTO_ATE) + pd.Timedelta(minutes=1)
+FILTROS_SELECAO = (FILTRO_BAIRRO, FILTRO_PERIODO, FILTRO_DIA_SEMANA, FILTRO_DATA_DE, FILTRO_DATA_ATE)
 
-# UNIFICANDO DADOS
-DF_SEGURANCA_GRP = DF_SEG_FILTERED.groupby(['BAIRRO']).size().reset_index(name='NRO_CRIMES')
-
-DF_SATISFACAO_GRP = DF_SATISFACAO.groupby(['BAIRRO']).agg({
-  'QTD_RESP': 'sum',
-  'Sat_Bairro': 'sum',
-  'Sat_Saúde': 'sum',
-  'Pratica_Atividade': 'sum',
-  'Sat_Financeira': 'sum',
-  'Sat_atv_comercial': 'sum',
-  'Sat_Qual_Ar': 'sum',
-  'Sat_Ruído': 'sum',
-  'Sat_Lazer': 'sum',
-  'Sat_col_Lixo': 'sum',
-  'Sat_dist_bus_stop': 'sum',
-  'Sat_qual_bus_stop': 'sum',
-  'Sat_Acesso': 'sum',
-  'Sent_Segurança': 'sum',
-  'Sent_Conf_Pessoas': 'sum',
-  'Sat_Trat_Esgoto': 'sum',
-}).reset_index()
-
-DF_SETORES_GRP = DF_SETORES_BAIRROS.groupby(['BAIRRO']).agg({
-  'Tot_Pessoas': 'sum',
-  'Tot_Domicílios': 'sum',
-  'Tot_Domicílios_pvt': 'sum',
-  'Tot_Domicílios_col': 'sum',
-  'Med_pess_dom_pvt_ocup': 'sum',
-  'Perc_Dom_pvt_ocup': 'sum',
-  'Tot_Dom_pvt_ocup': 'sum',
-  'Renda': 'sum',
-  'Alfabetizados': 'sum',
-}).reset_index()
-
-DF_DATA = DF_AMV_FILTERED.copy()
-DF_DATA = DF_DATA.merge(DF_SEGURANCA_GRP, how='left', left_on='BAIRRO', right_on='BAIRRO')
-DF_DATA = DF_DATA.merge(DF_SATISFACAO_GRP, how='left', left_on='BAIRRO', right_on='BAIRRO')
-DF_DATA = DF_DATA.merge(DF_SETORES_GRP, how='left', left_on='BAIRRO', right_on='BAIRRO')
-
-# TEMPERATURA
-TEMPERATURE_MIN = DF_DATA['temperatura'].min() if (FILTRO_BAIRRO != []) else 0
-TEMPERATURE_MAX = DF_DATA['temperatura'].max() if (FILTRO_BAIRRO != []) else 1
-TEMPERATURE_MEAN = DF_DATA['temperatura'].mean() if (FILTRO_BAIRRO != []) else 0
-TEMPERATURE_CUTOFF_25 = (TEMPERATURE_MIN + 0.25 * (TEMPERATURE_MAX - TEMPERATURE_MIN)) if (FILTRO_BAIRRO != []) else 0.25
-TEMPERATURE_CUTOFF_75 = (TEMPERATURE_MIN + 0.75 * (TEMPERATURE_MAX - TEMPERATURE_MIN)) if (FILTRO_BAIRRO != []) else 0.75
-
-# UMIDADE
-UMIDADE_MIN = DF_DATA['umidade'].min() if (FILTRO_BAIRRO != []) else 0
-UMIDADE_MAX = DF_DATA['umidade'].max() if (FILTRO_BAIRRO != []) else 1
-UMIDADE_MEAN = DF_DATA['umidade'].mean() if (FILTRO_BAIRRO != []) else 0
-UMIDADE_CUTOFF_25 = (UMIDADE_MIN + 0.25 * (UMIDADE_MAX - UMIDADE_MIN)) if (FILTRO_BAIRRO != []) else 0.25
-UMIDADE_CUTOFF_75 = (UMIDADE_MIN + 0.75 * (UMIDADE_MAX - UMIDADE_MIN)) if (FILTRO_BAIRRO != []) else 0.75
-
-# LUMINOSIDADE
-LUMINOSIDADE_MIN = DF_DATA['luminosidade'].min() if (FILTRO_BAIRRO != []) else 0
-LUMINOSIDADE_MAX = DF_DATA['luminosidade'].max() if (FILTRO_BAIRRO != []) else 1
-LUMINOSIDADE_MEAN = DF_DATA['luminosidade'].mean() if (FILTRO_BAIRRO != []) else 0
-LUMINOSIDADE_CUTOFF_25 = (LUMINOSIDADE_MIN + 0.25 * (LUMINOSIDADE_MAX - LUMINOSIDADE_MIN)) if (FILTRO_BAIRRO != []) else 0.25
-LUMINOSIDADE_CUTOFF_75 = (LUMINOSIDADE_MIN + 0.75 * (LUMINOSIDADE_MAX - LUMINOSIDADE_MIN)) if (FILTRO_BAIRRO != []) else 0.75
-
-# RUÍDO
-RUIDO_MIN = DF_DATA['ruido'].min() if (FILTRO_BAIRRO != []) else 0
-RUIDO_MAX = DF_DATA['ruido'].max() if (FILTRO_BAIRRO != []) else 1
-RUIDO_MEAN = DF_DATA['ruido'].mean() if (FILTRO_BAIRRO != []) else 0
-RUIDO_CUTOFF_25 = (RUIDO_MIN + 0.25 * (RUIDO_MAX - RUIDO_MIN)) if (FILTRO_BAIRRO != []) else 0.25
-RUIDO_CUTOFF_75 = (RUIDO_MIN + 0.75 * (RUIDO_MAX - RUIDO_MIN)) if (FILTRO_BAIRRO != []) else 0.75
-
-# CO2
-CO2_MIN = DF_DATA['eco2'].min() if (FILTRO_BAIRRO != []) else 0
-CO2_MAX = DF_DATA['eco2'].max() if (FILTRO_BAIRRO != []) else 1
-CO2_MEAN = DF_DATA['eco2'].mean() if (FILTRO_BAIRRO != []) else 0
-CO2_CUTOFF_25 = (CO2_MIN + 0.25 * (CO2_MAX - CO2_MIN)) if (FILTRO_BAIRRO != []) else 0.25
-CO2_CUTOFF_75 = (CO2_MIN + 0.75 * (CO2_MAX - CO2_MIN)) if (FILTRO_BAIRRO != []) else 0.75
-
-# TVOC
-TVOC_MIN = DF_DATA['etvoc'].min() if (FILTRO_BAIRRO != []) else 0
-TVOC_MAX = DF_DATA['etvoc'].max() if (FILTRO_BAIRRO != []) else 1
-TVOC_MEAN = DF_DATA['etvoc'].mean() if (FILTRO_BAIRRO != []) else 0
-TVOC_CUTOFF_25 = (TVOC_MIN + 0.25 * (TVOC_MAX - TVOC_MIN)) if (FILTRO_BAIRRO != []) else 0.25
-TVOC_CUTOFF_75 = (TVOC_MIN + 0.75 * (TVOC_MAX - TVOC_MIN)) if (FILTRO_BAIRRO != []) else 0.75
+RESULTADOS_MONITORAMENTO = Painel.monitoramento(*FILTROS_SELECAO)
+
+# Leituras filtradas, exibidas na tabela de monitoramento
+DF_DATA = RESULTADOS_MONITORAMENTO['DF_AMV_FILTERED']
+
+# Indicadores dos sensores: reagregados a partir das células do cubo que atendem aos filtros
+DF_ESTATISTICAS = RESULTADOS_MONITORAMENTO['DF_ESTATISTICAS']
 
 st.markdown(
     """
@@ -1037,119 +264,22 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-indicatorCharts = []
-
-# GRÁFICO DE TEMPERATURA
-chartTemperatureColor, chartTemperatureShadown = ChartUtils.getGaugeIndicatorColors(
-TEMPERATURE_MEAN, 
-TEMPERATURE_CUTOFF_25, 
-TEMPERATURE_CUTOFF_75
-)
-chartTemperature = ChartUtils.createGauge(
-    title="Temperatura (°C)",
-    value=TEMPERATURE_MEAN,
-    min=TEMPERATURE_MIN,
-    max=TEMPERATURE_MAX,
-    chartColor=f"{chartTemperatureColor}",
-    shadownColor=f"{chartTemperatureShadown}",
-    # theme='dark'
-)
-indicatorCharts.append(chartTemperature)
-
-# GRÁFICO DE UMIDADE
-chartUmidadeColor, chartUmidadeShadown = ChartUtils.getGaugeIndicatorColors(
-UMIDADE_MEAN, 
-UMIDADE_CUTOFF_25, 
-UMIDADE_CUTOFF_75
-)
-chartUmidade = ChartUtils.createGauge(
-    title="Umidade",
-    value=UMIDADE_MEAN,
-    min=UMIDADE_MIN,
-    max=UMIDADE_MAX,
-    chartColor=f"{chartUmidadeColor}",
-    shadownColor=f"{chartUmidadeShadown}",
-    # theme='dark'
-)
-indicatorCharts.append(chartUmidade)
-
-# GRÁFICO DE LUMINOSIDADE
-chartLuminosidadeColor, chartLuminosidadeShadown = ChartUtils.getGaugeIndicatorColors(
-LUMINOSIDADE_MEAN, 
-LUMINOSIDADE_CUTOFF_25, 
-LUMINOSIDADE_CUTOFF_75
-)
-chartLuminosidade = ChartUtils.createGauge(
-    title="Luminosidade",
-    value=LUMINOSIDADE_MEAN,
-    min=LUMINOSIDADE_MIN,
-    max=LUMINOSIDADE_MAX,
-    chartColor=f"{chartLuminosidadeColor}",
-    shadownColor=f"{chartLuminosidadeShadown}",
-    # theme='dark'
-)
-indicatorCharts.append(chartLuminosidade)
-
-# GRÁFICO DE RUÍDO
-chartRuidoColor, chartRuidoShadown = ChartUtils.getGaugeIndicatorColors(
-RUIDO_MEAN, 
-RUIDO_CUTOFF_25, 
-RUIDO_CUTOFF_75
-)
-chartRuido = ChartUtils.createGauge(
-    title="Ruído",
-    value=RUIDO_MEAN,
-    min=RUIDO_MIN,
-    max=RUIDO_MAX,
-    chartColor=f"{chartRuidoColor}",
-    shadownColor=f"{chartRuidoShadown}",
-    # theme='dark'
-)
-indicatorCharts.append(chartRuido)
-
-# GRÁFICO DE CO2
-chartCO2Color, chartCO2Shadown = ChartUtils.getGaugeIndicatorColors(
-CO2_MEAN, 
-CO2_CUTOFF_25, 
-CO2_CUTOFF_75
-)
-chartCO2 = ChartUtils.createGauge(
-    title="CO₂",
-    value=CO2_MEAN,
-    min=CO2_MIN,
-    max=CO2_MAX,
-    chartColor=f"{chartCO2Color}",
-    shadownColor=f"{chartCO2Shadown}",
-    # theme='dark'
-)
-indicatorCharts.append(chartCO2)
-
-# GRÁFICO DE TVOC
-chartTVOCColor, chartTVOCShadown = ChartUtils.getGaugeIndicatorColors(
-TVOC_MEAN, 
-TVOC_CUTOFF_25, 
-TVOC_CUTOFF_75
-)
-chartTVOC = ChartUtils.createGauge(
-    title="ETVOC",
-    value=TVOC_MEAN,
-    min=TVOC_MIN,
-    max=TVOC_MAX,
-    chartColor=f"{chartTVOCColor}",
-    shadownColor=f"{chartTVOCShadown}",
-    # theme='dark'
-)
-indicatorCharts.append(chartTVOC)
-
-chartCols = st.columns(3)
-chartCols[0].plotly_chart(chartTemperature, use_container_width=True)
-chartCols[1].plotly_chart(chartUmidade, use_container_width=True)
-chartCols[2].plotly_chart(chartLuminosidade, use_container_width=True)
+# Títulos dos indicadores de cada sensor, na ordem de exibição (duas linhas de três)
+TITULOS_INDICADORES = {
+    'temperatura': 'Temperatura (°C)',
+    'umidade': 'Umidade',
+    'luminosidade': 'Luminosidade',
+    'ruido': 'Ruído',
+    'eco2': 'CO₂',
+    'etvoc': 'ETVOC',
+}
+indicatorCharts = ChartUtils.createSensorGauges(
+    DF_ESTATISTICAS, TITULOS_INDICADORES, placeholder=(FILTRO_BAIRRO == []))
 
-chartCols = st.columns(3)
-chartCols[0].plotly_chart(chartRuido, use_container_width=True)
-chartCols[1].plotly_chart(chartCO2, use_container_width=True)
-chartCols[2].plotly_chart(chartTVOC, use_container_width=True)
+for row in range(0, len(indicatorCharts), 3):
+    chartCols = st.columns(3)
+    for column, chart in enumerate(indicatorCharts[row:row + 3]):
+        chartCols[column].plotly_chart(chart, use_container_width=True)
 
 DF_TABLE = DF_DATA[[
     'BAIRRO', 
@@ -1197,24 +327,39 @@ st.markdown(
 )
 
 COLS_GROUP_RADAR = ['BAIRRO']
-COLS_VALUE_RADAR = [
-    'TEMPERATURA', 'UMIDADE', 'LUMINOSIDADE', 'RUIDO', 'CO₂', 'ETVOC',
-    'NRO_CRIMES', 
-    'Sat_Bairro', 'Sat_Saúde', 'Pratica_Atividade', 'Sat_Financeira', 'Sat_atv_comercial',
-    'Sat_Qual_Ar', 'Sat_Ruído', 'Sat_Lazer', 'Sat_col_Lixo', 'Sat_dist_bus_stop',
-    'Sat_qual_bus_stop', 'Sat_Acesso', 'Sent_Segurança', 'Sent_Conf_Pessoas', 'Sat_Trat_Esgoto',
-    'Tot_Pessoas', 'Tot_Domicílios', 'Tot_Domicílios_pvt', 'Tot_Domicílios_col', 'Med_pess_dom_pvt_ocup', 'Perc_Dom_pvt_ocup', 'Tot_Dom_pvt_ocup', 'Renda', 'Alfabetizados',
-]
+# Variáveis do radar e a fonte de dados de cada uma: uma fonte só é carregada,
+# unificada e agregada quando alguma variável selecionada depende dela
+COLS_VALUE_RADAR = {
+    'TEMPERATURA': 'DF_AMV_BAIRRO', 'UMIDADE': 'DF_AMV_BAIRRO', 'LUMINOSIDADE': 'DF_AMV_BAIRRO',
+    'RUIDO': 'DF_AMV_BAIRRO', 'CO₂': 'DF_AMV_BAIRRO', 'ETVOC': 'DF_AMV_BAIRRO',
+    'NRO_CRIMES': 'DF_SEGURANCA',
+    'Sat_Bairro': 'DF_SATISFACAO', 'Sat_Saúde': 'DF_SATISFACAO', 'Pratica_Atividade': 'DF_SATISFACAO',
+    'Sat_Financeira': 'DF_SATISFACAO', 'Sat_atv_comercial': 'DF_SATISFACAO', 'Sat_Qual_Ar': 'DF_SATISFACAO',
+    'Sat_Ruído': 'DF_SATISFACAO', 'Sat_Lazer': 'DF_SATISFACAO', 'Sat_col_Lixo': 'DF_SATISFACAO',
+    'Sat_dist_bus_stop': 'DF_SATISFACAO', 'Sat_qual_bus_stop': 'DF_SATISFACAO', 'Sat_Acesso': 'DF_SATISFACAO',
+    'Sent_Segurança': 'DF_SATISFACAO', 'Sent_Conf_Pessoas': 'DF_SATISFACAO', 'Sat_Trat_Esgoto': 'DF_SATISFACAO',
+    'Tot_Pessoas': 'DF_SETORES_BAIRROS', 'Tot_Domicílios': 'DF_SETORES_BAIRROS', 'Tot_Domicílios_pvt': 'DF_SETORES_BAIRROS',
+    'Tot_Domicílios_col': 'DF_SETORES_BAIRROS', 'Med_pess_dom_pvt_ocup': 'DF_SETORES_BAIRROS', 'Perc_Dom_pvt_ocup': 'DF_SETORES_BAIRROS',
+    'Tot_Dom_pvt_ocup': 'DF_SETORES_BAIRROS', 'Renda': 'DF_SETORES_BAIRROS', 'Alfabetizados': 'DF_SETORES_BAIRROS',
+}
 
 PROPS_GROUP_RADAR = 'BAIRRO'
 PROPS_VALUE_RADAR = st.multiselect(
     label='Variáveis', 
-    options=COLS_VALUE_RADAR, 
+    options=list(COLS_VALUE_RADAR), 
     placeholder="Selecione as variáveis",
     default=['TEMPERATURA', 'UMIDADE', 'LUMINOSIDADE', 'RUIDO', 'CO₂', 'ETVOC']
 )
+FONTES_RADAR = {COLS_VALUE_RADAR[fieldName] for fieldName in PROPS_VALUE_RADAR}
+
+# UNIFICANDO DADOS
+# Médias dos sensores por bairro, reagregadas do cubo, unidas à dimensão de bairros (ver Fontes.dimensaoBairros)
+RESULTADOS_RADAR = Painel.radar(*FILTROS_SELECAO, FONTES_RADAR)
+DF_RADAR = RESULTADOS_RADAR['DF_RADAR']
+if 'DF_SEGURANCA' in FONTES_RADAR:
+    DF_SEG_FILTERED = RESULTADOS_RADAR['DF_SEG_FILTERED']
 
-DF_AMV_RADAR = DF_DATA[[
+COLS_AMV_RADAR = [
     'BAIRRO',   
     'temperatura',
     'umidade',
@@ -1228,7 +373,8 @@ DF_AMV_RADAR = DF_DATA[[
     'Sat_Qual_Ar', 'Sat_Ruído', 'Sat_Lazer', 'Sat_col_Lixo', 'Sat_dist_bus_stop', 
     'Sat_qual_bus_stop', 'Sat_Acesso', 'Sent_Segurança', 'Sent_Conf_Pessoas', 'Sat_Trat_Esgoto', 
     'Tot_Pessoas', 'Tot_Domicílios', 'Tot_Domicílios_pvt', 'Tot_Domicílios_col', 'Med_pess_dom_pvt_ocup', 'Perc_Dom_pvt_ocup', 'Tot_Dom_pvt_ocup', 'Renda', 'Alfabetizados',
-]]
+]
+DF_AMV_RADAR = DF_RADAR[[fieldName for fieldName in COLS_AMV_RADAR if fieldName in DF_RADAR.columns]]
 
 DF_AMV_RADAR.rename(
     columns={
@@ -1265,20 +411,32 @@ DF_AMV_RADAR.rename(
     inplace=True
 )
 
+# Normalização mínimo-máximo: os sensores usam os extremos das leituras (acumulados no cubo),
+# as demais variáveis os extremos entre os bairros
+LIMITES_SENSORES_RADAR = {
+    'TEMPERATURA': 'temperatura', 'UMIDADE': 'umidade', 'LUMINOSIDADE': 'luminosidade',
+    'RUIDO': 'ruido', 'CO₂': 'eco2', 'ETVOC': 'etvoc',
+}
+
 COLS_V = []
 COLS_N = []
 if(DF_AMV_RADAR.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR != []):
     for fieldName in PROPS_VALUE_RADAR:
-        DF_AMV_RADAR[f'N_{fieldName}'] = DF_AMV_RADAR[f'{fieldName}']
+        if fieldName in LIMITES_SENSORES_RADAR:
+            valueMin = DF_ESTATISTICAS.loc[LIMITES_SENSORES_RADAR[fieldName], 'min']
+            valueMax = DF_ESTATISTICAS.loc[LIMITES_SENSORES_RADAR[fieldName], 'max']
+        else:
+            valueMin = DF_AMV_RADAR[fieldName].min()
+            valueMax = DF_AMV_RADAR[fieldName].max()
+        # Variável constante é normalizada para zero, como no MinMaxScaler
+        valueRange = (valueMax - valueMin) if valueMax > valueMin else 1
+        DF_AMV_RADAR[f'N_{fieldName}'] = (DF_AMV_RADAR[fieldName] - valueMin) / valueRange
         COLS_N.append(f'N_{fieldName}')
         COLS_V.append(f'{fieldName}')
 
-    scaler = MinMaxScaler()    
-    DF_AMV_RADAR[COLS_N] = scaler.fit_transform(DF_AMV_RADAR[COLS_V])
-
-DF_AMV_RADAR_PLOT = DF_AMV_RADAR[[PROPS_GROUP_RADAR] + COLS_N].groupby(PROPS_GROUP_RADAR).mean()
+# Uma linha por bairro: não há reagregação
+DF_AMV_RADAR_PLOT = DF_AMV_RADAR[[PROPS_GROUP_RADAR] + COLS_N].copy()
 DF_AMV_RADAR_PLOT.rename(columns=lambda x: x[2:] if ('N_' in x) else x, inplace=True)
-DF_AMV_RADAR_PLOT.reset_index(inplace=True)
 
 chartMonitoramentoBairro = ChartUtils.createRadar(
     title=f'INDICADORES POR {PROPS_GROUP_RADAR}',
@@ -1293,8 +451,7 @@ chartCols[0].plotly_chart(chartMonitoramentoBairro, use_container_width=True)
 
 # ====================== TABELA GRÁFICO RADAR ======================
 if(DF_AMV_RADAR.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR != []):
-    DF_RADAR_TABLE = DF_AMV_RADAR[[PROPS_GROUP_RADAR] + COLS_V].groupby(PROPS_GROUP_RADAR).mean()
-    DF_RADAR_TABLE.reset_index(inplace=True)
+    DF_RADAR_TABLE = DF_AMV_RADAR[[PROPS_GROUP_RADAR] + COLS_V].reset_index(drop=True)
     st.dataframe(
         data=DF_RADAR_TABLE, 
         use_container_width=True, 
@@ -1320,7 +477,7 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-mapIndicators = MapUtils.createMap(INITIAL_COORDS, 12, BASEMAPS[3], False, True, False, True)
+mapIndicators = MapUtils.createMap(INITIAL_COORDS, INITIAL_ZOOM, BASEMAPS[3], False, True, False, True)
 
 lyrBairrosPLGStyle = {
     'fillColor': '#CCCCCC',    # Sem preenchimento
@@ -1335,10 +492,10 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
     DF_BAIRROS_LYR.rename(columns={'nome': 'BAIRRO'}, inplace=True)
     DF_BAIRROS_LYR = DF_BAIRROS_LYR.merge(DF_RADAR_TABLE, how='left', left_on='BAIRRO', right_on='BAIRRO')
     DF_BAIRROS_LYR['GEOID'] = DF_BAIRROS_LYR.index.astype(str)
-    DF_BAIRROS_LYR['CENTROID'] = DF_BAIRROS_LYR.centroid
-    DF_BAIRROS_LYR['LAT'] = DF_BAIRROS_LYR['CENTROID'].map(lambda c: c.y)
-    DF_BAIRROS_LYR['LON'] = DF_BAIRROS_LYR['CENTROID'].map(lambda c: c.x)
-    DF_BAIRROS_LYR.drop(columns=['CENTROID'], inplace=True)
+    
+    # Geometrias simplificadas no nível adequado ao zoom do mapa (menor volume enviado ao navegador)
+    DF_BAIRROS_LYR = MapUtils.simplifiedGeometry(
+        DF_BAIRROS_LYR, Fontes.load('DF_GEOMETRIAS_MAPA'), 'BAIRROS', INITIAL_ZOOM, keyField='BAIRRO')
     MapUtils.addLayer(
         geoDF=DF_BAIRROS_LYR,
         styleConfig=lyrBairrosPLGStyle,
@@ -1346,7 +503,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
     ).add_to(mapIndicators)
     
     # ===== RÓTULOS =====
-    folium.GeoJson(
+    MapUtils.topoJsonLayer(
         DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO'] + PROPS_VALUE_RADAR],
         style_function = lambda feature: {
             'fillColor': '#FFF',
@@ -1366,46 +523,39 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
         show=True,
     ).add_to(mapIndicators, index=0)
     
-    # ===== SEGURANÇA PÚBLICA =====
-    DF_SEG_LYR = DF_SEG_FILTERED.copy()
-    DF_SEG_LYR['GEOID'] = DF_SEG_LYR.index.astype(str)
-    locationsSPCLUSTER = list(zip(DF_SEG_LYR['LAT'], DF_SEG_LYR['LON']))
-    MarkerCluster(
-        locations=locationsSPCLUSTER,
-        name='Segurança Pública (Cluster)',
-        popups=DF_SEG_LYR['BAIRRO'].tolist(),
-        show=False,
-    ).add_to(mapIndicators)
+    # ===== SEGURANÇA PÚBLICA (somente quando NRO_CRIMES está selecionada) =====
+    if 'DF_SEGURANCA' in FONTES_RADAR:
+        DF_SEG_LYR = DF_SEG_FILTERED.copy()
+        DF_SEG_LYR['GEOID'] = DF_SEG_LYR.index.astype(str)
+        locationsSPCLUSTER = list(zip(DF_SEG_LYR['LAT'], DF_SEG_LYR['LON']))
+        MarkerCluster(
+            locations=locationsSPCLUSTER,
+            name='Segurança Pública (Cluster)',
+            popups=DF_SEG_LYR['BAIRRO'].tolist(),
+            show=False,
+        ).add_to(mapIndicators)
     
-    crimesIM = {
-        'Homicídio': {'color': '#330708', 'radius': 3},
-        'Roubo': {'color': '#e87624', 'radius': 3},
-        'Tentativa de Homicídio': {'color': '#e84624', 'radius': 3},
-        'Tentativa de Roubo': {'color': '#e8a726', 'radius': 3}
-    }
-    crimesGRPLYR = folium.FeatureGroup(name='Segurança Pública (Localização)')
-    crimesLYRS = {
-        'Homicídio': FeatureGroupSubGroup(crimesGRPLYR, 'Homicídio'),
-        'Roubo': FeatureGroupSubGroup(crimesGRPLYR, 'Roubo'),
-        'Tentativa de Homicídio': FeatureGroupSubGroup(crimesGRPLYR, 'Tentativa de Homicídio'),
-        'Tentativa de Roubo': FeatureGroupSubGroup(crimesGRPLYR, 'Tentativa de Roubo')
-    }
-    for idx, row in DF_SEG_LYR.iterrows():
-        folium.CircleMarker(
-            location=[row['LAT'], row['LON']],
-            radius=crimesIM[row['F_CLASSIFICACAO']]['radius'],
-            color=crimesIM[row['F_CLASSIFICACAO']]['color'],
-            weight=0,
-            fill=True,
-            fill_color=crimesIM[row['F_CLASSIFICACAO']]['color'],
-            fill_opacity=0.75,
-        ).add_to(crimesLYRS[row['F_CLASSIFICACAO']])
+        crimesGRPLYR = folium.FeatureGroup(name='Segurança Pública (Localização)')
+        crimesLYRS = {}
+        for crimeClass, DF_CRIME_CLASS in DF_SEG_LYR.groupby('F_CLASSIFICACAO', observed=True):
+            crimeSymbol = CRIME_SIMBOLOGIA.get(crimeClass, CRIME_SIMBOLO_PADRAO)
+            crimesLYRS[crimeClass] = FeatureGroupSubGroup(crimesGRPLYR, crimeClass)
+            for lat, lon in zip(DF_CRIME_CLASS['LAT'], DF_CRIME_CLASS['LON']):
+                folium.CircleMarker(
+                    location=[lat, lon],
+                    radius=crimeSymbol['radius'],
+                    color=crimeSymbol['color'],
+                    weight=0,
+                    fill=True,
+                    fill_color=crimeSymbol['color'],
+                    fill_opacity=0.75,
+                ).add_to(crimesLYRS[crimeClass])
     
-    for crimeLYR in crimesLYRS.values():
-        crimeLYR.add_to(crimesGRPLYR)
+        for crimeLYR in crimesLYRS.values():
+            crimeLYR.add_to(crimesGRPLYR)
     
-    crimesGRPLYR.show=False
-    crimesGRPLYR.add_to(mapIndicators)
+        crimesGRPLYR.show=False
+        crimesGRPLYR.add_to(mapIndicators)
     
     symbolClasses = 5
     valuesSYMBOLS = {
@@ -1516,7 +666,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_TEMPERATURA = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_TEMPERATURA = mcolors.BoundaryNorm(CLASS_BINS_TEMPERATURA, CMAP_TEMPERATURA.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','TEMPERATURA']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_TEMPERATURA(NORM_TEMPERATURA(feature['properties']['TEMPERATURA']))),
@@ -1561,7 +711,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_UMIDADE = mcolors.LinearSegmentedColormap.from_list('custom', ['#00ee6e', '#0c75e6'], N=NRO_CLASSES)
                 NORM_UMIDADE = mcolors.BoundaryNorm(CLASS_BINS_UMIDADE, CMAP_UMIDADE.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','UMIDADE']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_UMIDADE(NORM_UMIDADE(feature['properties']['UMIDADE']))),
@@ -1606,7 +756,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_LUMINOSIDADE = mcolors.LinearSegmentedColormap.from_list('custom', ['#f7f2ab', '#bda734'], N=NRO_CLASSES)
                 NORM_LUMINOSIDADE = mcolors.BoundaryNorm(CLASS_BINS_LUMINOSIDADE, CMAP_LUMINOSIDADE.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','LUMINOSIDADE']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_LUMINOSIDADE(NORM_LUMINOSIDADE(feature['properties']['LUMINOSIDADE']))),
@@ -1651,7 +801,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_RUIDO = mcolors.LinearSegmentedColormap.from_list('custom', ['#6d90b9', '#bbc7dc'], N=NRO_CLASSES)
                 NORM_RUIDO = mcolors.BoundaryNorm(CLASS_BINS_RUIDO, CMAP_RUIDO.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','RUIDO']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_RUIDO(NORM_RUIDO(feature['properties']['RUIDO']))),
@@ -1696,7 +846,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_CO2 = mcolors.LinearSegmentedColormap.from_list('custom', ['#6d90b9', '#bbc7dc'], N=NRO_CLASSES)
                 NORM_CO2 = mcolors.BoundaryNorm(CLASS_BINS_CO2, CMAP_CO2.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','CO₂']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_CO2(NORM_CO2(feature['properties']['CO₂']))),
@@ -1741,7 +891,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_ETVOC = mcolors.LinearSegmentedColormap.from_list('custom', ['#f74c06', '#f9bc2c'], N=NRO_CLASSES)
                 NORM_ETVOC = mcolors.BoundaryNorm(CLASS_BINS_ETVOC, CMAP_ETVOC.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','ETVOC']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_ETVOC(NORM_ETVOC(feature['properties']['ETVOC']))),
@@ -1786,7 +936,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT01 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT01 = mcolors.BoundaryNorm(CLASS_BINS_SAT01, CMAP_SAT01.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sat_Bairro']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT01(NORM_SAT01(feature['properties']['Sat_Bairro']))),
@@ -1831,7 +981,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT02 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT02 = mcolors.BoundaryNorm(CLASS_BINS_SAT02, CMAP_SAT02.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sat_Saúde']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT02(NORM_SAT02(feature['properties']['Sat_Saúde']))),
@@ -1876,7 +1026,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT03 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT03 = mcolors.BoundaryNorm(CLASS_BINS_SAT03, CMAP_SAT03.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Pratica_Atividade']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT03(NORM_SAT03(feature['properties']['Pratica_Atividade']))),
@@ -1921,7 +1071,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT04 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT04 = mcolors.BoundaryNorm(CLASS_BINS_SAT04, CMAP_SAT04.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sat_Financeira']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT01(NORM_SAT04(feature['properties']['Sat_Financeira']))),
@@ -1966,7 +1116,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT05 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT05 = mcolors.BoundaryNorm(CLASS_BINS_SAT05, CMAP_SAT05.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sat_atv_comercial']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT01(NORM_SAT05(feature['properties']['Sat_atv_comercial']))),
@@ -2011,7 +1161,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT06 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT06 = mcolors.BoundaryNorm(CLASS_BINS_SAT06, CMAP_SAT06.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sat_Qual_Ar']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT06(NORM_SAT06(feature['properties']['Sat_Qual_Ar']))),
@@ -2056,7 +1206,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT07 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT07 = mcolors.BoundaryNorm(CLASS_BINS_SAT07, CMAP_SAT07.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sat_Ruído']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT07(NORM_SAT07(feature['properties']['Sat_Ruído']))),
@@ -2101,7 +1251,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT08 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT08 = mcolors.BoundaryNorm(CLASS_BINS_SAT08, CMAP_SAT08.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sat_Lazer']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT08(NORM_SAT08(feature['properties']['Sat_Lazer']))),
@@ -2146,7 +1296,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT09 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT09 = mcolors.BoundaryNorm(CLASS_BINS_SAT09, CMAP_SAT09.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sat_col_Lixo']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT09(NORM_SAT09(feature['properties']['Sat_col_Lixo']))),
@@ -2191,7 +1341,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT10 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT10 = mcolors.BoundaryNorm(CLASS_BINS_SAT10, CMAP_SAT10.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sat_dist_bus_stop']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT10(NORM_SAT10(feature['properties']['Sat_dist_bus_stop']))),
@@ -2236,7 +1386,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT11 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT11 = mcolors.BoundaryNorm(CLASS_BINS_SAT11, CMAP_SAT11.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sat_qual_bus_stop']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT11(NORM_SAT11(feature['properties']['Sat_qual_bus_stop']))),
@@ -2281,7 +1431,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT12 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT12 = mcolors.BoundaryNorm(CLASS_BINS_SAT12, CMAP_SAT12.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sat_Acesso']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT12(NORM_SAT12(feature['properties']['Sat_Acesso']))),
@@ -2326,7 +1476,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT13 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT13 = mcolors.BoundaryNorm(CLASS_BINS_SAT13, CMAP_SAT13.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sent_Segurança']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT13(NORM_SAT13(feature['properties']['Sent_Segurança']))),
@@ -2371,7 +1521,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT14 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT14 = mcolors.BoundaryNorm(CLASS_BINS_SAT14, CMAP_SAT14.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sent_Conf_Pessoas']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT14(NORM_SAT14(feature['properties']['Sent_Conf_Pessoas']))),
@@ -2416,7 +1566,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_SAT15 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_SAT15 = mcolors.BoundaryNorm(CLASS_BINS_SAT15, CMAP_SAT15.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Sat_Trat_Esgoto']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_SAT15(NORM_SAT15(feature['properties']['Sat_Trat_Esgoto']))),
@@ -2461,7 +1611,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_v0001 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_v0001 = mcolors.BoundaryNorm(CLASS_BINS_v0001, CMAP_v0001.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Tot_Pessoas']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_v0001(NORM_v0001(feature['properties']['Tot_Pessoas']))),
@@ -2506,7 +1656,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_v0002 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_v0002 = mcolors.BoundaryNorm(CLASS_BINS_v0002, CMAP_v0002.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Tot_Domicílios']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_v0002(NORM_v0002(feature['properties']['Tot_Domicílios']))),
@@ -2551,7 +1701,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_v0003 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_v0003 = mcolors.BoundaryNorm(CLASS_BINS_v0003, CMAP_v0003.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Tot_Domicílios_pvt']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_v0003(NORM_v0003(feature['properties']['Tot_Domicílios_pvt']))),
@@ -2596,7 +1746,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_v0004 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_v0004 = mcolors.BoundaryNorm(CLASS_BINS_v0004, CMAP_v0004.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Tot_Domicílios_col']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_v0004(NORM_v0004(feature['properties']['Tot_Domicílios_col']))),
@@ -2641,7 +1791,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_v0005 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_v0005 = mcolors.BoundaryNorm(CLASS_BINS_v0005, CMAP_v0005.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Med_pess_dom_pvt_ocup']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_v0005(NORM_v0005(feature['properties']['Med_pess_dom_pvt_ocup']))),
@@ -2686,7 +1836,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_v0006 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_v0006 = mcolors.BoundaryNorm(CLASS_BINS_v0006, CMAP_v0006.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Perc_Dom_pvt_ocup']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_v0006(NORM_v0006(feature['properties']['Perc_Dom_pvt_ocup']))),
@@ -2731,7 +1881,7 @@ if(DF_BAIRROS_PLG.empty == False and FILTRO_BAIRRO != [] and PROPS_VALUE_RADAR !
                     NRO_CLASSES + 1)
                 CMAP_v0007 = mcolors.LinearSegmentedColormap.from_list('custom', ['#f4d444', '#f86ca7'], N=NRO_CLASSES)
                 NORM_v0007 = mcolors.BoundaryNorm(CLASS_BINS_v0007, CMAP_v0007.N)
-                folium.GeoJson(
+                MapUtils.topoJsonLayer(
                     DF_BAIRROS_LYR[['geometry','GEOID','BAIRRO','Tot_Dom_pvt_ocup']],
                     style_function = lambda feature: {
                         'fillColor': mcolors.to_hex(CMAP_v0007(NORM_v0007(feature['properties']['Tot_Dom_pvt_ocup']))),
@@ -0,0 +1,3279 @@
+import warnings
+warnings.filterwarnings("ignore")
+
+import io
+import os
+import sys
+import glob
+import json
+import hashlib
+import threading
+import argparse
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+import folium
+import plotly.graph_objs as go
+import plotly.express as px
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+
+from datetime import datetime
+from collections import OrderedDict
+from functools import partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from scipy import sparse
+from folium import TopoJson
+from shapely import STRtree, to_wkb, Polygon, MultiPolygon, linestrings, simplify, get_coordinates, make_valid, get_parts, get_num_points, is_closed, is_simple, relate_pattern
+from folium.features import GeoJsonPopup, GeoJsonTooltip
+from unidecode import unidecode
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# ================ PARÂMETROS ================
+
+ENV = 'PRD' # DEV / PRD
+
+# Paths
+BASE_PATH = '/mnt/d/PESSOAL/240319-RS-MATR/source' if (ENV == 'DEV') else '/mount/src/matr/'
+DATA_PATH = f'{BASE_PATH}/data'
+SNAPSHOT_PATH = f'{BASE_PATH}/snapshot'
+COLUMNAR_PATH = f'{BASE_PATH}/cache/columnar'
+GEOMETRY_PATH = f'{BASE_PATH}/cache/geometry'
+
+# Cache de carga: as chaves incluem a identidade dos arquivos (mtime/tamanho e, opcionalmente, hash)
+HASH_SOURCES = False
+CACHE_MAX_ENTRIES = 32
+
+# Limite de memória do cache de resultados de filtros compartilhado entre as sessões (ver CacheResultados)
+CACHE_RESULTADOS_BYTES = 512 * 1024 ** 2
+
+# Número máximo de leituras/etapas executadas em paralelo (pyogrio e o leitor de CSV liberam o GIL)
+LOAD_WORKERS = 8
+
+# Município analisado (filtro aplicado na leitura das malhas e tabelas estaduais)
+MUNICIPIO = 'Caxias do Sul'
+
+# Código IBGE do município: os 7 primeiros dígitos do código de setor (15 dígitos)
+MUNICIPIO_CODIGO = 4305108
+CENSO_SUFIXO_SETOR = 10 ** 8
+
+# Variáveis do CENSO 2010 juntadas aos setores: nome → (tabela em data/CENSO_2010, coluna).
+# As demais tabelas disponíveis (ex.: Pessoa05_RS, Pessoa10_RS) podem ser incluídas aqui.
+CENSO_FOLDER = 'CENSO_2010'
+CENSO_VARIAVEIS = {
+    'v0008': ('DomicilioRenda_RS', 'V002'),
+    'v0009': ('Pessoa01_RS', 'V001'),
+}
+
+# Projeção métrica (SIRGAS 2000 / UTM 22S) usada no cálculo de áreas
+CRS_METRICO = 'EPSG:31982'
+
+# Pirâmide de geometrias simplificadas do mapa: zoom mínimo do nível → tolerância da simplificação
+# (metros, em CRS_METRICO). Tolerância 0 mantém a geometria original (ver MapUtils.simplifiedGeometry)
+PIRAMIDE_NIVEIS = {
+    0: 100,
+    11: 30,
+    13: 10,
+    15: 3,
+    17: 0,
+}
+
+# Quantização das coordenadas das camadas enviadas ao mapa (TopoJSON): número de posições
+# da grade em cada eixo, sobre a extensão da camada (~1 m na extensão do município)
+TOPOJSON_QUANTIZACAO = 100_000
+
+# Grade (metros, em CRS_METRICO) à qual os vértices são ajustados antes da simplificação da pirâmide,
+# para que os limites compartilhados entre feições vizinhas sejam reconhecidos como o mesmo arco
+PIRAMIDE_GRADE = 0.01
+
+# Atributos lidos da malha de setores censitários
+SETORES_COLUMNS = ['CD_SETOR', 'NM_MUN', 'v0001', 'v0002', 'v0003', 'v0004', 'v0005', 'v0006', 'v0007']
+
+# Arquivos de monitoramento (AMV_01.csv, AMV_02.csv, ...): leitura em blocos, com tipos declarados
+AMV_FILE_PATTERN = 'AMV_*'
+AMV_SEPARATOR = '|'
+AMV_CHUNK_SIZE = 250_000
+AMV_DTYPES = {
+    'device': 'category',
+    'data': 'str',
+    'latitude': 'float64',
+    'longitude': 'float64',
+    'temperatura': 'float32',
+    'umidade': 'float32',
+    'luminosidade': 'float32',
+    'ruido': 'float32',
+    'eco2': 'float32',
+    'etvoc': 'float32',
+}
+
+# Variáveis medidas pelos sensores de monitoramento, agregadas no cubo (ver Cubo)
+SENSORES = ['temperatura', 'umidade', 'luminosidade', 'ruido', 'eco2', 'etvoc']
+
+# Percentis dos sensores incluídos nas estatísticas dos indicadores (ex.: [25, 50, 75]). Percentis não são
+# reagregáveis: quando solicitados, as estatísticas são calculadas sobre as leituras filtradas, e não sobre o cubo
+PERCENTIS_INDICADORES = []
+
+# Medidas acumuladas no cubo para cada sensor: todas podem ser reagregadas a partir das células
+CUBO_MEDIDAS = ['COUNT', 'SUM', 'SUMSQ', 'MIN', 'MAX']
+
+# Versão do esquema do snapshot (incrementar sempre que a etapa de ETL mudar as colunas geradas)
+SNAPSHOT_SCHEMA_VERSION = 12
+SNAPSHOT_MANIFEST = 'manifest.json'
+SNAPSHOT_FRAMES = [
+    'DF_BAIRROS_PLG',
+    'DF_AMV_BAIRRO',
+    'DF_AMV_CUBO',
+    'DF_SEGURANCA',
+    'DF_SATISFACAO',
+    'DF_SETORES_BAIRROS',
+    'DF_SETORES_CROSSWALK',
+    'DF_GEOMETRIAS_MAPA',
+]
+
+# Grafias alternativas de nomes de bairros nas fontes (nome normalizado → nome canônico da camada de bairros).
+# Aplicadas após a normalização (ver Utils.normalizeNames); novas grafias são incluídas aqui
+NOMES_ALIASES = {
+    'JARDIM DAS HORTENCIAS': 'JARDIM DAS HORTENSIAS',
+    'SAO LUIS DA 6A LEGUA': 'SAO LUIZ',
+    'FATIMA': 'NOSSA SENHORA DE FATIMA',
+}
+
+# Regras de classificação das ocorrências de segurança pública (ver Utils.classifyCrimes), avaliadas
+# em ordem: (Tipo Fato, termo contido em Desc Fato, classe). Novas classes são incluídas aqui
+CRIME_REGRAS = [
+    ('Tentado', 'HOMICIDIO', 'Tentativa de Homicídio'),
+    ('Tentado', 'ROUBO', 'Tentativa de Roubo'),
+    ('Consumado', 'HOMICIDIO', 'Homicídio'),
+    ('Consumado', 'ROUBO', 'Roubo'),
+]
+CRIME_CLASSE_PADRAO = 'Outros'
+
+# Simbologia das classes de crime no mapa (classes sem entrada usam CRIME_SIMBOLO_PADRAO)
+CRIME_SIMBOLOGIA = {
+    'Homicídio': {'color': '#330708', 'radius': 3},
+    'Roubo': {'color': '#e87624', 'radius': 3},
+    'Tentativa de Homicídio': {'color': '#e84624', 'radius': 3},
+    'Tentativa de Roubo': {'color': '#e8a726', 'radius': 3},
+}
+CRIME_SIMBOLO_PADRAO = {'color': '#7f7f7f', 'radius': 2}
+
+# Esquema compacto dos DataFrames processados, aplicado logo após a derivação dos campos (ver Esquema.compact).
+# Categorias fixas mantêm o mesmo tipo entre partes do snapshot e entre DataFrames unificados;
+# coordenadas permanecem float64 (a precisão do float32 não é suficiente para as junções espaciais)
+PERIODOS_DIA = {
+    'Manhã': range(5, 12),
+    'Tarde': range(12, 18),
+    'Noite': [*range(18, 24), *range(0, 5)],
+}
+CATEGORIAS_PERIODO = pd.CategoricalDtype(list(PERIODOS_DIA))
+CATEGORIAS_DIA_SEMANA = pd.CategoricalDtype(['SEG', 'TER', 'QUA', 'QUI', 'SEX', 'SAB', 'DOM'])
+CATEGORIAS_CLASSIFICACAO = pd.CategoricalDtype(list(dict.fromkeys([classe for _, _, classe in CRIME_REGRAS] + [CRIME_CLASSE_PADRAO])))
+SCHEMA_CAMPOS_DATA = {
+    'F_PERIODO': CATEGORIAS_PERIODO,
+    'F_HORA': 'int8',
+    'F_MINUTO': 'int8',
+    'F_DIA': 'int8',
+    'F_MES': 'int8',
+    'F_ANO': 'int16',
+    'F_DIA_SEMANA': CATEGORIAS_DIA_SEMANA,
+}
+SCHEMA_COMPACTO = {
+    'DF_AMV_BAIRRO': {
+        'BAIRRO': 'category',
+        'device': 'category',
+        'temperatura': 'float32',
+        'umidade': 'float32',
+        'luminosidade': 'float32',
+        'ruido': 'float32',
+        'eco2': 'float32',
+        'etvoc': 'float32',
+        **SCHEMA_CAMPOS_DATA,
+    },
+    'DF_SEGURANCA': {
+        'BAIRRO': 'category',
+        'MUNICIPIO': 'category',
+        'F_CLASSIFICACAO': CATEGORIAS_CLASSIFICACAO,
+        **SCHEMA_CAMPOS_DATA,
+    },
+}
+
+# Dimensões indexadas por bitmaps nos DataFrames filtrados pelo dashboard (ver IndiceBitmap)
+BITMAP_DIMENSOES = {
+    'DF_AMV_BAIRRO': ['BAIRRO', 'F_PERIODO', 'F_DIA_SEMANA'],
+    'DF_SEGURANCA': ['BAIRRO', 'F_PERIODO', 'F_DIA_SEMANA', 'F_CLASSIFICACAO'],
+}
+
+# Agregação por bairro das fontes carregadas sob demanda pelo dashboard (ver Fontes.aggregate).
+# Fontes com tabela de correspondência (CROSSWALKS_BAIRRO) são agregadas ponderando pela área (ver Censo.aggregate)
+AGREGACOES_BAIRRO = {
+    'DF_SATISFACAO': {
+        'QTD_RESP': 'sum',
+        'Sat_Bairro': 'sum',
+        'Sat_Saúde': 'sum',
+        'Pratica_Atividade': 'sum',
+        'Sat_Financeira': 'sum',
+        'Sat_atv_comercial': 'sum',
+        'Sat_Qual_Ar': 'sum',
+        'Sat_Ruído': 'sum',
+        'Sat_Lazer': 'sum',
+        'Sat_col_Lixo': 'sum',
+        'Sat_dist_bus_stop': 'sum',
+        'Sat_qual_bus_stop': 'sum',
+        'Sat_Acesso': 'sum',
+        'Sent_Segurança': 'sum',
+        'Sent_Conf_Pessoas': 'sum',
+        'Sat_Trat_Esgoto': 'sum',
+    },
+    'DF_SETORES_BAIRROS': {
+        'Tot_Pessoas': 'sum',
+        'Tot_Domicílios': 'sum',
+        'Tot_Domicílios_pvt': 'sum',
+        'Tot_Domicílios_col': 'sum',
+        'Med_pess_dom_pvt_ocup': 'mean',
+        'Perc_Dom_pvt_ocup': 'mean',
+        'Tot_Dom_pvt_ocup': 'sum',
+        'Renda': 'sum',
+        'Alfabetizados': 'sum',
+    },
+}
+
+# Tabela de correspondência (setor → bairro, com a fração da área) de cada fonte sem bairro próprio
+CROSSWALKS_BAIRRO = {
+    'DF_SETORES_BAIRROS': 'DF_SETORES_CROSSWALK',
+}
+
+# Fontes com atributos fixos por bairro, reunidas na dimensão de bairros (ver Fontes.dimensaoBairros)
+DIMENSAO_BAIRRO = ['DF_SATISFACAO', 'DF_SETORES_BAIRROS']
+
+# ================ CLASSES DE NEGÓCIO ================
+
+class DataLoader:
+    # Extensões que compõem um shapefile e participam da identidade da fonte
+    SHP_SIDECARS = ('.shp', '.shx', '.dbf', '.prj', '.cpg')
+
+    @staticmethod
+    def sourceFiles(folderPath, fileName, extension):
+        """
+        Lista os arquivos que compõem uma fonte de dados.
+        
+        Parâmetros:
+        - folderPath (str): Caminho para a pasta da fonte.
+        - fileName (str): Nome do arquivo, sem extensão.
+        - extension (str): Extensão da fonte ('csv', 'xlsx', 'shp', ...).
+        
+        Retorna:
+        - list: Caminhos dos arquivos. Nomes com curingas (ex.: 'AMV_*') são expandidos.
+          Para shapefiles, inclui todos os arquivos auxiliares (a comparação do nome ignora
+          maiúsculas/minúsculas, pois o acervo mistura .CPG/.cpg).
+        """
+        if any(c in fileName for c in '*?['):
+            return sorted(glob.glob(os.path.join(folderPath, f'{fileName}.{extension}')))
+        
+        if extension != 'shp' or not os.path.isdir(folderPath):
+            return [os.path.join(folderPath, f'{fileName}.{extension}')]
+        
+        return sorted(
+            os.path.join(folderPath, f) for f in os.listdir(folderPath)
+            if os.path.splitext(f)[0].lower() == fileName.lower()
+            and os.path.splitext(f)[1].lower() in DataLoader.SHP_SIDECARS
+        )
+
+    @staticmethod
+    def fileHash(filePath, blockSize=1 << 20):
+        """
+        Calcula o hash SHA-1 do conteúdo de um arquivo, lendo em blocos.
+        """
+        digest = hashlib.sha1()
+        with open(filePath, 'rb') as f:
+            for block in iter(lambda: f.read(blockSize), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def fileIdentity(folderPath, fileName, extension, withHash=None):
+        """
+        Determina a identidade de uma fonte de dados (mtime, tamanho e, opcionalmente,
+        hash do conteúdo de cada arquivo), usada como chave dos caches de carga.
+        
+        Parâmetros:
+        - folderPath (str): Caminho para a pasta da fonte.
+        - fileName (str): Nome do arquivo, sem extensão.
+        - extension (str): Extensão da fonte ('csv', 'xlsx', 'shp', ...).
+        - withHash (bool, opcional): Incluir o hash do conteúdo. Padrão (HASH_SOURCES).
+        
+        Retorna:
+        - tuple: Uma entrada (arquivo, mtime_ns, tamanho[, sha1]) por arquivo; (arquivo, None)
+          para arquivos inexistentes.
+        """
+        withHash = HASH_SOURCES if withHash is None else withHash
+        
+        identity = []
+        for filePath in DataLoader.sourceFiles(folderPath, fileName, extension):
+            if not os.path.exists(filePath):
+                identity.append((os.path.basename(filePath), None))
+                continue
+            stat = os.stat(filePath)
+            entry = (os.path.basename(filePath), stat.st_mtime_ns, stat.st_size)
+            if withHash:
+                entry += (DataLoader.fileHash(filePath),)
+            identity.append(entry)
+        return tuple(identity)
+
+    @staticmethod
+    def whereClause(filters):
+        """
+        Converte filtros de igualdade em uma cláusula WHERE (OGR SQL), para leitura com pushdown.
+        
+        Parâmetros:
+        - filters (dict): Filtros {coluna: valor} ou {coluna: [valores]}.
+        
+        Retorna:
+        - str: Cláusula WHERE, ou None se não houver filtros.
+        """
+        if not filters:
+            return None
+        
+        quote = lambda value: str(value) if isinstance(value, (int, float)) else "'" + str(value).replace("'", "''") + "'"
+        clauses = []
+        for column, values in filters.items():
+            values = values if isinstance(values, (list, tuple, set)) else [values]
+            clauses.append(f'"{column}" IN ({", ".join(quote(value) for value in values)})')
+        return ' AND '.join(clauses)
+
+    @staticmethod
+    def applyFilters(df, filters):
+        """
+        Aplica filtros de igualdade {coluna: valor} ou {coluna: [valores]} a um DataFrame.
+        """
+        if not filters:
+            return df
+        
+        keep = np.ones(len(df), dtype=bool)
+        for column, values in filters.items():
+            values = values if isinstance(values, (list, tuple, set)) else [values]
+            keep &= df[column].isin(values).to_numpy()
+        return df[keep]
+
+    @staticmethod
+    def loadCSV(folderPath, fileName, separator=',', columns=None, filters=None, chunkSize=AMV_CHUNK_SIZE):
+        """
+        Carrega dados de um arquivo CSV em um DataFrame pandas.
+        
+        Parâmetros:
+        - folderPath (str): Caminho para a pasta onde o arquivo CSV está localizado.
+        - fileName (str): Nome do arquivo CSV.
+        - separator (str, opcional): Separador de colunas. Padrão (',').
+        - columns (list, opcional): Colunas a carregar. Padrão (todas).
+        - filters (dict, opcional): Filtros de igualdade {coluna: valor(es)}, aplicados bloco a bloco
+          durante a leitura. Os índices das linhas mantidas são os mesmos da leitura completa.
+        - chunkSize (int, opcional): Número de linhas por bloco quando há filtros. Padrão (AMV_CHUNK_SIZE).
+        
+        Retorna:
+        - DataFrame: Dados carregados do CSV.
+        """
+        identity = DataLoader.fileIdentity(folderPath, fileName, 'csv')
+        return DataLoader._readCSV(folderPath, fileName, separator, columns, filters, chunkSize, identity)
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def _readCSV(folderPath, fileName, separator, columns, filters, chunkSize, identity):
+        filePath = os.path.join(folderPath, f'{fileName}.csv')
+
+        try:
+            if os.path.exists(filePath):
+                # As colunas dos filtros precisam ser lidas, mesmo que não tenham sido solicitadas
+                usecols = None if columns is None else list(dict.fromkeys(list(columns) + list(filters or {})))
+                
+                if not filters:
+                    return pd.read_csv(filePath, sep=separator, usecols=usecols)
+                
+                reader = pd.read_csv(filePath, sep=separator, usecols=usecols, chunksize=chunkSize)
+                df = pd.concat([DataLoader.applyFilters(chunk, filters) for chunk in reader])
+                return df if columns is None else df[list(columns)]
+            else:
+                raise FileNotFoundError(f"Arquivo {fileName} não encontrado na pasta {folderPath}.")
+        except Exception as e:
+            print(f"Erro ao carregar o arquivo CSV: {e}")
+            return None
+
+    @staticmethod
+    def monitoramentoOffsets(folderPath):
+        """
+        Determina, para cada arquivo de monitoramento, a posição (em bytes) do fim da sua última
+        linha completa. Registrada no manifesto, permite que a ingestão incremental leia só o final dos arquivos.
+        
+        Parâmetros:
+        - folderPath (str): Caminho para a pasta dos arquivos de monitoramento.
+        
+        Retorna:
+        - dict: Posição por arquivo {nome sem extensão: bytes}.
+        """
+        offsets = {}
+        for filePath in DataLoader.sourceFiles(folderPath, AMV_FILE_PATTERN, 'csv'):
+            fileName = os.path.splitext(os.path.basename(filePath))[0]
+            with open(filePath, 'rb') as f:
+                # Procura a última quebra de linha a partir do fim, em blocos: uma linha em gravação é ignorada
+                position = f.seek(0, os.SEEK_END)
+                offsets[fileName] = 0
+                while position > 0:
+                    start = max(0, position - 65536)
+                    f.seek(start)
+                    lineEnd = f.read(position - start).rfind(b'\n')
+                    if lineEnd >= 0:
+                        offsets[fileName] = start + lineEnd + 1
+                        break
+                    position = start
+        return offsets
+
+    @staticmethod
+    def loadMonitoramento(folderPath, fileNames=None, dtypes=AMV_DTYPES, chunkSize=AMV_CHUNK_SIZE, since=None, ranges=None, failed=None):
+        """
+        Carrega os arquivos de monitoramento (separados por '|') em blocos, lendo somente
+        as colunas declaradas, já com os tipos finais e sem as leituras de latitude/longitude zero.
+        
+        Parâmetros:
+        - folderPath (str): Caminho para a pasta dos arquivos de monitoramento.
+        - fileNames (list, opcional): Nomes dos arquivos, sem extensão. Padrão (todos os AMV_*.csv).
+        - dtypes (dict, opcional): Colunas a carregar e seus tipos. Padrão (AMV_DTYPES).
+        - chunkSize (int, opcional): Número de linhas por bloco. Padrão (AMV_CHUNK_SIZE).
+        - since (dict, opcional): Marca d'água por dispositivo {dispositivo: Timestamp}; quando
+          informada, somente leituras posteriores a ela são mantidas (dispositivos novos são lidos por inteiro).
+        - ranges (dict, opcional): Trecho lido de cada arquivo {nome: (início, fim)}, em bytes (ver
+          DataLoader.monitoramentoOffsets). Arquivos ausentes são lidos por inteiro. Padrão (arquivos inteiros).
+        - failed (list, opcional): Lista que recebe os nomes dos arquivos que não puderam ser lidos;
+          nenhuma leitura de um arquivo com erro é mantida.
+        
+        Retorna:
+        - DataFrame: Leituras de monitoramento, com 'data' convertida para datetime.
+        """
+        if fileNames is None:
+            fileNames = [
+                os.path.splitext(os.path.basename(filePath))[0]
+                for filePath in DataLoader.sourceFiles(folderPath, AMV_FILE_PATTERN, 'csv')
+            ]
+        
+        identity = tuple(DataLoader.fileIdentity(folderPath, fileName, 'csv') for fileName in fileNames)
+        ranges = None if ranges is None else tuple(sorted(ranges.items()))
+        df, failedFiles = DataLoader._readMonitoramento(folderPath, tuple(fileNames), dtypes, chunkSize, since, identity, ranges)
+        if failed is not None:
+            failed.extend(failedFiles)
+        return df
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def _readMonitoramento(folderPath, fileNames, dtypes, chunkSize, since, identity, ranges):
+        ranges = dict(ranges or ())
+        chunks = []
+        failed = []
+        for fileName in fileNames:
+            filePath = os.path.join(folderPath, f'{fileName}.csv')
+            
+            try:
+                if not os.path.exists(filePath):
+                    raise FileNotFoundError(f"Arquivo {fileName} não encontrado na pasta {folderPath}.")
+                
+                source = filePath
+                if fileName in ranges:
+                    start, end = ranges[fileName]
+                    with open(filePath, 'rb') as f:
+                        header = f.readline()
+                        start = max(start, f.tell())
+                        if start >= end:
+                            continue
+                        # Somente o trecho novo é lido e convertido, precedido do cabeçalho
+                        f.seek(start)
+                        source = io.BytesIO(header + f.read(end - start))
+                
+                reader = pd.read_csv(
+                    source,
+                    sep=AMV_SEPARATOR,
+                    usecols=list(dtypes),
+                    dtype=dtypes,
+                    chunksize=chunkSize)
+                # Os blocos só são acumulados depois que o arquivo inteiro é lido sem erro
+                fileChunks = []
+                for chunk in reader:
+                    if 'data' in chunk:
+                        chunk['data'] = pd.to_datetime(chunk['data'])
+                    # Removendo Latitude e Longitude zero antes de acumular o bloco
+                    keep = (chunk['latitude'] != 0) & (chunk['longitude'] != 0)
+                    if since:
+                        # Mantendo somente leituras posteriores à marca d'água do dispositivo
+                        lastReading = pd.to_datetime(chunk['device'].astype(str).map(since))
+                        keep &= lastReading.isna() | (chunk['data'] > lastReading)
+                    fileChunks.append(chunk[keep])
+                chunks.extend(fileChunks)
+            except Exception as e:
+                print(f"Erro ao carregar o arquivo de monitoramento {fileName}: {e}")
+                failed.append(fileName)
+        
+        if len(chunks) == 0:
+            return pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in dtypes.items()}), failed
+        
+        df = pd.concat(chunks, ignore_index=True, copy=False)
+        # Blocos com categorias diferentes são concatenados como object: restaurar o tipo categórico
+        for column, dtype in dtypes.items():
+            if dtype == 'category':
+                df[column] = df[column].astype('category')
+        return df, failed
+
+    @staticmethod
+    def loadXLSX(folderPath, fileName, sheetIndex=0):
+        """
+        Carrega dados de um arquivo XLSX em um DataFrame pandas.
+        
+        A planilha é convertida uma única vez para Parquet (em COLUMNAR_PATH) e as cargas
+        seguintes leem o arquivo colunar, até que a identidade do XLSX de origem mude.
+        
+        Parâmetros:
+        - folderPath (str): Caminho para a pasta onde o arquivo XLSX está localizado.
+        - fileName (str): Nome do arquivo XLSX.
+        - sheetIndex (int, opcional): Índice da planilha a ser carregada. Padrão (0).
+        
+        Retorna:
+        - DataFrame: Dados carregados do XLSX.
+        """
+        identity = DataLoader.fileIdentity(folderPath, fileName, 'xlsx')
+        return DataLoader._readXLSX(folderPath, fileName, sheetIndex, identity)
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def _readXLSX(folderPath, fileName, sheetIndex, identity):
+        filePath = os.path.join(folderPath, f'{fileName}.xlsx')
+        
+        try:
+            if os.path.exists(filePath):
+                columnarPath = DataLoader.columnarPath(fileName, sheetIndex, identity)
+                if os.path.exists(columnarPath):
+                    return DataLoader.readColumnar(columnarPath)
+                
+                df = pd.read_excel(filePath, sheet_name=sheetIndex)
+                try:
+                    DataLoader.writeColumnar(df, columnarPath)
+                except Exception as e:
+                    print(f"Não foi possível converter {fileName} para Parquet: {e}")
+                    return df
+                return DataLoader.readColumnar(columnarPath)
+            else:
+                raise FileNotFoundError(f"Arquivo {fileName} não encontrado na pasta {folderPath}.")
+        except Exception as e:
+            print(f"Erro ao carregar o arquivo XLSX: {e}")
+            return None
+
+    @staticmethod
+    def columnarPath(fileName, sheetIndex, identity):
+        """
+        Determina o caminho da cópia colunar de uma planilha. O nome inclui um resumo da
+        identidade do XLSX de origem, de modo que uma planilha alterada gera um novo arquivo.
+        """
+        digest = hashlib.sha1(repr(identity).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(COLUMNAR_PATH, f'{fileName}.{sheetIndex}.{digest}.parquet')
+
+    @staticmethod
+    def writeColumnar(df, columnarPath, index=False):
+        """
+        Grava a cópia colunar de uma planilha (ou de uma camada, em GeoParquet) e remove
+        as cópias obsoletas da mesma planilha.
+        """
+        folderPath = os.path.dirname(columnarPath)
+        os.makedirs(folderPath, exist_ok=True)
+        
+        # Gravação atômica: um processo concorrente nunca lê um Parquet incompleto
+        tmpPath = f'{columnarPath}.{os.getpid()}.tmp'
+        df.to_parquet(tmpPath, index=index)
+        os.replace(tmpPath, columnarPath)
+        
+        prefix = os.path.basename(columnarPath).rsplit('.', 2)[0]
+        for stalePath in glob.glob(os.path.join(folderPath, f'{glob.escape(prefix)}.*.parquet')):
+            if stalePath != columnarPath:
+                os.remove(stalePath)
+
+    @staticmethod
+    def readColumnar(columnarPath):
+        """
+        Lê a cópia colunar de uma planilha. Textos são mantidos em colunas Arrow
+        (string[pyarrow]), sem um objeto Python por célula; números e datas usam os tipos numpy.
+        """
+        table = pq.read_table(columnarPath)
+        return table.to_pandas(types_mapper={pa.string(): pd.StringDtype('pyarrow')}.get)
+
+    @staticmethod
+    def loadSHP(folderPath, shpName, columns=None, filters=None, bbox=None, crs=None, coordinates=None):
+        """
+        Carrega o shapefile dos limites dos bairros em um GeoDataFrame.
+        
+        Parâmetros:
+        - folderPath (str): Caminho para a pasta onde o arquivo XLSX está localizado.
+        - shpName (str): Nome do arquivo shapefile.
+        - columns (list, opcional): Atributos a carregar. Padrão (todos).
+        - filters (dict, opcional): Filtros de igualdade {coluna: valor(es)}, repassados ao leitor
+          (pyogrio) como cláusula WHERE, de modo que apenas as feições selecionadas são decodificadas.
+        - bbox (tuple, opcional): Retângulo (minx, miny, maxx, maxy), no CRS do shapefile.
+        - crs (str, opcional): CRS de destino. A camada reprojetada é gravada em GeoParquet
+          (em GEOMETRY_PATH) e reutilizada até que a identidade do shapefile mude. Padrão (CRS de origem).
+        - coordinates (str, opcional): Coordenadas derivadas gravadas junto com a geometria, nas
+          colunas LON e LAT: 'point' (do próprio ponto) ou 'centroid' (do centroide do polígono).
+        
+        Retorna:
+        - GeoDataFrame: Dados geoespaciais dos bairros. Quando há filtros ou bbox, o índice é o
+          FID da feição, igual ao índice que ela teria numa leitura completa.
+        """
+        identity = DataLoader.fileIdentity(folderPath, shpName, 'shp')
+        if crs is None:
+            return DataLoader._readSHP(folderPath, shpName, columns, filters, bbox, identity)
+        return DataLoader._readProjectedSHP(folderPath, shpName, columns, filters, bbox, crs, coordinates, identity)
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def _readSHP(folderPath, shpName, columns, filters, bbox, identity):
+        filePath = os.path.join(folderPath, f'{shpName}.shp')
+        
+        try:
+            if os.path.exists(filePath):
+                gdf = gpd.read_file(
+                    filePath,
+                    columns=columns,
+                    where=DataLoader.whereClause(filters),
+                    bbox=bbox,
+                    fid_as_index=bool(filters or bbox))
+                return gdf
+            else:
+                raise FileNotFoundError(f"Arquivo {filePath} não encontrado.")
+        except Exception as e:
+            print(f"Erro ao carregar o shapefile: {e}")
+            return None
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def _readProjectedSHP(folderPath, shpName, columns, filters, bbox, crs, coordinates, identity):
+        geometryPath = DataLoader.geometryPath(shpName, (columns, filters, bbox, crs, coordinates), identity)
+        if os.path.exists(geometryPath):
+            return gpd.read_parquet(geometryPath)
+        
+        gdf = DataLoader._readSHP(folderPath, shpName, columns, filters, bbox, identity)
+        if gdf is None:
+            return None
+        
+        gdf = gdf.to_crs(crs=crs)
+        if coordinates == 'point':
+            gdf['LON'] = gdf.geometry.x
+            gdf['LAT'] = gdf.geometry.y
+        elif coordinates == 'centroid':
+            # Centroide calculado em projeção métrica e convertido para o CRS de destino
+            centroids = gdf.geometry.to_crs(crs=CRS_METRICO).centroid.to_crs(crs=crs)
+            gdf['LON'] = centroids.x
+            gdf['LAT'] = centroids.y
+        
+        try:
+            DataLoader.writeColumnar(gdf, geometryPath, index=True)
+        except Exception as e:
+            print(f"Não foi possível gravar a geometria reprojetada de {shpName}: {e}")
+        return gdf
+
+    @staticmethod
+    def geometryPath(shpName, variant, identity):
+        """
+        Determina o caminho da camada reprojetada. O nome inclui um resumo da leitura
+        (atributos, filtros, CRS e coordenadas derivadas) e um resumo da identidade do
+        shapefile, de modo que um shapefile alterado gera um novo arquivo.
+        """
+        variantDigest = hashlib.sha1(repr(variant).encode('utf-8')).hexdigest()[:8]
+        digest = hashlib.sha1(repr(identity).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(GEOMETRY_PATH, f'{shpName}-{variantDigest}.{digest}.parquet')
+
+class MapUtils:
+    @staticmethod
+    def createMap(
+        initialCoords=[-46.633308,-23.55052], 
+        zoomStart=12, 
+        basemap='OpenStreetMap.Mapnik',
+        controlScale=True, 
+        zoomControl=True, 
+        scrollWheelZoom=True, 
+        dragging=True):
+        """
+        Cria um mapa folium com os dados de um GeoDataFrame.
+        
+        Parâmetros:
+        - initialCoords (list): Coordenadas iniciais [latitude, longitude] para centrar o mapa.
+        - zoomStart (int): Nível inicial de zoom do mapa.
+        - controlScale (boolean): Controla o nível de escala no mapa.
+        - zoomControl (boolean): Controles de zoom no mapa.
+        - scrollWheelZoom (boolean): Controla de rolagem no mouse.
+        - dragging (boolean): Controla de movimentação no mapa.
+        
+        Retorna:
+        - folium.Map: Mapa folium com os dados do GeoDataFrame.
+        """
+        # Criar um mapa folium centrado nas coordenadas iniciais
+        attr = (
+            '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> '
+            'contributors, &copy; <a href="https://cartodb.com/attributions">CartoDB</a>'
+        )
+        fmap = folium.Map(
+            location=initialCoords[::-1], 
+            zoom_start=zoomStart, 
+            tiles=basemap,
+            control_scale=controlScale, 
+            zoom_control=zoomControl, 
+            scrollWheelZoom=scrollWheelZoom, 
+            dragging=dragging)
+        
+        return fmap
+
+    @staticmethod
+    def addLayer(
+        geoDF, 
+        layerName=None,
+        styleConfig=None, 
+        popupField=None, 
+        tooltipField=None):
+        """
+        Adiciona uma camada de GeoDataFrame ao mapa folium com a simbologia especificada.
+        
+        Parâmetros:
+        - geoDF (GeoDataFrame): GeoDataFrame com os dados geoespaciais.
+        - layerName (str): Nome da camada.
+        - styleConfig (dict): Configuração de estilo para a camada.
+        - popupField (str): Nome da coluna para exibir em popups (opcional).
+        - tooltipField (str): Nome da coluna para exibir em tooltips (opcional).
+        
+        Retorna:
+        - folium.Map: Objeto de mapa folium com a nova camada adicionada.
+        """
+        # Configuração padrão de estilo
+        defaultStyle = {
+            'fillColor': 'blue',
+            'color': 'blue',
+            'weight': 2,
+            'fillOpacity': 0.6
+        }
+        
+        # Atualizar configuração de estilo com a fornecida pelo usuário
+        if styleConfig:
+            defaultStyle.update(styleConfig)
+        
+        # Adicionar camada ao mapa (TopoJSON quantizado, com os limites compartilhados uma única vez)
+        geojson_layer = MapUtils.topoJsonLayer(
+            geoDF,
+            style_function=lambda feature: defaultStyle
+        )
+        
+        # Adicionar popup se especificado
+        if popupField:
+            popup = GeoJsonPopup(fields=[popupField])
+            geojson_layer.add_child(popup)
+        
+        # Adicionar tooltip se especificado
+        if tooltipField:
+            tooltip = GeoJsonTooltip(fields=[tooltipField])
+            geojson_layer.add_child(tooltip)
+        
+        geojson_layer.layer_name = layerName
+        
+        return geojson_layer
+
+    @staticmethod
+    def removeLayer(fmap, layerName):
+        """
+        Remove uma camada do mapa folium com base no nome da camada.
+        
+        Parâmetros:
+        - fmap (folium.Map): Objeto de mapa folium.
+        - layerName (str): Nome da camada a ser removida.
+        
+        Retorna:
+        - folium.Map: Objeto de mapa folium com a camada removida.
+        """
+        layers_to_remove = [layer for layer in fmap._children if layer == layerName]
+        for layer in layers_to_remove:
+            del fmap._children[layer]
+        return fmap
+    
+    @staticmethod
+    def hasLayer(fmap, layerName):
+        """
+        Remove uma camada do mapa folium com base no nome da camada.
+        
+        Parâmetros:
+        - fmap (folium.Map): Objeto de mapa folium.
+        - layerName (str): Nome da camada a ser removida.
+        
+        Retorna:
+        - folium.Map: Objeto de mapa folium com a camada removida.
+        """
+        foundedLayers = [layer for layer in fmap._children if layer.find(layerName) >= 0]
+        return True if len(foundedLayers) > 0 else False
+    
+    @staticmethod
+    def setZoomLevel(fmap, zoomLevel):
+        """
+        Ajusta o nível de zoom do mapa folium.
+        
+        Parâmetros:
+        - fmap (folium.Map): Objeto de mapa folium.
+        - zoom_level (int): Nível de zoom desejado.
+        
+        Retorna:
+        - folium.Map: Objeto de mapa folium com o nível de zoom ajustado.
+        """
+        fmap.options['zoom'] = zoomLevel
+        return fmap
+
+    @staticmethod
+    def createPoints(df, xField='longitude', yField='latitude', crs="EPSG:4326"):
+        """
+        Geoespacializa um DataFrame de pontos a partir das colunas de coordenadas, em uma única
+        chamada vetorizada. Cada coordenada distinta gera uma só geometria, compartilhada pelos
+        registros nela localizados (ex.: leituras de um sensor fixo).
+        
+        Parâmetros:
+        - df (DataFrame): DataFrame com as colunas de coordenadas.
+        - xField (str): Coluna de longitude.
+        - yField (str): Coluna de latitude.
+        - crs (str): Sistema de referência das coordenadas.
+        
+        Retorna:
+        - GeoDataFrame: DataFrame original com a coluna 'geometry'.
+        """
+        coords = np.column_stack([df[xField].to_numpy(dtype='float64'), df[yField].to_numpy(dtype='float64')])
+        uniqueCoords, inverse = np.unique(coords, axis=0, return_inverse=True)
+        points = gpd.points_from_xy(uniqueCoords[:, 0], uniqueCoords[:, 1], crs=crs)
+        return gpd.GeoDataFrame(df, geometry=points[inverse.ravel()], crs=crs)
+
+    @staticmethod
+    def simplifyLevels(geoDF, keyField, levels=PIRAMIDE_NIVEIS, crs=CRS_METRICO, grid=PIRAMIDE_GRADE):
+        """
+        Gera versões simplificadas das geometrias de uma camada, uma por nível da pirâmide.
+        A simplificação é feita sobre a rede de arcos da camada (ver MapUtils.arcTopology): cada
+        limite compartilhado é simplificado uma única vez, de modo que feições vizinhas continuam
+        com os mesmos vértices ao longo da divisa, e arcos simplificados que passariam a se cruzar
+        são simplificados novamente com tolerância menor (ver MapUtils.simplifyArcs). Assim nenhum
+        nível cria frestas ou sobreposições além das que já existem na camada original.
+        
+        Parâmetros:
+        - geoDF (GeoDataFrame): Camada original.
+        - keyField (str): Coluna que identifica cada feição (ex.: 'nome', 'COD_SETOR').
+        - levels (dict): Zoom mínimo de cada nível → tolerância em metros. Padrão (PIRAMIDE_NIVEIS).
+        - crs (str): Projeção métrica em que a tolerância é aplicada. Padrão (CRS_METRICO).
+        - grid (float): Grade de ajuste dos vértices, em metros. Padrão (PIRAMIDE_GRADE).
+        
+        Retorna:
+        - GeoDataFrame: Colunas NIVEL (zoom mínimo), CHAVE (texto) e geometry, no CRS da camada.
+        """
+        keys = geoDF[keyField].astype(str).to_numpy()
+        geometries = geoDF.geometry.to_crs(crs=crs)
+        
+        # Topologia construída uma única vez, em uma grade inteira de passo grid
+        x0, y0 = geometries.total_bounds[:2] if not geometries.empty else (0.0, 0.0)
+        translate, scale = np.array([x0, y0]), np.array([grid, grid])
+        features = MapUtils.gridRings(geometries, translate, scale)
+        arcs, references = MapUtils.arcTopology(features)
+        
+        if arcs:
+            lines = linestrings(
+                np.vstack(arcs) * scale + translate,
+                indices=np.repeat(np.arange(len(arcs)), [len(arc) for arc in arcs]))
+            # Cruzamentos já existentes na camada original não são atribuídos à simplificação
+            sourceConflicts = MapUtils.arcConflicts(lines)
+        
+        pyramid = []
+        for level, tolerance in levels.items():
+            if tolerance > 0 and arcs:
+                levelLines = MapUtils.simplifyArcs(lines, tolerance, grid, sourceConflicts)
+                simplified = MapUtils.rebuildPolygons(references, [get_coordinates(line) for line in levelLines])
+                # Feições que colapsaram por inteiro mantêm a geometria original
+                simplified = [
+                    geometry if geometry is not None else original
+                    for geometry, original in zip(simplified, geometries.to_numpy())
+                ]
+                simplified = gpd.GeoSeries(simplified, crs=crs)
+            else:
+                simplified = geometries
+            pyramid.append(gpd.GeoDataFrame(
+                {'NIVEL': np.full(len(keys), level, dtype='int8'), 'CHAVE': keys},
+                geometry=simplified.to_crs(crs=geoDF.crs).to_numpy(),
+                crs=geoDF.crs))
+        
+        return pd.concat(pyramid, ignore_index=True)
+
+    @staticmethod
+    def simplifyArcs(lines, tolerance, grid, allowed=frozenset()):
+        """
+        Simplifica os arcos de uma camada (Douglas-Peucker, que mantém as extremidades, isto é, as
+        junções entre feições). Os arcos envolvidos em um cruzamento criado pela simplificação têm a
+        tolerância reduzida à metade e são simplificados novamente, até que não reste nenhum
+        cruzamento; abaixo da grade, o arco é mantido sem simplificação.
+        
+        Parâmetros:
+        - lines (ndarray): Arcos originais (LineString).
+        - tolerance (float): Tolerância da simplificação, em unidades do CRS.
+        - grid (float): Menor tolerância aplicada (ver PIRAMIDE_GRADE).
+        - allowed (set): Conflitos já existentes nos arcos originais (ver MapUtils.arcConflicts), ignorados.
+        
+        Retorna:
+        - ndarray: Arcos simplificados, na ordem de lines.
+        """
+        tolerances = np.full(len(lines), float(tolerance))
+        simplified = lines.copy()
+        pending = np.arange(len(lines))
+        while len(pending):
+            active = pending[tolerances[pending] >= grid]
+            tolerances[pending[tolerances[pending] < grid]] = 0.0
+            simplified[active] = simplify(lines[active], tolerances[active], preserve_topology=False)
+            # Anel isolado que colapsaria: mantido sem simplificação
+            collapsed = active[is_closed(lines[active]) & (get_num_points(simplified[active]) < 4)]
+            simplified[collapsed], tolerances[collapsed] = lines[collapsed], 0.0
+            
+            conflicts = MapUtils.arcConflicts(simplified) - allowed
+            pending = np.array(sorted({arc for pair in conflicts for arc in pair if tolerances[arc] > 0}), dtype='int64')
+            tolerances[pending] /= 2
+            simplified[pending] = lines[pending]
+        return simplified
+
+    @staticmethod
+    def arcConflicts(lines):
+        """
+        Identifica os arcos que se cruzam, se sobrepõem ou tocam outro arco fora das extremidades
+        (em uma rede de arcos válida, dois arcos só se encontram nas junções).
+        
+        Parâmetros:
+        - lines (ndarray): Arcos (LineString).
+        
+        Retorna:
+        - set: Pares (i, j), com i < j, de arcos em conflito; (i, i) para um arco que cruza a si mesmo.
+        """
+        left, right = STRtree(lines).query(lines, predicate='intersects')
+        pairs = left < right
+        left, right = left[pairs], right[pairs]
+        # Interiores disjuntos entre si e das extremidades do outro arco
+        conflict = ~relate_pattern(lines[left], lines[right], 'FF*F*****')
+        conflicts = set(zip(left[conflict].tolist(), right[conflict].tolist()))
+        conflicts.update((arc, arc) for arc in np.flatnonzero(~is_simple(lines)).tolist())
+        return conflicts
+
+    @staticmethod
+    def gridRings(geometries, translate, scale):
+        """
+        Extrai os anéis de cada feição poligonal, com as coordenadas ajustadas a uma grade inteira
+        (vértices consecutivos repetidos são removidos).
+        
+        Parâmetros:
+        - geometries (GeoSeries): Geometrias (Polygon / MultiPolygon).
+        - translate (ndarray): Origem da grade.
+        - scale (ndarray): Passo da grade em cada eixo.
+        
+        Retorna:
+        - list: Anéis por feição: [feição][polígono][anel] → pontos inteiros (primeiro = último).
+        """
+        def toGrid(coords):
+            q = np.rint((np.asarray(coords)[:, :2] - translate) / scale).astype('int64')
+            keep = np.r_[True, np.any(q[1:] != q[:-1], axis=1)]
+            return q[keep]
+        
+        features = []
+        for geometry in geometries:
+            polygons = [] if geometry is None or geometry.is_empty else getattr(geometry, 'geoms', [geometry])
+            rings = [[toGrid(polygon.exterior.coords)] + [toGrid(ring.coords) for ring in polygon.interiors] for polygon in polygons]
+            features.append([[ring for ring in polygon if len(ring) >= 4] for polygon in rings])
+        return features
+
+    @staticmethod
+    def arcTopology(features):
+        """
+        Decompõe os anéis de uma camada em arcos: trechos entre junções (pontos em que os vizinhos
+        de um vértice mudam, início ou fim de um limite compartilhado). Um limite compartilhado
+        entre feições vizinhas vira um único arco, referenciado no sentido direto ou inverso (~id).
+        
+        Parâmetros:
+        - features (list): Anéis por feição (ver MapUtils.gridRings).
+        
+        Retorna:
+        - tuple: (arcos, referências), com as referências por feição: [feição][polígono][anel] → ids dos arcos.
+        """
+        neighbours = {}
+        for polygons in features:
+            for polygon in polygons:
+                for ring in polygon:
+                    points = list(map(tuple, ring[:-1]))
+                    for position, point in enumerate(points):
+                        pair = tuple(sorted((points[position - 1], points[(position + 1) % len(points)])))
+                        neighbours.setdefault(point, set()).add(pair)
+        junctions = {point for point, pairs in neighbours.items() if len(pairs) > 1}
+        
+        arcs, arcIndex = [], {}
+        
+        def arcId(arc):
+            key, reverseKey = arc.tobytes(), arc[::-1].tobytes()
+            if key in arcIndex:
+                return arcIndex[key]
+            if reverseKey in arcIndex:
+                return ~arcIndex[reverseKey]
+            arcIndex[key] = len(arcs)
+            arcs.append(arc)
+            return arcIndex[key]
+        
+        def ringArcs(ring):
+            points = ring[:-1]
+            cuts = [position for position, point in enumerate(map(tuple, points)) if point in junctions]
+            if not cuts:
+                # Anel sem junções: início no menor ponto, para que anéis idênticos gerem o mesmo arco
+                cuts = [min(range(len(points)), key=lambda position: tuple(points[position]))]
+            points = np.roll(points, -cuts[0], axis=0)
+            cuts = [position - cuts[0] for position in cuts] + [len(points)]
+            points = np.vstack([points, points[:1]])
+            return [arcId(points[start:end + 1]) for start, end in zip(cuts[:-1], cuts[1:])]
+        
+        references = [[[ringArcs(ring) for ring in polygon] for polygon in polygons if polygon] for polygons in features]
+        return arcs, references
+
+    @staticmethod
+    def rebuildPolygons(references, arcs):
+        """
+        Reconstrói os polígonos de cada feição a partir dos arcos (ex.: após a simplificação).
+        Anéis que colapsaram são descartados; polígonos inválidos são corrigidos (make_valid).
+        
+        Parâmetros:
+        - references (list): Referências aos arcos por feição (ver MapUtils.arcTopology).
+        - arcs (list): Coordenadas de cada arco.
+        
+        Retorna:
+        - list: Geometria de cada feição (Polygon / MultiPolygon), ou None se todos os anéis colapsaram.
+        """
+        def ringCoords(ringArcs):
+            parts = [arcs[arc] if arc >= 0 else arcs[~arc][::-1] for arc in ringArcs]
+            coords = np.vstack([parts[0]] + [part[1:] for part in parts[1:]])
+            keep = np.r_[True, np.any(coords[1:] != coords[:-1], axis=1)]
+            return coords[keep]
+        
+        geometries = []
+        for polygonArcs in references:
+            polygons = []
+            for ringsArcs in polygonArcs:
+                rings = [ringCoords(ringArcs) for ringArcs in ringsArcs]
+                if len(rings[0]) < 4:
+                    continue
+                polygon = Polygon(rings[0], [ring for ring in rings[1:] if len(ring) >= 4])
+                if not polygon.is_valid:
+                    polygon = MultiPolygon([part for part in get_parts(make_valid(polygon)) if isinstance(part, Polygon)])
+                polygons.extend(getattr(polygon, 'geoms', [polygon]))
+            polygons = [polygon for polygon in polygons if not polygon.is_empty]
+            if not polygons:
+                geometries.append(None)
+            else:
+                geometries.append(polygons[0] if len(polygons) == 1 else MultiPolygon(polygons))
+        return geometries
+
+    @staticmethod
+    def simplifiedGeometry(geoDF, DF_PIRAMIDE, layerName, zoom, keyField, levels=PIRAMIDE_NIVEIS):
+        """
+        Substitui as geometrias de uma camada pelas do nível da pirâmide adequado ao zoom do mapa
+        (o de maior zoom mínimo não superior a ele). Feições sem versão simplificada são mantidas.
+        
+        Parâmetros:
+        - geoDF (GeoDataFrame): Camada a ser exibida.
+        - DF_PIRAMIDE (GeoDataFrame): Geometrias simplificadas (ver Pipeline.buildPiramide).
+        - layerName (str): Camada na pirâmide (coluna CAMADA, ex.: 'BAIRROS').
+        - zoom (int): Nível de zoom em que o mapa é renderizado.
+        - keyField (str): Coluna de geoDF correspondente à CHAVE da pirâmide.
+        - levels (dict): Níveis da pirâmide. Padrão (PIRAMIDE_NIVEIS).
+        
+        Retorna:
+        - GeoDataFrame: Cópia da camada com as geometrias simplificadas.
+        """
+        if DF_PIRAMIDE is None or geoDF.empty:
+            return geoDF
+        
+        level = max([minZoom for minZoom in levels if minZoom <= zoom], default=min(levels))
+        DF_NIVEL = DF_PIRAMIDE[(DF_PIRAMIDE['CAMADA'] == layerName) & (DF_PIRAMIDE['NIVEL'] == level)]
+        geometries = pd.Series(DF_NIVEL.geometry.to_numpy(), index=DF_NIVEL['CHAVE'].to_numpy())
+        
+        geoDF = geoDF.copy()
+        simplified = geoDF[keyField].astype(str).map(geometries)
+        found = simplified.notna().to_numpy()
+        geoDF.loc[found, geoDF.geometry.name] = simplified[found].to_numpy()
+        return geoDF
+
+    @staticmethod
+    def toTopoJSON(geoDF, objectName='layer', quantization=TOPOJSON_QUANTIZACAO):
+        """
+        Codifica uma camada de polígonos em TopoJSON: coordenadas quantizadas em uma grade inteira,
+        arcos com codificação delta e limites compartilhados entre feições vizinhas armazenados
+        uma única vez (cada feição referencia o arco, no sentido direto ou inverso).
+        
+        Parâmetros:
+        - geoDF (GeoDataFrame): Camada de polígonos (Polygon / MultiPolygon).
+        - objectName (str): Nome do objeto na topologia.
+        - quantization (int): Número de posições da grade em cada eixo. Padrão (TOPOJSON_QUANTIZACAO).
+        
+        Retorna:
+        - dict: Topologia, com as demais colunas como propriedades de cada geometria.
+        """
+        x0, y0, x1, y1 = geoDF.total_bounds if not geoDF.empty else (0.0, 0.0, 1.0, 1.0)
+        scale = np.array([(x1 - x0) / (quantization - 1) or 1.0, (y1 - y0) / (quantization - 1) or 1.0])
+        translate = np.array([x0, y0])
+        
+        # Anéis quantizados e limites compartilhados decompostos em arcos
+        features = MapUtils.gridRings(geoDF.geometry, translate, scale)
+        arcs, references = MapUtils.arcTopology(features)
+        
+        properties = json.loads(geoDF.drop(columns=geoDF.geometry.name).to_json(orient='records', force_ascii=False))
+        geometries = []
+        for polygonArcs, featureProperties in zip(references, properties):
+            if not polygonArcs:
+                geometries.append({'type': None, 'properties': featureProperties})
+            elif len(polygonArcs) == 1:
+                geometries.append({'type': 'Polygon', 'arcs': polygonArcs[0], 'properties': featureProperties})
+            else:
+                geometries.append({'type': 'MultiPolygon', 'arcs': polygonArcs, 'properties': featureProperties})
+        
+        return {
+            'type': 'Topology',
+            'transform': {'scale': scale.tolist(), 'translate': translate.tolist()},
+            'objects': {objectName: {'type': 'GeometryCollection', 'geometries': geometries}},
+            'arcs': [np.vstack([arc[:1], np.diff(arc, axis=0)]).tolist() for arc in arcs],
+        }
+
+    @staticmethod
+    def topoJsonLayer(geoDF, popup=None, **kwargs):
+        """
+        Cria uma camada folium a partir de um GeoDataFrame codificado em TopoJSON (ver MapUtils.toTopoJSON).
+        
+        Parâmetros:
+        - geoDF (GeoDataFrame): Camada de polígonos.
+        - popup (GeoJsonPopup, opcional): Popup da camada.
+        - kwargs: Demais argumentos de folium.TopoJson (style_function, tooltip, name, show...).
+        
+        Retorna:
+        - folium.TopoJson: Camada TopoJSON.
+        """
+        layer = TopoJson(MapUtils.toTopoJSON(geoDF, 'layer'), object_path='objects.layer', **kwargs)
+        if popup is not None:
+            layer.add_child(popup)
+        return layer
+
+class ChartUtils:
+    @staticmethod
+    def createGauge(title, value=50, min=0, max=100, 
+                    chartColor="orange", shadownColor="yellow", theme='light'):
+        fig = go.Figure(go.Indicator(
+            mode="gauge+number",
+            value=value,
+            gauge={
+                'axis': {'range': [min, max]},
+                'bar': {'color': chartColor},
+                'steps': [
+                    {'range': [min, value], 'color': shadownColor},
+                    {'range': [value, max], 'color': "lightgray"}
+                ]
+            }
+        ))
+        
+        if (theme=='dark'):
+            fig.update_layout(
+                height=300,
+                paper_bgcolor="black",
+                plot_bgcolor="black",
+                template="plotly_dark",
+                # title_font_family='Arial',
+                title_text=title,
+                title_font_size=20,
+                title_font_weight='bold',
+                title_xanchor='center',
+                title_yanchor='top',
+                title_x=0.5,
+                title_y=0.9,
+            )
+        else:
+            fig.update_layout(
+                height=300,
+                # paper_bgcolor="#FFFFFF",
+                # plot_bgcolor="#FFFFFF",
+                template="plotly_white",
+                # title_font_family='Arial',
+                title_text=title,
+                title_font_size=20,
+                title_font_weight='bold',
+                title_xanchor='center',
+                title_yanchor='top',
+                title_x=0.5,
+                title_y=0.9,
+            )
+        
+        return fig
+
+    @staticmethod
+    def createSensorGauges(statistics, titles, placeholder=False, theme='light'):
+        """
+        Cria os indicadores (gauges) dos sensores a partir de um único resultado de estatísticas.
+        As faixas de cor são delimitadas a 25% e 75% da amplitude (ver getGaugeIndicatorColors).
+        
+        Parâmetros:
+        - statistics (DataFrame): Estatísticas por sensor (ver Utils.sensorStatistics e Cubo.statistics).
+        - titles (dict): Título do indicador de cada sensor, na ordem de exibição.
+        - placeholder (bool, opcional): Exibir indicadores neutros, sem seleção. Padrão (False).
+        - theme (str, opcional): Tema dos gráficos ('light' ou 'dark'). Padrão ('light').
+        
+        Retorna:
+        - list: Figuras dos indicadores, na ordem de titles.
+        """
+        charts = []
+        for sensor, title in titles.items():
+            if placeholder:
+                minimum, maximum, mean = 0, 1, 0
+            else:
+                minimum, maximum, mean = statistics.loc[sensor, ['min', 'max', 'mean']]
+            
+            chartColor, chartShadown = ChartUtils.getGaugeIndicatorColors(
+                mean,
+                minimum + 0.25 * (maximum - minimum),
+                minimum + 0.75 * (maximum - minimum))
+            charts.append(ChartUtils.createGauge(
+                title=title,
+                value=mean,
+                min=minimum,
+                max=maximum,
+                chartColor=f"{chartColor}",
+                shadownColor=f"{chartShadown}",
+                theme=theme))
+        return charts
+
+    @staticmethod
+    def getGaugeIndicatorColors(currentValue, cutoff25, cutoff75):
+        # Determinando as Cores dos Gráficos
+        colorGreen  = {"title":"Normal",  "color": "#4FBA74", "shadown": "#3FA261"}
+        colorOrange = {"title":"Atenção", "color": "#FCAB10", "shadown": "#F29E02"}
+        colorRed    = {"title":"Alerta",  "color": "#F6131E", "shadown": "#D90812"}
+
+        chartColor   = colorOrange["color"]
+        chartShadown = colorOrange["shadown"]
+        if currentValue < cutoff25:
+            chartColor   = colorGreen["color"]
+            chartShadown = colorGreen["shadown"]
+        elif currentValue > cutoff75:
+            chartColor   = colorRed["color"]
+            chartShadown = colorRed["shadown"]
+            
+        return chartColor, chartShadown
+    
+    @staticmethod
+    def createRadar(title,
+                    dataframe, 
+                    fieldClasses, 
+                    colors=px.colors.sequential.Turbo, 
+                    theme='light'):
+        if (dataframe.empty == False):
+            plotDF = pd.melt(dataframe, id_vars=fieldClasses, var_name='theta', value_name='r')
+        else:
+            plotDF = pd.DataFrame({
+                f'{fieldClasses}': ['','','','','',''],
+                'theta': ['Temperatura', 'Umidade', 'Luminosidade', 'Ruído', 'CO₂', 'ETVOC'],
+                'r': [0, 0, 0, 0, 0, 0],
+                'label': [0, 0, 0, 0, 0, 0]
+            })
+        
+        plotDF.rename(
+            columns={
+                f'{fieldClasses}': f'{fieldClasses.title()}',
+                'theta': 'Categoria',
+                'r': 'Valor'
+            },
+            inplace=True
+        )
+        
+        # fig = go.Figure()
+        # fig.add_trace(
+        #     go.Scatterpolar(
+        #         r = dataframe['r'],
+        #         theta = dataframe['theta'],
+        #         mode = 'lines'
+        #     )
+        # )
+        
+        fig = px.line_polar(
+            plotDF,
+            r='Valor',
+            theta='Categoria',
+            title=title,
+            color=f'{fieldClasses.title()}',
+            line_close=True,
+            color_discrete_sequence=colors,
+            markers=True
+        )
+        
+        fig.update_traces(line={'width': 3},fill='toself')
+        
+        if (theme=='dark'):
+            fig.update_layout(
+                height=800,
+                paper_bgcolor="black",
+                plot_bgcolor="black",
+                template="plotly_dark",
+                # title_font_family='Arial',
+                title_font_size=20,
+                title_font_weight='bold',
+                title_xanchor='center',
+                title_yanchor='top',
+                title_x=0.5,
+                title_y=0.95,
+                # showlegend=False,
+                legend_title='LEGENDA',
+                legend_orientation='h',
+            ) 
+        else:
+            fig.update_layout(
+                height=800,
+                paper_bgcolor="white",
+                plot_bgcolor="white",
+                template="plotly_white",
+                # title_font_family='Arial',
+                title_font_size=20,
+                title_font_weight='bold',
+                title_xanchor='center',
+                title_yanchor='top',
+                title_x=0.5,
+                title_y=0.95,
+                # showlegend=False,
+                # legend_title='LEGENDA',
+                legend_orientation='h',
+                
+                polar_angularaxis_color='#000',
+                polar_angularaxis_gridcolor='#FFF',
+                polar_angularaxis_gridwidth=3,
+                polar_angularaxis_griddash='solid',
+                polar_angularaxis_linecolor='#AAA',
+                polar_angularaxis_linewidth=1,
+                polar_angularaxis_tickcolor='#AAA',
+                
+                polar_radialaxis_color='#000',
+                polar_radialaxis_gridcolor='#FFF',
+                polar_radialaxis_gridwidth=3,
+                polar_radialaxis_griddash='dot',
+                polar_radialaxis_linecolor='#FFF',
+                
+                polar_bgcolor='#F0F0F0',
+            )
+        
+        return fig
+
+class Utils:
+  # Código de CATEGORIAS_PERIODO para cada hora do dia (0-23)
+  PERIODO_POR_HORA = np.array(
+    [next(code for code, hours in enumerate(PERIODOS_DIA.values()) if hour in hours) for hour in range(24)],
+    dtype='int8')
+
+  @staticmethod
+  def temporalFeatures(df, column='data'):
+    """
+    Deriva os campos temporais (F_PERIODO, F_HORA, F_MINUTO, F_DIA, F_MES, F_ANO e F_DIA_SEMANA)
+    de uma coluna datetime. Os campos são calculados a partir da representação inteira das datas,
+    com aritmética e tabelas de consulta vetorizadas, já nos tipos de SCHEMA_CAMPOS_DATA.
+    
+    Parâmetros:
+    - df (DataFrame): DataFrame com a coluna datetime. Registros sem data são descartados.
+    - column (str): Nome da coluna datetime.
+    
+    Retorna:
+    - DataFrame: DataFrame com os campos temporais.
+    """
+    df = df[df[column].notna()].copy()
+    
+    instants = df[column].to_numpy(dtype='datetime64[ns]')
+    days = instants.astype('datetime64[D]')
+    months = days.astype('datetime64[M]')
+    secondsOfDay = (instants - days).astype('timedelta64[s]').astype('int64')
+    hours = (secondsOfDay // 3600).astype('int8')
+    
+    df['F_PERIODO'] = pd.Categorical.from_codes(Utils.PERIODO_POR_HORA[hours], dtype=CATEGORIAS_PERIODO)
+    df['F_HORA'] = hours
+    df['F_MINUTO'] = (secondsOfDay // 60 % 60).astype('int8')
+    df['F_DIA'] = ((days - months).astype('int64') + 1).astype('int8')
+    df['F_MES'] = (months.astype('int64') % 12 + 1).astype('int8')
+    df['F_ANO'] = (months.astype('int64') // 12 + 1970).astype('int16')
+    # 1970-01-01 foi uma quinta-feira: deslocar para que segunda-feira (SEG) seja o código 0
+    df['F_DIA_SEMANA'] = pd.Categorical.from_codes(((days.astype('int64') + 3) % 7).astype('int8'), dtype=CATEGORIAS_DIA_SEMANA)
+    
+    return df
+
+  @staticmethod
+  def sortByTime(df, column='data'):
+    """
+    Ordena um DataFrame pela coluna datetime (ordenação estável), se ainda não estiver ordenado.
+    
+    Parâmetros:
+    - df (DataFrame): DataFrame com a coluna datetime.
+    - column (str): Nome da coluna datetime.
+    
+    Retorna:
+    - DataFrame: DataFrame ordenado por column, com índice sequencial.
+    """
+    if df[column].is_monotonic_increasing:
+      return df
+    return df.sort_values(column, kind='stable', ignore_index=True)
+
+  @staticmethod
+  def timestamp(ano, mes, dia, hora=0, minuto=0):
+    """
+    Combina os campos de data e hora do filtro em um Timestamp. Dias além do fim do
+    mês (ex.: 31/02) são ajustados para o último dia do mês.
+    
+    Retorna:
+    - Timestamp: Data e hora combinadas.
+    """
+    inicioMes = pd.Timestamp(year=int(ano), month=int(mes), day=1)
+    return inicioMes.replace(day=min(int(dia), inicioMes.days_in_month), hour=int(hora), minute=int(minuto))
+
+  @staticmethod
+  def timeSlice(df, start=None, end=None, column='data'):
+    """
+    Seleciona os registros no intervalo [start, end) por busca binária sobre a coluna datetime,
+    que deve estar ordenada (ver Utils.sortByTime). O resultado é uma fatia contígua, sem máscaras.
+    
+    Parâmetros:
+    - df (DataFrame): DataFrame ordenado pela coluna datetime.
+    - start (Timestamp, opcional): Início do intervalo (inclusive). Padrão (sem limite).
+    - end (Timestamp, opcional): Fim do intervalo (exclusive). Padrão (sem limite).
+    - column (str): Nome da coluna datetime.
+    
+    Retorna:
+    - DataFrame: Registros do intervalo.
+    """
+    first, last = Utils.timeBounds(df, start, end, column)
+    return df.iloc[first:last]
+
+  @staticmethod
+  def timeBounds(df, start=None, end=None, column='data'):
+    """
+    Localiza por busca binária as linhas do intervalo [start, end) na coluna datetime ordenada.
+    
+    Parâmetros:
+    - df (DataFrame): DataFrame ordenado pela coluna datetime.
+    - start (Timestamp, opcional): Início do intervalo (inclusive). Padrão (sem limite).
+    - end (Timestamp, opcional): Fim do intervalo (exclusive). Padrão (sem limite).
+    - column (str): Nome da coluna datetime.
+    
+    Retorna:
+    - tuple: Posições (first, last) da fatia df.iloc[first:last].
+    """
+    instants = df[column].to_numpy(dtype='datetime64[ns]')
+    first = 0 if start is None else int(np.searchsorted(instants, np.datetime64(start, 'ns'), side='left'))
+    last = len(instants) if end is None else int(np.searchsorted(instants, np.datetime64(end, 'ns'), side='left'))
+    return first, max(first, last)
+
+  @staticmethod
+  @lru_cache(maxsize=None)
+  def normalizeName(value):
+    """
+    Normaliza um nome (sem acentos, em maiúsculas e sem espaços repetidos). Memorizada por valor.
+    
+    Parâmetros:
+    - value (str): Nome original.
+    
+    Retorna:
+    - str: Nome normalizado.
+    """
+    return ' '.join(unidecode(str(value)).upper().split())
+
+  @staticmethod
+  def normalizeNames(values, aliases=NOMES_ALIASES):
+    """
+    Normaliza uma coluna de nomes (bairros, municípios). Cada valor distinto é normalizado
+    uma única vez e o resultado é distribuído às linhas pelos códigos categóricos.
+    
+    Parâmetros:
+    - values (Series): Coluna de nomes.
+    - aliases (dict): Grafias alternativas (nome normalizado → nome canônico).
+    
+    Retorna:
+    - Series: Coluna categórica de nomes canônicos, com o mesmo índice. Valores ausentes
+      resultam em 'NAN', como na normalização de str(valor).
+    """
+    codes, uniques = pd.factorize(values)
+    
+    # O código -1 (valor ausente) indexa o último elemento
+    names = [Utils.normalizeName(value) for value in uniques] + [Utils.normalizeName(np.nan)]
+    names = [aliases.get(name, name) for name in names]
+    
+    # Grafias diferentes podem resultar no mesmo nome canônico: recodificar os nomes distintos
+    nameCodes, categories = pd.factorize(np.array(names, dtype=object))
+    return pd.Series(
+      pd.Categorical.from_codes(nameCodes[codes], categories=categories),
+      index=values.index,
+      name=values.name)
+
+  @staticmethod
+  def classifyCrimes(tipoFato, descFato, rules=CRIME_REGRAS, default=CRIME_CLASSE_PADRAO):
+    """
+    Classifica as ocorrências pela tabela de regras, avaliada sobre as colunas inteiras.
+    
+    Parâmetros:
+    - tipoFato (Series): Coluna 'Tipo Fato' (ex.: 'Tentado', 'Consumado').
+    - descFato (Series): Coluna 'Desc Fato'.
+    - rules (list): Regras (Tipo Fato, termo, classe); vale a primeira regra satisfeita.
+    - default (str): Classe das ocorrências que não satisfazem nenhuma regra.
+    
+    Retorna:
+    - Categorical: Classe de cada ocorrência.
+    """
+    tipoFato = tipoFato.astype(str).to_numpy()
+    descFato = descFato.fillna('').astype(str)
+    
+    # Cada termo e cada tipo é avaliado uma única vez, mesmo que apareça em várias regras
+    termos = {termo: descFato.str.contains(termo, regex=False).to_numpy() for _, termo, _ in rules}
+    tipos = {tipo: tipoFato == tipo for tipo, _, _ in rules}
+    
+    classes = np.select(
+      [tipos[tipo] & termos[termo] for tipo, termo, _ in rules],
+      [classe for _, _, classe in rules],
+      default=default)
+    return pd.Categorical(classes, categories=list(dict.fromkeys([classe for _, _, classe in rules] + [default])))
+
+  @staticmethod
+  def moments(count, total, totalSquares):
+    """
+    Calcula a média e o desvio padrão amostral a partir da contagem, da soma e da soma dos quadrados.
+    
+    Parâmetros:
+    - count (array): Número de valores.
+    - total (array): Soma dos valores.
+    - totalSquares (array): Soma dos quadrados dos valores.
+    
+    Retorna:
+    - tuple: (média, desvio padrão), NaN onde não houver valores suficientes.
+    """
+    count = np.asarray(count, dtype='float64')
+    total = np.asarray(total, dtype='float64')
+    totalSquares = np.asarray(totalSquares, dtype='float64')
+    with np.errstate(invalid='ignore', divide='ignore'):
+      mean = np.where(count > 0, total / count, np.nan)
+      # Variância amostral (ddof=1), como DataFrame.std; limitada a zero contra erros de arredondamento
+      variance = np.where(count > 1, (totalSquares - count * mean * mean) / (count - 1), np.nan)
+    return mean, np.sqrt(np.clip(variance, 0, None))
+
+  @staticmethod
+  def sensorStatistics(df, columns=SENSORES, percentiles=None):
+    """
+    Calcula todas as estatísticas de todos os sensores sobre um único bloco contíguo de
+    valores (linhas × sensores), com reduções vetorizadas por coluna.
+    
+    Parâmetros:
+    - df (DataFrame): Leituras de monitoramento.
+    - columns (list, opcional): Colunas dos sensores. Padrão (SENSORES).
+    - percentiles (list, opcional): Percentis calculados (0 a 100), como colunas p<percentil>. Padrão (nenhum).
+    
+    Retorna:
+    - DataFrame: Uma linha por sensor, com as colunas count, min, max, mean, std e os percentis.
+    """
+    block = np.ascontiguousarray(df[columns].to_numpy(dtype='float64'))
+    present = ~np.isnan(block)
+    filled = np.where(present, block, 0.0)
+    
+    count = present.sum(axis=0)
+    mean, std = Utils.moments(count, filled.sum(axis=0), np.einsum('ij,ij->j', filled, filled))
+    statistics = pd.DataFrame({
+      'count': count,
+      # fmin/fmax ignoram NaN; sensores sem leituras ficam com NaN
+      'min': np.where(count > 0, np.fmin.reduce(block, axis=0, initial=np.inf), np.nan),
+      'max': np.where(count > 0, np.fmax.reduce(block, axis=0, initial=-np.inf), np.nan),
+      'mean': mean,
+      'std': std,
+    }, index=list(columns))
+    
+    for percentile in (percentiles or []):
+      if count.any():
+        with warnings.catch_warnings():
+          warnings.simplefilter('ignore', RuntimeWarning)
+          statistics[f'p{percentile}'] = np.nanpercentile(block, percentile, axis=0)
+      else:
+        statistics[f'p{percentile}'] = np.nan
+    return statistics
+
+class IndiceBairros:
+    """
+    Atribuição de bairro a pontos: o índice espacial (STRtree) dos limites de bairros é
+    construído uma única vez por conjunto de limites e a atribuição é memorizada por
+    coordenada (lon, lat), de modo que o custo acompanha o número de localizações distintas
+    (ex.: sensores fixos) e não o número de registros.
+    """
+    _INDICES = {}
+    _INDICES_GUARD = threading.Lock()
+
+    @staticmethod
+    def get(DF_BAIRROS_PLG, nameField='nome'):
+        """
+        Obtém o índice espacial de um conjunto de limites de bairros, construindo-o na primeira chamada.
+        
+        Parâmetros:
+        - DF_BAIRROS_PLG (GeoDataFrame): Limites de bairros (EPSG:4326).
+        - nameField (str): Coluna com o nome do bairro.
+        
+        Retorna:
+        - dict: Árvore ('tree'), nomes dos bairros ('names') e cache de atribuições por coordenada ('coords').
+        """
+        geometries = DF_BAIRROS_PLG.geometry.to_numpy()
+        names = DF_BAIRROS_PLG[nameField].astype(object).to_numpy()
+        
+        # Os limites são identificados pelo conteúdo, seja qual for a origem (etapa do ETL ou snapshot)
+        digest = hashlib.sha1(b''.join(to_wkb(geometries)))
+        digest.update('|'.join(map(str, names)).encode('utf-8'))
+        key = digest.hexdigest()
+        
+        with IndiceBairros._INDICES_GUARD:
+            index = IndiceBairros._INDICES.get(key)
+            if index is None:
+                index = {'tree': STRtree(geometries), 'names': names, 'coords': {}, 'lock': threading.Lock()}
+                IndiceBairros._INDICES[key] = index
+        return index
+
+    @staticmethod
+    def lookup(DF_BAIRROS_PLG, lon, lat, nameField='nome'):
+        """
+        Atribui a cada ponto o bairro que o contém. Somente coordenadas ainda não
+        consultadas são testadas na árvore; as demais vêm do cache.
+        
+        Parâmetros:
+        - DF_BAIRROS_PLG (GeoDataFrame): Limites de bairros (EPSG:4326).
+        - lon (array-like): Longitudes dos pontos.
+        - lat (array-like): Latitudes dos pontos.
+        - nameField (str): Coluna com o nome do bairro.
+        
+        Retorna:
+        - Categorical: Nome do bairro de cada ponto (ausente para pontos fora dos limites).
+        """
+        index = IndiceBairros.get(DF_BAIRROS_PLG, nameField)
+        
+        coords = np.column_stack([np.asarray(lon, dtype='float64'), np.asarray(lat, dtype='float64')])
+        uniqueCoords, inverse = np.unique(coords, axis=0, return_inverse=True)
+        
+        cache = index['coords']
+        names = np.array([cache.get(xy) for xy in map(tuple, uniqueCoords)], dtype=object)
+        missing = np.array([tuple(xy) not in cache for xy in uniqueCoords], dtype=bool)
+        
+        if missing.any():
+            points = gpd.points_from_xy(uniqueCoords[missing, 0], uniqueCoords[missing, 1])
+            pointIdx, treeIdx = index['tree'].query(np.asarray(points), predicate='intersects')
+            
+            # Pontos na divisa entre bairros ficam com o primeiro bairro encontrado
+            pointIdx, first = np.unique(pointIdx, return_index=True)
+            found = np.full(missing.sum(), None, dtype=object)
+            found[pointIdx] = index['names'][treeIdx[first]]
+            
+            names[missing] = found
+            with index['lock']:
+                cache.update(zip(map(tuple, uniqueCoords[missing]), found))
+        
+        return pd.Categorical(names[inverse.ravel()])
+
+class Esquema:
+    @staticmethod
+    def compact(df, schema):
+        """
+        Converte as colunas de um DataFrame para os tipos compactos do esquema.
+        
+        Parâmetros:
+        - df (DataFrame): DataFrame (ou GeoDataFrame) processado.
+        - schema (dict): Tipo de cada coluna (ver SCHEMA_COMPACTO). Colunas ausentes são ignoradas.
+        
+        Retorna:
+        - DataFrame: O mesmo DataFrame, com as colunas convertidas.
+        """
+        dtypes = {column: dtype for column, dtype in schema.items() if column in df.columns}
+        return df.astype(dtypes, copy=False) if dtypes else df
+
+class Censo:
+    @staticmethod
+    def tractCode(codes):
+        """
+        Converte códigos de setor censitário (CD_SETOR / Cod_setor) em chaves int64,
+        descartando caracteres não numéricos (ex.: o sufixo 'P' da malha preliminar de 2022).
+        
+        Parâmetros:
+        - codes (Series): Códigos de setor, numéricos ou texto.
+        
+        Retorna:
+        - Series: Códigos int64 (Int64, com <NA> para códigos inválidos).
+        """
+        if pd.api.types.is_integer_dtype(codes):
+            return codes.astype('Int64')
+        digits = codes.astype(str).str.replace(r'\D', '', regex=True)
+        return pd.to_numeric(digits, errors='coerce').astype('Int64')
+
+    @staticmethod
+    def load(folderPath, variables=CENSO_VARIAVEIS, municipio=MUNICIPIO_CODIGO):
+        """
+        Carrega as variáveis do CENSO de um município em uma tabela indexada pelo código do setor.
+        
+        Cada tabela de origem é lida em blocos, somente com a coluna Cod_setor e as colunas
+        solicitadas, mantendo apenas os setores do município (os 7 primeiros dígitos do código).
+        
+        Parâmetros:
+        - folderPath (str): Caminho para a pasta das tabelas do CENSO.
+        - variables (dict, opcional): Variáveis {nome: (tabela, coluna)}. Padrão (CENSO_VARIAVEIS).
+        - municipio (int, opcional): Código IBGE do município. Padrão (MUNICIPIO_CODIGO).
+        
+        Retorna:
+        - DataFrame: Uma coluna por variável, indexado por COD_SETOR (int64, ordenado).
+          Tabelas ausentes resultam em colunas vazias (NaN).
+        """
+        tableNames = sorted({tableName for tableName, _ in variables.values()})
+        identity = tuple(DataLoader.fileIdentity(folderPath, tableName, 'csv') for tableName in tableNames)
+        return Censo._read(folderPath, tuple(variables.items()), municipio, identity)
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def _read(folderPath, variables, municipio, identity):
+        tables = {}
+        for name, (tableName, column) in variables:
+            tables.setdefault(tableName, {})[column] = name
+        
+        df = pd.concat(
+            [Censo._readTable(folderPath, tableName, renames, municipio) for tableName, renames in tables.items()],
+            axis=1, join='outer').sort_index()
+        df.index.name = 'COD_SETOR'
+        return df[[name for name, _ in variables]]
+
+    @staticmethod
+    def _readTable(folderPath, tableName, renames, municipio):
+        filePath = os.path.join(folderPath, f'{tableName}.csv')
+        
+        try:
+            if not os.path.exists(filePath):
+                raise FileNotFoundError(f"Arquivo {tableName} não encontrado na pasta {folderPath}.")
+            
+            # Valores suprimidos pelo IBGE ('X') impedem a leitura numérica direta: lidos como texto
+            reader = pd.read_csv(
+                filePath,
+                sep=';',
+                usecols=['Cod_setor'] + list(renames),
+                dtype={'Cod_setor': 'int64', **{column: 'str' for column in renames}},
+                chunksize=AMV_CHUNK_SIZE)
+            chunks = [chunk[chunk['Cod_setor'] // CENSO_SUFIXO_SETOR == municipio] for chunk in reader]
+            
+            df = pd.concat(chunks).rename(columns=renames).set_index('Cod_setor')
+            df.index.name = 'COD_SETOR'
+            for name in renames.values():
+                df[name] = pd.to_numeric(df[name], errors='coerce')
+            return df
+        except Exception as e:
+            print(f"Erro ao carregar a tabela do CENSO: {e}")
+            return pd.DataFrame(
+                {name: pd.Series(dtype='float64') for name in renames.values()},
+                index=pd.Index([], dtype='int64', name='COD_SETOR'))
+
+    @staticmethod
+    def crosswalk(DF_SETORES, DF_BAIRROS_PLG, crs=CRS_METRICO):
+        """
+        Calcula a tabela de correspondência entre setores censitários e bairros: a fração
+        da área de cada setor contida em cada bairro, medida em projeção métrica.
+        
+        Parâmetros:
+        - DF_SETORES (GeoDataFrame): Setores censitários com a coluna COD_SETOR.
+        - DF_BAIRROS_PLG (GeoDataFrame): Limites de bairros, com a coluna 'nome'.
+        - crs (str, opcional): Projeção métrica usada no cálculo das áreas. Padrão (CRS_METRICO).
+        
+        Retorna:
+        - DataFrame: Colunas COD_SETOR, BAIRRO e PESO (fração da área do setor no bairro),
+          somente para os pares que se sobrepõem.
+        """
+        DF_SETORES_M = DF_SETORES[['COD_SETOR', 'geometry']].dropna(subset=['COD_SETOR']).to_crs(crs=crs)
+        DF_SETORES_M['COD_SETOR'] = DF_SETORES_M['COD_SETOR'].astype('int64')
+        DF_BAIRROS_M = DF_BAIRROS_PLG[['nome', 'geometry']].to_crs(crs=crs)
+        
+        setorArea = DF_SETORES_M.assign(AREA=DF_SETORES_M.area).groupby('COD_SETOR')['AREA'].sum()
+        
+        DF_INTERSECAO = gpd.overlay(DF_SETORES_M, DF_BAIRROS_M, how='intersection', keep_geom_type=True)
+        DF_INTERSECAO['AREA'] = DF_INTERSECAO.area
+        
+        DF_CROSSWALK = pd.DataFrame(
+            DF_INTERSECAO.groupby(['COD_SETOR', 'nome'], observed=True)['AREA'].sum().reset_index())
+        DF_CROSSWALK['PESO'] = DF_CROSSWALK['AREA'] / DF_CROSSWALK['COD_SETOR'].map(setorArea)
+        DF_CROSSWALK.rename(columns={'nome': 'BAIRRO'}, inplace=True)
+        
+        return DF_CROSSWALK.loc[DF_CROSSWALK['PESO'] > 0, ['COD_SETOR', 'BAIRRO', 'PESO']].reset_index(drop=True)
+
+    @staticmethod
+    def aggregate(DF_SETORES, DF_CROSSWALK, aggregations):
+        """
+        Agrega variáveis por bairro ponderando cada setor pela fração da sua área no bairro,
+        como o produto da matriz esparsa de pesos (bairros × setores) pela matriz de variáveis.
+        
+        Parâmetros:
+        - DF_SETORES (DataFrame): Setores censitários com a coluna COD_SETOR e as variáveis.
+        - DF_CROSSWALK (DataFrame): Tabela de correspondência retornada por Censo.crosswalk.
+        - aggregations (dict): Agregação de cada variável: 'sum' (soma ponderada, para
+          contagens) ou 'mean' (média ponderada, para médias e percentuais).
+        
+        Retorna:
+        - DataFrame: Uma linha por BAIRRO com as variáveis agregadas.
+        """
+        unsupported = {function for function in aggregations.values() if function not in ('sum', 'mean')}
+        if unsupported:
+            raise ValueError(f"Agregação não suportada na ponderação por área: {', '.join(sorted(unsupported))}")
+        
+        DF_VALORES = DF_SETORES.dropna(subset=['COD_SETOR']).drop_duplicates(subset=['COD_SETOR']).set_index('COD_SETOR')
+        DF_VALORES = DF_VALORES[list(aggregations)].apply(pd.to_numeric, errors='coerce')
+        
+        setorCodes = DF_VALORES.index.get_indexer(DF_CROSSWALK['COD_SETOR'])
+        bairroCodes, bairros = pd.factorize(DF_CROSSWALK['BAIRRO'])
+        valid = setorCodes >= 0
+        weights = sparse.csr_matrix(
+            (DF_CROSSWALK['PESO'].to_numpy(dtype='float64')[valid], (bairroCodes[valid], setorCodes[valid])),
+            shape=(len(bairros), len(DF_VALORES)))
+        
+        # Valores ausentes não contribuem para a soma nem para o peso da média; um bairro sem
+        # nenhum setor com valor fica ausente (NaN), e não com soma zero
+        values = DF_VALORES.to_numpy(dtype='float64')
+        present = ~np.isnan(values)
+        result = weights @ np.where(present, values, 0.0)
+        presentWeights = weights @ present.astype('float64')
+        
+        meanColumns = [position for position, function in enumerate(aggregations.values()) if function == 'mean']
+        if meanColumns:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result[:, meanColumns] = result[:, meanColumns] / presentWeights[:, meanColumns]
+        result[presentWeights <= 0] = np.nan
+        
+        df = pd.DataFrame(result, columns=list(aggregations))
+        df.insert(0, 'BAIRRO', np.asarray(bairros, dtype=object))
+        return df
+
+class IndiceBitmap:
+    @staticmethod
+    def build(df, columns):
+        """
+        Constrói um bitmap por valor de cada coluna categórica: os bits (compactados com
+        np.packbits) indicam as linhas do DataFrame que possuem o valor.
+        
+        Parâmetros:
+        - df (DataFrame): DataFrame indexado. As posições dos bits seguem a ordem das suas linhas.
+        - columns (list): Colunas indexadas (ver BITMAP_DIMENSOES).
+        
+        Retorna:
+        - dict: 'rows' (número de linhas) e 'columns' (coluna → (valores, bitmaps uint8 com uma linha por valor)).
+        """
+        rows = len(df)
+        index = {'rows': rows, 'columns': {}}
+        for column in columns:
+            series = df[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes, values = series.cat.codes.to_numpy(), series.cat.categories
+            else:
+                codes, values = pd.factorize(series)
+            
+            # Uma ordenação das linhas por valor; cada bitmap é montado em um vetor reaproveitado
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(len(values) + 1))
+            bits = np.zeros((len(values), (rows + 7) // 8), dtype=np.uint8)
+            mask = np.zeros(rows, dtype=bool)
+            for code in range(len(values)):
+                positions = order[bounds[code]:bounds[code + 1]]
+                mask[positions] = True
+                bits[code] = np.packbits(mask)
+                mask[positions] = False
+            index['columns'][column] = (pd.Index(values), bits)
+        return index
+
+    @staticmethod
+    def select(index, filters, first=0, last=None):
+        """
+        Combina os bitmaps de uma seleção: OU entre os valores de uma dimensão e E entre
+        as dimensões, restrito às linhas [first, last).
+        
+        Parâmetros:
+        - index (dict): Índice retornado por IndiceBitmap.build.
+        - filters (dict): Valores selecionados por coluna. Listas vazias não filtram.
+        - first (int, opcional): Primeira linha considerada. Padrão (0).
+        - last (int, opcional): Linha final (exclusive). Padrão (todas).
+        
+        Retorna:
+        - ndarray: Posições das linhas selecionadas, ou None se nenhuma dimensão for filtrada.
+        """
+        last = index['rows'] if last is None else last
+        byteFirst, byteLast = first // 8, (last + 7) // 8
+        
+        selection = None
+        for column, selected in filters.items():
+            if not selected:
+                continue
+            values, bits = index['columns'][column]
+            codes = values.get_indexer(selected)
+            codes = codes[codes >= 0]
+            if len(codes):
+                dimension = np.bitwise_or.reduce(bits[codes, byteFirst:byteLast], axis=0)
+            else:
+                dimension = np.zeros(max(0, byteLast - byteFirst), dtype=np.uint8)
+            selection = dimension if selection is None else np.bitwise_and(selection, dimension, out=selection)
+        
+        if selection is None:
+            return None
+        if first >= last:
+            return np.empty(0, dtype=np.int64)
+        
+        positions = np.flatnonzero(np.unpackbits(selection, count=last - byteFirst * 8)) + byteFirst * 8
+        return positions[np.searchsorted(positions, first):]
+
+    @staticmethod
+    def filter(df, index, filters, first=0, last=None):
+        """
+        Filtra um DataFrame pelos bitmaps da seleção, com uma única cópia das linhas selecionadas.
+        
+        Parâmetros:
+        - df (DataFrame): DataFrame indexado por IndiceBitmap.build, na mesma ordem de linhas.
+        - index (dict): Índice retornado por IndiceBitmap.build.
+        - filters (dict): Valores selecionados por coluna. Listas vazias não filtram.
+        - first (int, opcional): Primeira linha considerada (ver Utils.timeBounds). Padrão (0).
+        - last (int, opcional): Linha final (exclusive). Padrão (todas).
+        
+        Retorna:
+        - DataFrame: Linhas selecionadas, em uma cópia própria (não uma vista de df).
+        """
+        positions = IndiceBitmap.select(index, filters, first, last)
+        if positions is None:
+            # Sem filtros categóricos, a fatia também é copiada: uma vista manteria df inteiro
+            # referenciado pelo resultado (ex.: em CacheResultados, que mede só a fatia)
+            return df.iloc[first:last].copy()
+        return df.take(positions)
+
+class Cubo:
+    @staticmethod
+    def build(DF_AMV, sensors=SENSORES):
+        """
+        Materializa o cubo de monitoramento: uma célula por bairro e hora, com as medidas
+        acumuladas de cada sensor (ver CUBO_MEDIDAS) e o período e o dia da semana como atributos.
+        
+        Parâmetros:
+        - DF_AMV (DataFrame): Leituras de monitoramento por bairro, com os campos de data
+          (ver Utils.temporalFeatures).
+        - sensors (list, opcional): Sensores agregados. Padrão (SENSORES).
+        
+        Retorna:
+        - DataFrame: Colunas BAIRRO, data (hora cheia), F_PERIODO, F_DIA_SEMANA e, para cada
+          sensor, <sensor>_COUNT, _SUM, _SUMSQ, _MIN e _MAX, ordenado por data.
+        """
+        DF_BASE = pd.DataFrame({
+            'BAIRRO': DF_AMV['BAIRRO'],
+            'data': DF_AMV['data'].dt.floor('h'),
+            'F_PERIODO': DF_AMV['F_PERIODO'],
+            'F_DIA_SEMANA': DF_AMV['F_DIA_SEMANA'],
+        })
+        
+        # Período e dia da semana dependem só da hora: são constantes em cada célula
+        aggregations = {'F_PERIODO': ('F_PERIODO', 'first'), 'F_DIA_SEMANA': ('F_DIA_SEMANA', 'first')}
+        for sensor in sensors:
+            values = DF_AMV[sensor].astype('float64')
+            DF_BASE[sensor] = values
+            DF_BASE[f'{sensor}_QUADRADO'] = values * values
+            aggregations.update({
+                f'{sensor}_COUNT': (sensor, 'count'),
+                f'{sensor}_SUM': (sensor, 'sum'),
+                f'{sensor}_SUMSQ': (f'{sensor}_QUADRADO', 'sum'),
+                f'{sensor}_MIN': (sensor, 'min'),
+                f'{sensor}_MAX': (sensor, 'max'),
+            })
+        
+        DF_CUBO = DF_BASE.groupby(['BAIRRO', 'data'], observed=True).agg(**aggregations).reset_index()
+        
+        # Mantido ordenado por data, como as leituras: o filtro de período é uma busca binária
+        return Utils.sortByTime(DF_CUBO, 'data')
+
+    @staticmethod
+    def query(DF_CUBO, DF_AMV, start=None, end=None, bairros=None, periodos=None, diasSemana=None):
+        """
+        Seleciona as células do cubo que respondem a uma combinação de filtros. As horas
+        completas do intervalo vêm do cubo; as horas parciais das extremidades são agregadas
+        a partir das leituras, de modo que o resultado é exato para qualquer intervalo.
+        
+        Parâmetros:
+        - DF_CUBO (DataFrame): Cubo retornado por Cubo.build, ordenado por data.
+        - DF_AMV (DataFrame): Leituras de monitoramento que originaram o cubo, ordenadas por data.
+        - start (Timestamp, opcional): Início do intervalo (inclusive). Padrão (sem limite).
+        - end (Timestamp, opcional): Fim do intervalo (exclusive). Padrão (sem limite).
+        - bairros (list, opcional): Bairros selecionados. Padrão (todos).
+        - periodos (list, opcional): Períodos do dia selecionados. Padrão (todos).
+        - diasSemana (list, opcional): Dias da semana selecionados. Padrão (todos).
+        
+        Retorna:
+        - DataFrame: Células selecionadas, no formato de Cubo.build.
+        """
+        hourStart = None if start is None else pd.Timestamp(start).ceil('h')
+        hourEnd = None if end is None else pd.Timestamp(end).floor('h')
+        
+        if hourStart is not None and hourEnd is not None and hourStart >= hourEnd:
+            # Intervalo sem nenhuma hora completa: agregado somente a partir das leituras
+            parts = [Cubo.build(Utils.timeSlice(DF_AMV, start, end))]
+        else:
+            parts = [Utils.timeSlice(DF_CUBO, hourStart, hourEnd)]
+            if hourStart is not None and start < hourStart:
+                parts.append(Cubo.build(Utils.timeSlice(DF_AMV, start, hourStart)))
+            if hourEnd is not None and hourEnd < end:
+                parts.append(Cubo.build(Utils.timeSlice(DF_AMV, hourEnd, end)))
+        
+        cells = parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+        # Partes com categorias diferentes são concatenadas como object: restaurar o tipo categórico
+        for column in ['BAIRRO', 'F_PERIODO', 'F_DIA_SEMANA']:
+            if isinstance(DF_CUBO[column].dtype, pd.CategoricalDtype) and not isinstance(cells[column].dtype, pd.CategoricalDtype):
+                cells[column] = cells[column].astype('category')
+        
+        mask = np.ones(len(cells), dtype=bool)
+        for column, values in (('BAIRRO', bairros), ('F_PERIODO', periodos), ('F_DIA_SEMANA', diasSemana)):
+            if values:
+                mask &= cells[column].isin(values).to_numpy()
+        return cells if mask.all() else cells[mask]
+
+    @staticmethod
+    def combine(cells, by=None, sensors=SENSORES):
+        """
+        Reagrega células do cubo: somas de COUNT, SUM e SUMSQ, mínimo dos MIN e máximo dos MAX.
+        
+        Parâmetros:
+        - cells (DataFrame): Células retornadas por Cubo.build ou Cubo.query.
+        - by (list, opcional): Colunas de agrupamento. Padrão (todas as células em uma única linha).
+        - sensors (list, opcional): Sensores reagregados. Padrão (SENSORES).
+        
+        Retorna:
+        - DataFrame: Medidas reagregadas, uma linha por grupo.
+        """
+        functions = {'COUNT': 'sum', 'SUM': 'sum', 'SUMSQ': 'sum', 'MIN': 'min', 'MAX': 'max'}
+        aggregations = {
+            f'{sensor}_{measure}': functions[measure]
+            for sensor in sensors for measure in CUBO_MEDIDAS
+        }
+        if by is None:
+            return pd.DataFrame([{column: cells[column].agg(function) for column, function in aggregations.items()}])
+        return cells.groupby(by, observed=True).agg(aggregations).reset_index()
+
+    @staticmethod
+    def statistics(cells, sensors=SENSORES):
+        """
+        Calcula as estatísticas de cada sensor sobre todas as células selecionadas.
+        
+        Parâmetros:
+        - cells (DataFrame): Células retornadas por Cubo.query.
+        - sensors (list, opcional): Sensores considerados. Padrão (SENSORES).
+        
+        Retorna:
+        - DataFrame: Uma linha por sensor, com as colunas count, min, max, mean e std
+          (ver Utils.sensorStatistics).
+        """
+        totals = Cubo.combine(cells, None, sensors).iloc[0]
+        measures = {
+            measure: totals[[f'{sensor}_{measure}' for sensor in sensors]].to_numpy(dtype='float64')
+            for measure in CUBO_MEDIDAS
+        }
+        mean, std = Utils.moments(measures['COUNT'], measures['SUM'], measures['SUMSQ'])
+        
+        # Mesmo formato de Utils.sensorStatistics, calculado sobre as leituras
+        return pd.DataFrame({
+            'count': measures['COUNT'].astype('int64'),
+            'min': measures['MIN'],
+            'max': measures['MAX'],
+            'mean': mean,
+            'std': std,
+        }, index=list(sensors))
+
+    @staticmethod
+    def means(cells, by='BAIRRO', sensors=SENSORES):
+        """
+        Calcula a média de cada sensor por grupo de células.
+        
+        Parâmetros:
+        - cells (DataFrame): Células retornadas por Cubo.query.
+        - by (str, opcional): Coluna de agrupamento. Padrão ('BAIRRO').
+        - sensors (list, opcional): Sensores considerados. Padrão (SENSORES).
+        
+        Retorna:
+        - DataFrame: Uma linha por grupo, com a coluna by e a média de cada sensor.
+        """
+        totals = Cubo.combine(cells, [by], sensors)
+        df = totals[[by]].copy()
+        for sensor in sensors:
+            df[sensor], _ = Utils.moments(
+                totals[f'{sensor}_COUNT'], totals[f'{sensor}_SUM'], totals[f'{sensor}_SUMSQ'])
+        return df
+
+# ================ ETL ================
+
+class Pipeline:
+    # Fontes de cada DataFrame processado: (subpasta, arquivo, extensão).
+    # Alterar qualquer uma delas invalida somente a etapa correspondente.
+    SOURCES = {
+        'DF_BAIRROS_PLG': [
+            ('', 'RS_CAXIASDOSUL_BAIRROS', 'shp'),
+            ('', 'RS_CAXIASDOSUL_PTN_Bairros', 'shp'),
+        ],
+        'DF_AMV_BAIRRO': [
+            ('', 'RS_CAXIASDOSUL_BAIRROS', 'shp'),
+            ('', AMV_FILE_PATTERN, 'csv'),
+        ],
+        'DF_AMV_CUBO': [
+            ('', 'RS_CAXIASDOSUL_BAIRROS', 'shp'),
+            ('', AMV_FILE_PATTERN, 'csv'),
+        ],
+        'DF_SEGURANCA': [
+            ('', 'RS_CAXIASDOSUL_BAIRROS', 'shp'),
+            ('', 'RS_CAXIASDOSUL_PTN_SEG_PUB', 'shp'),
+        ],
+        'DF_SATISFACAO': [
+            ('', 'SATISFACAO', 'xlsx'),
+        ],
+        'DF_SETORES_BAIRROS': [
+            ('', 'RS_Malha_Preliminar_2022', 'shp'),
+            ('', 'AGREGADO_SETOR_RS', 'csv'),
+        ] + [
+            (CENSO_FOLDER, tableName, 'csv')
+            for tableName in sorted({tableName for tableName, _ in CENSO_VARIAVEIS.values()})
+        ],
+        'DF_SETORES_CROSSWALK': [
+            ('', 'RS_CAXIASDOSUL_BAIRROS', 'shp'),
+            ('', 'RS_Malha_Preliminar_2022', 'shp'),
+        ],
+        'DF_GEOMETRIAS_MAPA': [
+            ('', 'RS_CAXIASDOSUL_BAIRROS', 'shp'),
+            ('', 'RS_Malha_Preliminar_2022', 'shp'),
+        ],
+    }
+    
+    # Etapa responsável por cada DataFrame processado
+    STAGES = {
+        'DF_BAIRROS_PLG': 'buildBairros',
+        'DF_AMV_BAIRRO': 'buildMonitoramento',
+        'DF_AMV_CUBO': 'buildCubo',
+        'DF_SEGURANCA': 'buildSeguranca',
+        'DF_SATISFACAO': 'buildSatisfacao',
+        'DF_SETORES_BAIRROS': 'buildSetores',
+        'DF_SETORES_CROSSWALK': 'buildCrosswalk',
+        'DF_GEOMETRIAS_MAPA': 'buildPiramide',
+    }
+    
+    # Um lock por etapa, para que etapas concorrentes não recalculem a mesma dependência
+    _STAGE_LOCKS = {}
+    _STAGE_LOCKS_GUARD = threading.Lock()
+
+    @staticmethod
+    def sourcesKey(dataPath, frameName):
+        """
+        Calcula a identidade de todas as fontes das quais um DataFrame processado depende.
+        
+        Parâmetros:
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        - frameName (str): Nome do DataFrame processado (ver SNAPSHOT_FRAMES).
+        
+        Retorna:
+        - tuple: Identidades retornadas por DataLoader.fileIdentity, na ordem de Pipeline.SOURCES.
+        """
+        return tuple(
+            DataLoader.fileIdentity(os.path.join(dataPath, subFolder) if subFolder else dataPath, fileName, extension)
+            for subFolder, fileName, extension in Pipeline.SOURCES[frameName]
+        )
+
+    @staticmethod
+    def stage(dataPath, frameName):
+        """
+        Obtém um DataFrame processado, executando a sua etapa somente se alguma fonte mudou.
+        
+        Parâmetros:
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        - frameName (str): Nome do DataFrame processado (ver SNAPSHOT_FRAMES).
+        
+        Retorna:
+        - DataFrame: DataFrame processado.
+        """
+        stageFunction = getattr(Pipeline, Pipeline.STAGES[frameName])
+        sourcesKey = Pipeline.sourcesKey(dataPath, frameName)
+        
+        # Etapas executadas em paralelo podem depender da mesma etapa (ex.: DF_BAIRROS_PLG):
+        # a primeira a chegar a executa e as demais aguardam e leem o resultado do cache
+        with Pipeline._stageLock(dataPath, frameName):
+            return stageFunction(dataPath, sourcesKey)
+
+    @staticmethod
+    def _stageLock(dataPath, frameName):
+        with Pipeline._STAGE_LOCKS_GUARD:
+            return Pipeline._STAGE_LOCKS.setdefault((dataPath, frameName), threading.RLock())
+
+    @staticmethod
+    def parallel(*calls):
+        """
+        Executa funções independentes em um pool de threads.
+        
+        Parâmetros:
+        - calls (callable): Funções sem argumentos (ex.: functools.partial).
+        
+        Retorna:
+        - list: Resultados, na mesma ordem das funções.
+        """
+        # Repassa o contexto da sessão do Streamlit às threads (usado pelos caches)
+        ctx = get_script_run_ctx()
+        def attachContext():
+            if ctx is not None:
+                add_script_run_ctx(threading.current_thread(), ctx)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(LOAD_WORKERS, len(calls))), initializer=attachContext) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def run(dataPath, frameNames=SNAPSHOT_FRAMES):
+        """
+        Executa a cadeia completa de ETL (carga, reprojeção, junções espaciais,
+        padronização de textos e derivação de campos de data).
+        
+        Parâmetros:
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        - frameNames (list, opcional): DataFrames processados. Padrão (SNAPSHOT_FRAMES).
+        
+        Retorna:
+        - dict: DataFrames processados, indexados pelo nome (ver SNAPSHOT_FRAMES).
+        """
+        frames = Pipeline.parallel(*[partial(Pipeline.stage, dataPath, frameName) for frameName in frameNames])
+        return dict(zip(frameNames, frames))
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def buildBairros(dataPath, sourcesKey):
+        """
+        Carrega e reprojeta os limites de bairros.
+        
+        Parâmetros:
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        - sourcesKey (tuple): Identidade das fontes da etapa (ver Pipeline.sourcesKey), usada como chave do cache.
+        
+        Retorna:
+        - GeoDataFrame: Limites de bairros (EPSG:4326).
+        """
+        # Carregar dados de Bairros (limites e pontos, em paralelo)
+        DF_BAIRROS_PLG, DF_BAIRROS_PTN = Pipeline.parallel(
+            partial(DataLoader.loadSHP, dataPath, 'RS_CAXIASDOSUL_BAIRROS', crs="EPSG:4326", coordinates='centroid'),
+            partial(DataLoader.loadSHP, dataPath, 'RS_CAXIASDOSUL_PTN_Bairros', crs="EPSG:4326"))
+        DF_BAIRROS_PLG.drop(
+            columns=['numerolei', 'link_doc_b', 'observacoe',
+                     'OBJECTID', 'bairro', 'FREQUENCY', 
+                     'MIN_temper', 'MAX_temper', 'MEAN_tempe', 
+                     'MIN_umidad', 'MAX_umidad', 'MEAN_umida', 
+                     'MIN_lumino', 'MAX_lumino', 'MEAN_lumin',
+                     'MIN_ruido', 'MAX_ruido', 'MEAN_ruido', 
+                     'MIN_eco2', 'MAX_eco2', 'MEAN_eco2', 
+                     'MIN_etvoc', 'MAX_etvoc', 'MEAN_etvoc', 
+                     'Shape_Leng', 'Shape_Area'], 
+            axis='columns', 
+            inplace=True
+        )
+        # DF_BAIRROS_PLG.rename(columns={'nome': 'BAIRRO'}, inplace=True)
+
+        # DF_BAIRROS_PTN.rename(columns={'nome': 'BAIRRO'}, inplace=True)
+
+        # Padronizando os nomes de bairros: chave canônica de todas as junções por BAIRRO
+        DF_BAIRROS_PLG['nome'] = Utils.normalizeNames(DF_BAIRROS_PLG['nome'])
+
+        return DF_BAIRROS_PLG
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def buildMonitoramento(dataPath, sourcesKey):
+        """
+        Carrega os dados de monitoramento e atribui o bairro e os campos de data de cada leitura.
+        
+        Parâmetros:
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        - sourcesKey (tuple): Identidade das fontes da etapa (ver Pipeline.sourcesKey), usada como chave do cache.
+        
+        Retorna:
+        - GeoDataFrame: Leituras de monitoramento por bairro.
+        """
+        # Carregar dados de Monitoramento (todos os AMV_*.csv, já filtrados e tipados)
+        DF_AMV = DataLoader.loadMonitoramento(dataPath)
+
+        # Aguarda a etapa de bairros, executada em paralelo
+        DF_BAIRROS_PLG = Pipeline.stage(dataPath, 'DF_BAIRROS_PLG')
+
+        return Pipeline.transformMonitoramento(DF_AMV, DF_BAIRROS_PLG)
+
+    @staticmethod
+    def transformMonitoramento(DF_AMV, DF_BAIRROS_PLG):
+        """
+        Atribui o bairro e deriva os campos de data de leituras de monitoramento. Usada tanto
+        na carga completa quanto na ingestão incremental (Snapshot.append), que processa só o delta.
+        
+        Parâmetros:
+        - DF_AMV (DataFrame): Leituras retornadas por DataLoader.loadMonitoramento.
+        - DF_BAIRROS_PLG (GeoDataFrame): Limites de bairros (EPSG:4326).
+        
+        Retorna:
+        - GeoDataFrame: Leituras de monitoramento por bairro.
+        """
+        # Geoespacializando pontos de monitoramento
+        DF_AMV = MapUtils.createPoints(DF_AMV, 'longitude', 'latitude')
+
+        # MONITORAMENTO AMBIENTAL ← BAIRROS (uma consulta ao índice por localização distinta)
+        DF_AMV['bairro'] = IndiceBairros.lookup(DF_BAIRROS_PLG, DF_AMV['longitude'], DF_AMV['latitude'])
+        DF_AMV_BAIRRO = DF_AMV.reset_index(drop=True)
+
+        # Padronizando valores da coluna de Bairro
+        DF_AMV_BAIRRO['bairro'] = Utils.normalizeNames(DF_AMV_BAIRRO['bairro'])
+
+        # Removendo registros de bairro nulos
+        DF_AMV_BAIRRO = DF_AMV_BAIRRO.dropna(subset=['bairro'])
+
+        # Renomeando coluna de BAIRRO utilizada para busca
+        DF_AMV_BAIRRO.rename(columns={'bairro': 'BAIRRO'}, inplace=True)
+
+        # Eliinnado valores inválidos
+        DF_AMV_BAIRRO = DF_AMV_BAIRRO[DF_AMV_BAIRRO['BAIRRO'] != 'NAN']
+
+        # Determinar formato do campo data
+        DF_AMV_BAIRRO['data'] = pd.to_datetime(DF_AMV_BAIRRO['data'])
+
+        # Criar campos de período, data, hora e dia da semana
+        DF_AMV_BAIRRO = Utils.temporalFeatures(DF_AMV_BAIRRO, 'data')
+
+        # Manter ordenado por data: o filtro de período é uma busca binária (ver Utils.timeSlice)
+        DF_AMV_BAIRRO = Utils.sortByTime(DF_AMV_BAIRRO, 'data')
+
+        return Esquema.compact(DF_AMV_BAIRRO, SCHEMA_COMPACTO['DF_AMV_BAIRRO'])
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def buildCubo(dataPath, sourcesKey):
+        """
+        Materializa o cubo de monitoramento (bairro × hora), do qual os indicadores e o radar
+        são reagregados para qualquer combinação de filtros (ver Cubo).
+        
+        Parâmetros:
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        - sourcesKey (tuple): Identidade das fontes da etapa (ver Pipeline.sourcesKey), usada como chave do cache.
+        
+        Retorna:
+        - DataFrame: Células do cubo (ver Cubo.build).
+        """
+        # Aguarda a etapa de monitoramento, executada em paralelo
+        DF_AMV_BAIRRO = Pipeline.stage(dataPath, 'DF_AMV_BAIRRO')
+
+        return Cubo.build(DF_AMV_BAIRRO)
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def buildSeguranca(dataPath, sourcesKey):
+        """
+        Carrega as ocorrências de segurança pública e deriva os campos de data e classificação.
+        
+        Parâmetros:
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        - sourcesKey (tuple): Identidade das fontes da etapa (ver Pipeline.sourcesKey), usada como chave do cache.
+        
+        Retorna:
+        - GeoDataFrame: Ocorrências de segurança pública.
+        """
+        # Carregar dados de Segurança Pública
+        # DF_SEGURANCA = DataLoader.loadXLSX(dataPath, 'SEGURANCA_PUBLICA')
+
+        # Reprojetada para EPSG:4326, com as coordenadas LON/LAT, uma única vez por versão do shapefile
+        DF_SEGURANCA = DataLoader.loadSHP(dataPath, 'RS_CAXIASDOSUL_PTN_SEG_PUB', crs="EPSG:4326", coordinates='point')
+        DF_SEGURANCA.rename(
+            columns={
+                'SP_Data_Fa': 'Data Fato',
+                'SP_Dia_Sem': 'Data Fato',
+                'SP_Dia_Sem': 'Dia Semana Fato', 
+                'SP_Hora_Fa': 'Hora Fato', 
+                'SP_Desc_Fa': 'Desc Fato', 
+                'SP_Tipo_Fa': 'Tipo Fato',
+                'SP_Flagran': 'Flagrante',
+                'SP_Enderec': 'Endereco', 
+                'SP_Nro_End': 'Nro Endereco', 
+                'SP_Tipo_Lo': 'Tipo Local', 
+                'SP_Bairro': 'Bairro',
+                'SP_Municip': 'Municipio'
+            },
+            inplace=True
+        )
+        DF_SEGURANCA.drop(
+            columns=['Status', 'Score', 'SP_DAY', 'SP_MONTH', 'SP_YEAR', 'SP_HOUR', 'SP_MIN', 
+                     'SP_PERIOD', 'SP_WEEKDAY', 'SP_CLASS'], inplace=True)
+
+        DF_SEGURANCA['Data Fato'] = pd.to_numeric(DF_SEGURANCA['Data Fato'], errors='coerce')
+        DF_SEGURANCA = DF_SEGURANCA.dropna(subset=['Data Fato'])
+        DF_SEGURANCA['Data Fato'] = pd.to_datetime(DF_SEGURANCA['Data Fato'], origin='1899-12-30', unit='D')
+
+        DF_SEGURANCA = gpd.GeoDataFrame(DF_SEGURANCA, geometry='geometry')
+
+        # Ocorrências sem bairro informado recebem o bairro da sua localização (aguarda a etapa de bairros)
+        semBairro = DF_SEGURANCA['Bairro'].isna() | (DF_SEGURANCA['Bairro'].astype(str).str.strip() == '')
+        if semBairro.any():
+            DF_BAIRROS_PLG = Pipeline.stage(dataPath, 'DF_BAIRROS_PLG')
+            DF_SEGURANCA['Bairro'] = DF_SEGURANCA['Bairro'].astype(object)
+            DF_SEGURANCA.loc[semBairro, 'Bairro'] = np.asarray(IndiceBairros.lookup(
+                DF_BAIRROS_PLG, DF_SEGURANCA.loc[semBairro, 'LON'], DF_SEGURANCA.loc[semBairro, 'LAT']), dtype=object)
+
+        # Padronizando valores das colunas Bairro e Município
+        DF_SEGURANCA['Bairro'] = Utils.normalizeNames(DF_SEGURANCA['Bairro'])
+        DF_SEGURANCA['Municipio'] = Utils.normalizeNames(DF_SEGURANCA['Municipio'])
+
+        # Determinar o campo data como dia do fato + hora do fato (texto 'HH:MM[:SS]'), sem reconverter datas em texto;
+        # horas inválidas resultam em NaT e o registro é descartado por Utils.temporalFeatures
+        horaFato = DF_SEGURANCA['Hora Fato'].astype('string').str.strip()
+        horaFato = horaFato.mask((horaFato.str.count(':') == 1).fillna(False), horaFato + ':00')
+        DF_SEGURANCA['data'] = DF_SEGURANCA['Data Fato'].dt.normalize() + pd.to_timedelta(horaFato, errors='coerce')
+
+        # Criar campos de período, data, hora e dia da semana
+        DF_SEGURANCA = Utils.temporalFeatures(DF_SEGURANCA, 'data')
+
+        # Criar campo de classificação do crime
+        DF_SEGURANCA['F_CLASSIFICACAO'] = Utils.classifyCrimes(DF_SEGURANCA['Tipo Fato'], DF_SEGURANCA['Desc Fato'])
+
+        # Renomeando colunas de ligação
+        DF_SEGURANCA.rename(
+          columns={
+            "Municipio": "MUNICIPIO",
+            "Bairro": "BAIRRO",
+          }, 
+          inplace=True
+        )
+
+        # Manter ordenado por data: o filtro de período é uma busca binária (ver Utils.timeSlice)
+        DF_SEGURANCA = Utils.sortByTime(DF_SEGURANCA.reset_index(drop=True), 'data')
+
+        return Esquema.compact(DF_SEGURANCA, SCHEMA_COMPACTO['DF_SEGURANCA'])
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def buildSatisfacao(dataPath, sourcesKey):
+        """
+        Carrega a pesquisa de satisfação da população.
+        
+        Parâmetros:
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        - sourcesKey (tuple): Identidade das fontes da etapa (ver Pipeline.sourcesKey), usada como chave do cache.
+        
+        Retorna:
+        - DataFrame: Respostas da pesquisa de satisfação.
+        """
+        # Carregar dados de Satisfação da População
+        DF_SATISFACAO = DataLoader.loadXLSX(dataPath, 'SATISFACAO')
+
+        # Padronizando valores das colunas Bairro
+        DF_SATISFACAO['BAIRRO'] = Utils.normalizeNames(DF_SATISFACAO['BAIRRO'])
+
+        # Renomeando colunas de análise
+        DF_SATISFACAO.rename(
+          columns={
+            'Qtd respostas': 'QTD_RESP',
+            'Satisfação com o bairro': 'Sat_Bairro',
+            'Satisfação com a Saúde': 'Sat_Saúde',
+            'Prática de atividade física': 'Pratica_Atividade',
+            'Satisfação financeira': 'Sat_Financeira',
+            'Satisfação com atividade comercial': 'Sat_atv_comercial',
+            'Satisfação com qualidade do ar': 'Sat_Qual_Ar',
+            'Satisfação com ruído': 'Sat_Ruído',
+            'Satisfação com espaços de lazer': 'Sat_Lazer',
+            'Satistação com coleta de lixo': 'Sat_col_Lixo',
+            'Satisfação com distância da parada de ônibus': 'Sat_dist_bus_stop',
+            'Satisfação com qualidade das paradas de ônibus': 'Sat_qual_bus_stop',
+            'Satisfação com acesso aos locais importantes da cidade': 'Sat_Acesso',
+            'Sentimento de segurança': 'Sent_Segurança',
+            'Sentimento de confiança nas pessoas': 'Sent_Conf_Pessoas',
+            'Satisfação com tratamento de esgoto': 'Sat_Trat_Esgoto'
+          },
+          inplace=True
+        )
+
+        return DF_SATISFACAO
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def buildSetores(dataPath, sourcesKey):
+        """
+        Carrega os setores censitários e junta as tabelas do CENSO. A atribuição aos bairros é
+        feita na agregação, pela tabela de correspondência (ver Pipeline.buildCrosswalk).
+        
+        Parâmetros:
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        - sourcesKey (tuple): Identidade das fontes da etapa (ver Pipeline.sourcesKey), usada como chave do cache.
+        
+        Retorna:
+        - GeoDataFrame: Setores censitários com as variáveis do CENSO.
+        """
+        # Carregar dados de Setores Censitários, variáveis do CENSO e Agregado Setor 2022 (em paralelo)
+        DF_SETORES_GEO, DF_CENSO, DF_CENSO_2022 = Pipeline.parallel(
+            partial(DataLoader.loadSHP, dataPath, 'RS_Malha_Preliminar_2022',
+                    columns=SETORES_COLUMNS, filters={'NM_MUN': MUNICIPIO}, crs="EPSG:4326"),
+            partial(Censo.load, os.path.join(dataPath, CENSO_FOLDER)),
+            partial(DataLoader.loadCSV, dataPath, 'AGREGADO_SETOR_RS', ';', filters={'NM_MUN': MUNICIPIO}))
+
+        # Juntando as variáveis do CENSO pelo código do setor (busca no índice ordenado)
+        DF_SETORES_GEO['COD_SETOR'] = Censo.tractCode(DF_SETORES_GEO['CD_SETOR'])
+        DF_SETORES_BAIRROS = DF_SETORES_GEO.join(DF_CENSO, on='COD_SETOR', how='left')
+
+        # Setores Censitários
+        DF_SETORES_BAIRROS.rename(
+            columns={
+                'v0001': 'Tot_Pessoas',
+                'v0002': 'Tot_Domicílios',
+                'v0003': 'Tot_Domicílios_pvt',
+                'v0004': 'Tot_Domicílios_col',
+                'v0005': 'Med_pess_dom_pvt_ocup',
+                'v0006': 'Perc_Dom_pvt_ocup',
+                'v0007': 'Tot_Dom_pvt_ocup',
+                'v0008': 'Renda',
+                'v0009': 'Alfabetizados',
+            }, 
+            inplace=True
+        )
+
+        return DF_SETORES_BAIRROS
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def buildCrosswalk(dataPath, sourcesKey):
+        """
+        Calcula a tabela de correspondência entre setores censitários e bairros (fração da área
+        de cada setor em cada bairro), usada na agregação ponderada das variáveis do CENSO.
+        
+        Parâmetros:
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        - sourcesKey (tuple): Identidade das fontes da etapa (ver Pipeline.sourcesKey), usada como chave do cache.
+        
+        Retorna:
+        - DataFrame: Colunas COD_SETOR, BAIRRO e PESO (ver Censo.crosswalk).
+        """
+        # Aguarda as etapas de setores e de bairros, executadas em paralelo
+        DF_SETORES = Pipeline.stage(dataPath, 'DF_SETORES_BAIRROS')
+        DF_BAIRROS_PLG = Pipeline.stage(dataPath, 'DF_BAIRROS_PLG')
+
+        return Censo.crosswalk(DF_SETORES, DF_BAIRROS_PLG)
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def buildPiramide(dataPath, sourcesKey):
+        """
+        Gera a pirâmide de geometrias simplificadas dos bairros e dos setores censitários,
+        da qual o mapa usa o nível adequado ao seu zoom (ver MapUtils.simplifiedGeometry).
+        
+        Parâmetros:
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        - sourcesKey (tuple): Identidade das fontes da etapa (ver Pipeline.sourcesKey), usada como chave do cache.
+        
+        Retorna:
+        - GeoDataFrame: Colunas CAMADA ('BAIRROS' ou 'SETORES'), NIVEL, CHAVE e geometry (EPSG:4326).
+        """
+        # Aguarda as etapas de bairros e de setores, executadas em paralelo
+        DF_BAIRROS_PLG = Pipeline.stage(dataPath, 'DF_BAIRROS_PLG')
+        DF_SETORES = Pipeline.stage(dataPath, 'DF_SETORES_BAIRROS')
+
+        DF_PIRAMIDE = pd.concat([
+            MapUtils.simplifyLevels(DF_BAIRROS_PLG, 'nome').assign(CAMADA='BAIRROS'),
+            MapUtils.simplifyLevels(DF_SETORES, 'COD_SETOR').assign(CAMADA='SETORES'),
+        ], ignore_index=True)
+        DF_PIRAMIDE['CAMADA'] = DF_PIRAMIDE['CAMADA'].astype('category')
+
+        return DF_PIRAMIDE[['CAMADA', 'NIVEL', 'CHAVE', 'geometry']]
+
+class Snapshot:
+    @staticmethod
+    def watermarks(DF_AMV, previous=None):
+        """
+        Calcula a marca d'água (último instante de 'data' ingerido) de cada dispositivo.
+        
+        Parâmetros:
+        - DF_AMV (DataFrame): Leituras de monitoramento com as colunas 'device' e 'data'.
+        - previous (dict, opcional): Marcas d'água anteriores {dispositivo: ISO 8601}.
+        
+        Retorna:
+        - dict: Marcas d'água atualizadas {dispositivo: ISO 8601}.
+        """
+        watermarks = dict(previous or {})
+        if DF_AMV.empty:
+            return watermarks
+        
+        lastReadings = DF_AMV.groupby('device', observed=True)['data'].max()
+        for device, lastReading in lastReadings.items():
+            device = str(device)
+            if device not in watermarks or pd.Timestamp(watermarks[device]) < lastReading:
+                watermarks[device] = lastReading.isoformat()
+        return watermarks
+
+    @staticmethod
+    def writeManifest(snapshotPath, manifest):
+        """
+        Grava o manifesto do snapshot. Deve ser sempre o último arquivo gravado:
+        um snapshot sem manifesto é considerado incompleto.
+        """
+        manifestPath = os.path.join(snapshotPath, SNAPSHOT_MANIFEST)
+        
+        # Gravação atômica: uma sessão que lê o manifesto durante uma ingestão nunca o vê incompleto
+        tmpPath = f'{manifestPath}.{os.getpid()}.tmp'
+        with open(tmpPath, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmpPath, manifestPath)
+
+    @staticmethod
+    def readManifest(snapshotPath):
+        """
+        Lê o manifesto do snapshot.
+        
+        Parâmetros:
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        
+        Retorna:
+        - dict: Manifesto, ou None se estiver ausente ou com versão de esquema
+          diferente de SNAPSHOT_SCHEMA_VERSION.
+        """
+        manifestPath = os.path.join(snapshotPath, SNAPSHOT_MANIFEST)
+        if not os.path.exists(manifestPath):
+            return None
+        
+        with open(manifestPath, encoding='utf-8') as f:
+            manifest = json.load(f)
+        
+        if manifest.get('schemaVersion') != SNAPSHOT_SCHEMA_VERSION:
+            print(f"Snapshot em {snapshotPath} possui esquema {manifest.get('schemaVersion')}, esperado {SNAPSHOT_SCHEMA_VERSION}.")
+            return None
+        
+        return manifest
+
+    @staticmethod
+    def build(dataPath, snapshotPath):
+        """
+        Executa o ETL uma única vez e grava os DataFrames resultantes como
+        artefatos GeoParquet/Parquet, acompanhados de um manifesto versionado.
+        
+        Parâmetros:
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        - snapshotPath (str): Caminho para a pasta onde os artefatos serão gravados.
+        
+        Retorna:
+        - dict: Manifesto gravado.
+        """
+        # Monitoramento: processado a partir de uma única leitura, da qual também saem as marcas d'água
+        # (inclusive das leituras descartadas por não pertencerem a um bairro), como em Snapshot.append
+        # A posição de cada arquivo é medida antes da leitura: linhas gravadas durante a leitura são
+        # relidas pela próxima ingestão e descartadas pela marca d'água
+        offsets = DataLoader.monitoramentoOffsets(dataPath)
+        failed = []
+        DF_AMV = DataLoader.loadMonitoramento(dataPath, list(offsets), failed=failed)
+        watermarks = Snapshot.watermarks(DF_AMV)
+        # Arquivos com erro de leitura ficam sem posição registrada: a próxima ingestão os lê por inteiro
+        for fileName in failed:
+            del offsets[fileName]
+        
+        frames = Pipeline.run(dataPath, [
+            frameName for frameName in SNAPSHOT_FRAMES if frameName not in ('DF_AMV_BAIRRO', 'DF_AMV_CUBO')])
+        frames['DF_AMV_BAIRRO'] = Pipeline.transformMonitoramento(DF_AMV, frames['DF_BAIRROS_PLG'])
+        frames['DF_AMV_CUBO'] = Cubo.build(frames['DF_AMV_BAIRRO'])
+        os.makedirs(snapshotPath, exist_ok=True)
+        
+        manifest = {
+            'schemaVersion': SNAPSHOT_SCHEMA_VERSION,
+            'createdAt': datetime.now().isoformat(timespec='seconds'),
+            'frames': {},
+            'watermarks': watermarks,
+            'offsets': offsets,
+        }
+        for frameName in SNAPSHOT_FRAMES:
+            df = frames[frameName]
+            isGeo = isinstance(df, gpd.GeoDataFrame)
+            fileName = f'{frameName}.parquet'
+            df.to_parquet(os.path.join(snapshotPath, fileName), index=False)
+            manifest['frames'][frameName] = {'files': [fileName], 'geo': isGeo, 'rows': len(df)}
+        
+        Snapshot.writeManifest(snapshotPath, manifest)
+        return manifest
+
+    @staticmethod
+    def append(dataPath, snapshotPath):
+        """
+        Ingere somente as leituras de monitoramento gravadas após a última ingestão: lê apenas
+        o final de cada arquivo (ver DataLoader.monitoramentoOffsets), mantém as leituras posteriores
+        à marca d'água de cada dispositivo, processa apenas esse delta (bairro e campos de data) e o grava como
+        uma nova parte de DF_AMV_BAIRRO, com as células correspondentes como nova parte de
+        DF_AMV_CUBO. Sem snapshot válido, executa Snapshot.build.
+        
+        Parâmetros:
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        
+        Retorna:
+        - dict: Manifesto gravado.
+        """
+        manifest = Snapshot.readManifest(snapshotPath)
+        if manifest is None:
+            return Snapshot.build(dataPath, snapshotPath)
+        
+        # Somente o final de cada arquivo, a partir da posição já ingerida. Arquivos menores que a
+        # posição registrada (substituídos) são relidos por inteiro; a marca d'água descarta o que já foi ingerido
+        offsets = DataLoader.monitoramentoOffsets(dataPath)
+        previous = manifest.get('offsets', {})
+        ranges = {
+            fileName: (previous.get(fileName, 0) if previous.get(fileName, 0) <= end else 0, end)
+            for fileName, end in offsets.items()
+        }
+        
+        since = {device: pd.Timestamp(lastReading) for device, lastReading in manifest['watermarks'].items()}
+        failed = []
+        DF_AMV = DataLoader.loadMonitoramento(dataPath, list(offsets), since=since, ranges=ranges, failed=failed)
+        
+        # Arquivos com erro de leitura mantêm a posição anterior: o trecho é relido na próxima ingestão.
+        # Como nenhuma leitura deles é mantida, também não avançam as marcas d'água
+        for fileName in failed:
+            if fileName in previous:
+                offsets[fileName] = previous[fileName]
+            else:
+                del offsets[fileName]
+        if DF_AMV.empty:
+            if offsets != previous:
+                manifest['offsets'] = offsets
+                Snapshot.writeManifest(snapshotPath, manifest)
+            manifest['appended'] = 0
+            return manifest
+        
+        # Usa os bairros do próprio snapshot, para que o delta seja consistente com o histórico
+        DF_BAIRROS_PLG = Snapshot.readFrame(snapshotPath, manifest['frames']['DF_BAIRROS_PLG'])
+        DF_DELTA = Pipeline.transformMonitoramento(DF_AMV, DF_BAIRROS_PLG)
+        
+        # Células do delta: uma hora dividida entre duas ingestões gera duas células, que as consultas reagregam
+        DF_CUBO_DELTA = Cubo.build(DF_DELTA)
+        
+        for frameName, df in (('DF_AMV_BAIRRO', DF_DELTA), ('DF_AMV_CUBO', DF_CUBO_DELTA)):
+            entry = manifest['frames'][frameName]
+            fileName = f"{frameName}.{len(entry['files']):04d}.parquet"
+            df.to_parquet(os.path.join(snapshotPath, fileName), index=False)
+            entry['files'].append(fileName)
+            entry['rows'] += len(df)
+        
+        # A marca d'água avança pelas leituras lidas, inclusive as descartadas por não pertencerem a um bairro
+        manifest['watermarks'] = Snapshot.watermarks(DF_AMV, manifest['watermarks'])
+        manifest['offsets'] = offsets
+        manifest['updatedAt'] = datetime.now().isoformat(timespec='seconds')
+        Snapshot.writeManifest(snapshotPath, manifest)
+        
+        manifest['appended'] = len(DF_DELTA)
+        return manifest
+
+    @staticmethod
+    def readFrame(snapshotPath, entry):
+        """
+        Lê um DataFrame do snapshot, concatenando as suas partes. Cada parte é lida por uma
+        entrada própria do cache, de modo que uma ingestão incremental lê do disco apenas a parte nova.
+        
+        Parâmetros:
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        - entry (dict): Entrada do DataFrame no manifesto.
+        
+        Retorna:
+        - DataFrame: DataFrame (ou GeoDataFrame) completo.
+        """
+        parts = []
+        for fileName in entry['files']:
+            partName, partExtension = os.path.splitext(fileName)
+            identity = DataLoader.fileIdentity(snapshotPath, partName, partExtension[1:], withHash=False)
+            parts.append(Snapshot._readPart(snapshotPath, fileName, entry['geo'], identity))
+        
+        if len(parts) == 1:
+            return parts[0]
+        
+        df = pd.concat(parts, ignore_index=True)
+        # Partes com categorias diferentes são concatenadas como object: restaurar o tipo categórico
+        for column, dtype in parts[0].dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype) and not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype('category')
+        
+        # Cada parte é ordenada por data, mas uma ingestão incremental pode sobrepor a anterior
+        if 'data' in df.columns:
+            df = Utils.sortByTime(df, 'data')
+        return df
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def _readPart(snapshotPath, fileName, isGeo, identity):
+        filePath = os.path.join(snapshotPath, fileName)
+        return gpd.read_parquet(filePath) if isGeo else pd.read_parquet(filePath)
+
+    @staticmethod
+    def load(snapshotPath):
+        """
+        Carrega os artefatos gerados por Snapshot.build e Snapshot.append.
+        
+        Parâmetros:
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        
+        Retorna:
+        - dict: DataFrames indexados pelo nome, ou None se o snapshot estiver ausente,
+          incompleto ou com versão de esquema diferente de SNAPSHOT_SCHEMA_VERSION.
+        """
+        try:
+            manifest = Snapshot.readManifest(snapshotPath)
+            if manifest is None:
+                return None
+            
+            frames = Pipeline.parallel(*[
+                partial(Snapshot.readFrame, snapshotPath, manifest['frames'][frameName])
+                for frameName in SNAPSHOT_FRAMES
+            ])
+            return dict(zip(SNAPSHOT_FRAMES, frames))
+        except Exception as e:
+            print(f"Erro ao carregar o snapshot: {e}")
+            return None
+
+    @staticmethod
+    def loadFrame(snapshotPath, frameName):
+        """
+        Carrega um único DataFrame do snapshot, sem ler os demais.
+        
+        Parâmetros:
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        - frameName (str): Nome do DataFrame (ver SNAPSHOT_FRAMES).
+        
+        Retorna:
+        - DataFrame: DataFrame (ou GeoDataFrame), ou None se o snapshot estiver ausente,
+          incompleto ou com versão de esquema diferente de SNAPSHOT_SCHEMA_VERSION.
+        """
+        try:
+            manifest = Snapshot.readManifest(snapshotPath)
+            if manifest is None or frameName not in manifest['frames']:
+                return None
+            
+            return Snapshot.readFrame(snapshotPath, manifest['frames'][frameName])
+        except Exception as e:
+            print(f"Erro ao carregar {frameName} do snapshot: {e}")
+            return None
+
+    @staticmethod
+    def loadOrRun(snapshotPath, dataPath):
+        """
+        Carrega o snapshot pré-compilado; na ausência dele, executa o ETL completo.
+        
+        Parâmetros:
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        
+        Retorna:
+        - dict: DataFrames indexados pelo nome (ver SNAPSHOT_FRAMES).
+        """
+        frames = Snapshot.load(snapshotPath)
+        if frames is None:
+            print(f"Snapshot não encontrado em {snapshotPath}. Executando ETL completo.")
+            frames = Pipeline.run(dataPath)
+        return frames
+
+class Fontes:
+    """
+    Carga sob demanda das fontes do dashboard: cada DataFrame processado é lido
+    (do snapshot ou, na ausência dele, da etapa do ETL) somente quando alguma
+    variável selecionada depende dele.
+    """
+    # DataFrames e índices carregados, compartilhados (somente leitura) por todas as sessões do processo:
+    # (tipo, nome, pastas) → (versão dos dados, objeto). Uma nova versão substitui a anterior
+    _SHARED = {}
+    _SHARED_LOCKS = {}
+    _SHARED_GUARD = threading.Lock()
+
+    @staticmethod
+    def load(frameName, snapshotPath=SNAPSHOT_PATH, dataPath=DATA_PATH):
+        """
+        Carrega um DataFrame processado do snapshot; na ausência dele, executa apenas a sua etapa do ETL.
+        O DataFrame (já com todas as partes unidas) é lido uma vez por versão dos dados e compartilhado
+        entre as sessões, sem cópias: deve ser tratado como somente leitura.
+        
+        Parâmetros:
+        - frameName (str): Nome do DataFrame (ver SNAPSHOT_FRAMES).
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        
+        Retorna:
+        - DataFrame: DataFrame processado.
+        """
+        version = Fontes.version(frameName, snapshotPath, dataPath)
+        return Fontes._shared(('frame', frameName, snapshotPath, dataPath), version,
+                              partial(Fontes._load, frameName, snapshotPath, dataPath))
+
+    @staticmethod
+    def _shared(key, version, compute):
+        with Fontes._SHARED_GUARD:
+            lock = Fontes._SHARED_LOCKS.setdefault(key, threading.Lock())
+        
+        # Um lock por objeto: sessões concorrentes esperam a mesma carga em vez de repeti-la
+        with lock:
+            entry = Fontes._SHARED.get(key)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+            # A versão anterior é liberada antes da carga da nova
+            Fontes._SHARED.pop(key, None)
+            value = compute()
+            Fontes._SHARED[key] = (version, value)
+            return value
+
+    @staticmethod
+    def _load(frameName, snapshotPath, dataPath):
+        df = Snapshot.loadFrame(snapshotPath, frameName)
+        if df is None:
+            print(f"{frameName} não encontrado no snapshot em {snapshotPath}. Executando a etapa do ETL.")
+            df = Pipeline.stage(dataPath, frameName)
+        return df
+
+    @staticmethod
+    def version(frameName, snapshotPath=SNAPSHOT_PATH, dataPath=DATA_PATH):
+        """
+        Identifica a versão dos dados de um DataFrame processado, para uso em chaves de cache.
+        
+        Parâmetros:
+        - frameName (str): Nome do DataFrame (ver SNAPSHOT_FRAMES).
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        
+        Retorna:
+        - tuple: Identidade das partes no snapshot ou, na ausência dele, das fontes da etapa.
+        """
+        manifest = Snapshot.readManifest(snapshotPath)
+        if manifest is None or frameName not in manifest['frames']:
+            return Pipeline.sourcesKey(dataPath, frameName)
+        
+        identities = []
+        for fileName in manifest['frames'][frameName]['files']:
+            partName, partExtension = os.path.splitext(fileName)
+            identities.append(DataLoader.fileIdentity(snapshotPath, partName, partExtension[1:], withHash=False))
+        return tuple(identities)
+
+    @staticmethod
+    def aggregate(frameName, snapshotPath=SNAPSHOT_PATH, dataPath=DATA_PATH):
+        """
+        Agrega por bairro um DataFrame processado, conforme AGREGACOES_BAIRRO. O resultado
+        fica em cache até que os dados do DataFrame mudem.
+        
+        Parâmetros:
+        - frameName (str): Nome do DataFrame (chave de AGREGACOES_BAIRRO).
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        
+        Retorna:
+        - DataFrame: Uma linha por BAIRRO com as colunas agregadas.
+        """
+        return Fontes._aggregate(frameName, snapshotPath, dataPath, Fontes._aggregateVersion(frameName, snapshotPath, dataPath))
+
+    @staticmethod
+    def _aggregateVersion(frameName, snapshotPath, dataPath):
+        version = Fontes.version(frameName, snapshotPath, dataPath)
+        if frameName in CROSSWALKS_BAIRRO:
+            version = (version, Fontes.version(CROSSWALKS_BAIRRO[frameName], snapshotPath, dataPath))
+        return version
+
+    @staticmethod
+    def dimensaoBairros(frameNames, snapshotPath=SNAPSHOT_PATH, dataPath=DATA_PATH):
+        """
+        Monta a dimensão de bairros: uma linha por bairro da camada de bairros, com os atributos
+        fixos das fontes indicadas (ver DIMENSAO_BAIRRO), para ser unida aos agregados por bairro.
+        Somente as fontes indicadas são carregadas; a tabela fica em cache até que os seus dados mudem.
+        
+        Parâmetros:
+        - frameNames (iterable): Fontes selecionadas. As que não pertencem a DIMENSAO_BAIRRO são ignoradas.
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        
+        Retorna:
+        - DataFrame: Atributos indexados por BAIRRO.
+        """
+        frameNames = tuple(frameName for frameName in DIMENSAO_BAIRRO if frameName in frameNames)
+        versions = tuple(
+            Fontes._aggregateVersion(frameName, snapshotPath, dataPath)
+            for frameName in ['DF_BAIRROS_PLG', *frameNames])
+        return Fontes._dimensaoBairros(frameNames, snapshotPath, dataPath, versions)
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def _dimensaoBairros(frameNames, snapshotPath, dataPath, versions):
+        DF_BAIRROS_PLG = Fontes.load('DF_BAIRROS_PLG', snapshotPath, dataPath)
+        bairros = pd.Index(sorted(DF_BAIRROS_PLG['nome'].dropna().astype(str).unique()), name='BAIRRO')
+        
+        DF_DIMENSAO = pd.DataFrame(index=bairros)
+        for frameName in frameNames:
+            DF_GRP = Fontes.aggregate(frameName, snapshotPath, dataPath)
+            DF_GRP = DF_GRP.set_index(DF_GRP['BAIRRO'].astype(str)).drop(columns='BAIRRO')
+            DF_DIMENSAO = DF_DIMENSAO.join(DF_GRP, how='left')
+        return DF_DIMENSAO
+
+    @staticmethod
+    def loadIndexed(frameName, snapshotPath=SNAPSHOT_PATH, dataPath=DATA_PATH):
+        """
+        Carrega um DataFrame processado (ver Fontes.load) com os bitmaps das suas dimensões de filtro
+        (ver BITMAP_DIMENSOES). Ambos são da mesma versão dos dados, de modo que as posições dos bits
+        correspondem às linhas do DataFrame. O índice é compartilhado entre as sessões (somente leitura).
+        
+        Parâmetros:
+        - frameName (str): Nome do DataFrame (chave de BITMAP_DIMENSOES).
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        
+        Retorna:
+        - tuple: (DataFrame, índice retornado por IndiceBitmap.build).
+        """
+        version = Fontes.version(frameName, snapshotPath, dataPath)
+        df = Fontes._shared(('frame', frameName, snapshotPath, dataPath), version,
+                            partial(Fontes._load, frameName, snapshotPath, dataPath))
+        index = Fontes._shared(('bitmaps', frameName, snapshotPath, dataPath), version,
+                               partial(IndiceBitmap.build, df, BITMAP_DIMENSOES[frameName]))
+        return df, index
+
+    @staticmethod
+    @st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+    def _aggregate(frameName, snapshotPath, dataPath, version):
+        df = Fontes.load(frameName, snapshotPath, dataPath)
+        if frameName in CROSSWALKS_BAIRRO:
+            DF_CROSSWALK = Fontes.load(CROSSWALKS_BAIRRO[frameName], snapshotPath, dataPath)
+            return Censo.aggregate(df, DF_CROSSWALK, AGREGACOES_BAIRRO[frameName])
+        return df.groupby(['BAIRRO'], observed=True).agg(AGREGACOES_BAIRRO[frameName]).reset_index()
+
+class CacheResultados:
+    """
+    Cache LRU de resultados de filtros, compartilhado por todas as sessões do processo e limitado
+    por memória (CACHE_RESULTADOS_BYTES). As entradas de um espaço de nomes são descartadas quando
+    a versão dos seus dados muda. Os valores são compartilhados: devem ser tratados como somente leitura.
+    """
+    _ENTRIES = OrderedDict()
+    _VERSIONS = {}
+    _BYTES = 0
+    _LOCK = threading.Lock()
+
+    @staticmethod
+    def key(*values):
+        """
+        Normaliza os valores de uma seleção em uma chave: listas e conjuntos são ordenados, de
+        modo que a mesma seleção feita em outra ordem (ou em outra sessão) gere a mesma chave.
+        
+        Parâmetros:
+        - values: Valores da seleção (listas, conjuntos, Timestamps, números ou textos).
+        
+        Retorna:
+        - tuple: Chave do cache.
+        """
+        return tuple(
+            tuple(sorted(value, key=str)) if isinstance(value, (list, tuple, set, frozenset)) else value
+            for value in values
+        )
+
+    @staticmethod
+    def sizeOf(value):
+        """
+        Estima a memória ocupada por um resultado (DataFrames, arrays e coleções deles).
+        
+        Parâmetros:
+        - value: Resultado armazenado.
+        
+        Retorna:
+        - int: Tamanho estimado, em bytes.
+        """
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            usage = value.memory_usage(index=True, deep=True)
+            return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, dict):
+            return sum(CacheResultados.sizeOf(item) for item in value.values())
+        if isinstance(value, (list, tuple)):
+            return sum(CacheResultados.sizeOf(item) for item in value)
+        return sys.getsizeof(value)
+
+    @staticmethod
+    def get(namespace, version, key, compute, budget=CACHE_RESULTADOS_BYTES):
+        """
+        Retorna o resultado em cache para a chave ou o calcula e armazena, descartando as
+        entradas usadas há mais tempo enquanto o total exceder o limite de memória.
+        
+        Parâmetros:
+        - namespace (str): Espaço de nomes do resultado (ex.: 'monitoramento').
+        - version (tuple): Versão dos dados de que o resultado depende (ver Fontes.version).
+        - key (tuple): Chave normalizada da seleção (ver CacheResultados.key).
+        - compute (callable): Função sem parâmetros que calcula o resultado.
+        - budget (int, opcional): Limite de memória do cache, em bytes. Padrão (CACHE_RESULTADOS_BYTES).
+        
+        Retorna:
+        - object: Resultado da seleção.
+        """
+        entryKey = (namespace, key)
+        with CacheResultados._LOCK:
+            if CacheResultados._VERSIONS.get(namespace) != version:
+                CacheResultados._discard(namespace)
+                CacheResultados._VERSIONS[namespace] = version
+            entry = CacheResultados._ENTRIES.get(entryKey)
+            if entry is not None:
+                CacheResultados._ENTRIES.move_to_end(entryKey)
+                return entry[0]
+        
+        # Calculado fora do lock: sessões com seleções diferentes não esperam umas pelas outras
+        value = compute()
+        size = CacheResultados.sizeOf(value)
+        
+        with CacheResultados._LOCK:
+            # Dados atualizados durante o cálculo ou resultado maior que o limite: não armazenar
+            if CacheResultados._VERSIONS.get(namespace) != version or size > budget:
+                return value
+            
+            previous = CacheResultados._ENTRIES.pop(entryKey, None)
+            if previous is not None:
+                CacheResultados._BYTES -= previous[1]
+            CacheResultados._ENTRIES[entryKey] = (value, size)
+            CacheResultados._BYTES += size
+            
+            while CacheResultados._BYTES > budget:
+                _, (_, evictedSize) = CacheResultados._ENTRIES.popitem(last=False)
+                CacheResultados._BYTES -= evictedSize
+        return value
+
+    @staticmethod
+    def _discard(namespace):
+        for entryKey in [entryKey for entryKey in CacheResultados._ENTRIES if entryKey[0] == namespace]:
+            _, size = CacheResultados._ENTRIES.pop(entryKey)
+            CacheResultados._BYTES -= size
+
+class Painel:
+    """
+    Cadeia filtro → unificação → agregação do dashboard. Os resultados de cada seleção são
+    compartilhados entre as sessões (ver CacheResultados) até que os dados mudem.
+    """
+    # DataFrames de que dependem os resultados de cada etapa (as suas versões invalidam o cache)
+    FONTES_MONITORAMENTO = ['DF_AMV_BAIRRO', 'DF_AMV_CUBO']
+    FONTES_RADAR = FONTES_MONITORAMENTO + ['DF_SEGURANCA', 'DF_SATISFACAO', 'DF_SETORES_BAIRROS', 'DF_SETORES_CROSSWALK']
+
+    @staticmethod
+    def dominios(snapshotPath=SNAPSHOT_PATH, dataPath=DATA_PATH):
+        """
+        Levanta os valores disponíveis para os filtros do dashboard (bairros, períodos, dias da
+        semana e partes da data), calculados uma vez por versão dos dados de monitoramento.
+        
+        Parâmetros:
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        
+        Retorna:
+        - dict: Valores de cada filtro ('BAIRRO', 'PERÍODO', 'DIA DA SEMANA', 'DIA', 'MES', 'ANO', 'HORA' e 'MINUTO').
+        """
+        version = Fontes.version('DF_AMV_BAIRRO', snapshotPath, dataPath)
+        return CacheResultados.get('dominios', version, (snapshotPath, dataPath), partial(
+            Painel._dominios, snapshotPath, dataPath))
+
+    @staticmethod
+    def _dominios(snapshotPath, dataPath):
+        DF_AMV_BAIRRO = Fontes.load('DF_AMV_BAIRRO', snapshotPath, dataPath)
+        return {
+            'BAIRRO': list(sorted(DF_AMV_BAIRRO['BAIRRO'].unique())),
+            'PERÍODO': list(DF_AMV_BAIRRO['F_PERIODO'].unique()),
+            'DIA DA SEMANA': list(DF_AMV_BAIRRO['F_DIA_SEMANA'].unique()),
+            'DIA': list(DF_AMV_BAIRRO['F_DIA'].unique()),
+            'MES': list(DF_AMV_BAIRRO['F_MES'].unique()),
+            'ANO': list(DF_AMV_BAIRRO['F_ANO'].unique()),
+            'HORA': list(DF_AMV_BAIRRO['F_HORA'].unique()),
+            'MINUTO': list(DF_AMV_BAIRRO['F_MINUTO'].unique()),
+        }
+
+    @staticmethod
+    def monitoramento(bairros, periodos, diasSemana, start, end, snapshotPath=SNAPSHOT_PATH, dataPath=DATA_PATH):
+        """
+        Filtra as leituras de monitoramento e calcula os indicadores dos sensores.
+        
+        Parâmetros:
+        - bairros (list): Bairros selecionados. Lista vazia não filtra.
+        - periodos (list): Períodos do dia selecionados. Lista vazia não filtra.
+        - diasSemana (list): Dias da semana selecionados. Lista vazia não filtra.
+        - start (Timestamp): Início do intervalo (inclusive).
+        - end (Timestamp): Fim do intervalo (exclusive).
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        
+        Retorna:
+        - dict: DF_AMV_FILTERED (leituras filtradas), DF_ESTATISTICAS (ver Cubo.statistics e
+          PERCENTIS_INDICADORES) e DF_SENSORES_BAIRRO (ver Cubo.means).
+        """
+        version = tuple(Fontes.version(frameName, snapshotPath, dataPath) for frameName in Painel.FONTES_MONITORAMENTO)
+        key = CacheResultados.key(bairros, periodos, diasSemana, start, end, snapshotPath, dataPath)
+        return CacheResultados.get('monitoramento', version, key, partial(
+            Painel._monitoramento, bairros, periodos, diasSemana, start, end, snapshotPath, dataPath))
+
+    @staticmethod
+    def _monitoramento(bairros, periodos, diasSemana, start, end, snapshotPath, dataPath):
+        DF_AMV_BAIRRO, indexAMV = Fontes.loadIndexed('DF_AMV_BAIRRO', snapshotPath, dataPath)
+        DF_AMV_CUBO = Fontes.load('DF_AMV_CUBO', snapshotPath, dataPath)
+        
+        # Data e hora: fatia localizada por busca binária; demais filtros: bitmaps, com uma única cópia das linhas
+        first, last = Utils.timeBounds(DF_AMV_BAIRRO, start, end)
+        filters = {'BAIRRO': bairros, 'F_PERIODO': periodos, 'F_DIA_SEMANA': diasSemana}
+        DF_AMV_FILTERED = IndiceBitmap.filter(
+            DF_AMV_BAIRRO, indexAMV, filters, first, last)
+        
+        # Indicadores: reagregados a partir das células do cubo que atendem aos filtros
+        DF_CELULAS = Cubo.query(
+            DF_AMV_CUBO, DF_AMV_BAIRRO, start, end, bairros=bairros, periodos=periodos, diasSemana=diasSemana)
+        
+        if PERCENTIS_INDICADORES:
+            DF_ESTATISTICAS = Utils.sensorStatistics(DF_AMV_FILTERED, SENSORES, PERCENTIS_INDICADORES)
+        else:
+            DF_ESTATISTICAS = Cubo.statistics(DF_CELULAS)
+        
+        return {
+            'DF_AMV_FILTERED': DF_AMV_FILTERED,
+            'DF_ESTATISTICAS': DF_ESTATISTICAS,
+            'DF_SENSORES_BAIRRO': Cubo.means(DF_CELULAS, 'BAIRRO'),
+        }
+
+    @staticmethod
+    def radar(bairros, periodos, diasSemana, start, end, fontes, snapshotPath=SNAPSHOT_PATH, dataPath=DATA_PATH):
+        """
+        Unifica por bairro as médias dos sensores e as fontes das variáveis selecionadas no radar.
+        
+        Parâmetros:
+        - bairros (list): Bairros selecionados. Lista vazia não filtra.
+        - periodos (list): Períodos do dia selecionados. Lista vazia não filtra.
+        - diasSemana (list): Dias da semana selecionados. Lista vazia não filtra.
+        - start (Timestamp): Início do intervalo (inclusive).
+        - end (Timestamp): Fim do intervalo (exclusive).
+        - fontes (set): DataFrames de que dependem as variáveis selecionadas (ver COLS_VALUE_RADAR em app.py).
+        - snapshotPath (str): Caminho para a pasta do snapshot.
+        - dataPath (str): Caminho para a pasta com os arquivos de origem.
+        
+        Retorna:
+        - dict: DF_RADAR (uma linha por bairro) e, se Segurança Pública for selecionada,
+          DF_SEG_FILTERED (ocorrências filtradas).
+        """
+        version = tuple(Fontes.version(frameName, snapshotPath, dataPath) for frameName in Painel.FONTES_RADAR)
+        key = CacheResultados.key(bairros, periodos, diasSemana, start, end, fontes, snapshotPath, dataPath)
+        return CacheResultados.get('radar', version, key, partial(
+            Painel._radar, bairros, periodos, diasSemana, start, end, fontes, snapshotPath, dataPath))
+
+    @staticmethod
+    def _radar(bairros, periodos, diasSemana, start, end, fontes, snapshotPath, dataPath):
+        DF_RADAR = Painel.monitoramento(bairros, periodos, diasSemana, start, end, snapshotPath, dataPath)['DF_SENSORES_BAIRRO']
+        results = {}
+        
+        # Atributos por bairro, unidos aos agregados dos sensores (uma linha por bairro) e não às leituras
+        DF_ATRIBUTOS = Fontes.dimensaoBairros(fontes, snapshotPath, dataPath)
+        
+        if 'DF_SEGURANCA' in fontes:
+            # Ocorrências de 2019: filtradas por bairro, período e dia da semana, sem o intervalo de datas
+            filters = {'BAIRRO': bairros, 'F_PERIODO': periodos, 'F_DIA_SEMANA': diasSemana}
+            DF_SEGURANCA, indexSeguranca = Fontes.loadIndexed('DF_SEGURANCA', snapshotPath, dataPath)
+            DF_SEG_FILTERED = IndiceBitmap.filter(DF_SEGURANCA, indexSeguranca, filters)
+            
+            crimes = DF_SEG_FILTERED.groupby('BAIRRO', observed=True).size()
+            crimes.index = crimes.index.astype(str)
+            DF_ATRIBUTOS = DF_ATRIBUTOS.join(crimes.rename('NRO_CRIMES'), how='left')
+            results['DF_SEG_FILTERED'] = DF_SEG_FILTERED
+        
+        if len(DF_ATRIBUTOS.columns):
+            DF_RADAR = DF_RADAR.join(DF_ATRIBUTOS, on='BAIRRO')
+        
+        results['DF_RADAR'] = DF_RADAR
+        return results
+
+# ================ BUILD ================
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='MATR - geração do snapshot pré-compilado do ETL.')
+    parser.add_argument('command', choices=['build', 'append'], help='Comando a executar (append: ingestão incremental do monitoramento).')
+    parser.add_argument('--data', default=DATA_PATH, help='Pasta com os arquivos de origem.')
+    parser.add_argument('--out', default=SNAPSHOT_PATH, help='Pasta de destino do snapshot.')
+    args = parser.parse_args()
+    
+    if args.command == 'build':
+        manifest = Snapshot.build(args.data, args.out)
+        for frameName, entry in manifest['frames'].items():
+            print(f"{frameName}: {entry['rows']} registros → {', '.join(entry['files'])}")
+        print(f"Snapshot (esquema {manifest['schemaVersion']}) gravado em {args.out}")
+    elif args.command == 'append':
+        manifest = Snapshot.append(args.data, args.out)
+        print(f"DF_AMV_BAIRRO: {manifest.get('appended', 0)} novos registros ({manifest['frames']['DF_AMV_BAIRRO']['rows']} no total)")